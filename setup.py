@@ -51,6 +51,9 @@ setup(
             "plotly>=5.0",
             "graphviz>=0.20",
         ],
+        "fast": [
+            "orjson>=3.6",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -14,6 +14,7 @@ __author__ = "Claude Code Assistant"
 from .core.dependency_graph import DependencyGraph, SoftwareComponent, SoftwareType, Vulnerability, VulnerabilityLevel
 from .analyzers.risk_analyzer import RiskAnalyzer
 from .analyzers.github_analyzer import GitHubDependencyAnalyzer
+from .analyzers.local_analyzer import LocalRepositoryAnalyzer
 
 __all__ = [
     'DependencyGraph',
@@ -22,5 +23,6 @@ __all__ = [
     'Vulnerability',
     'VulnerabilityLevel',
     'RiskAnalyzer',
-    'GitHubDependencyAnalyzer'
+    'GitHubDependencyAnalyzer',
+    'LocalRepositoryAnalyzer'
 ]
\ No newline at end of file
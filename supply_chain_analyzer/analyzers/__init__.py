@@ -3,9 +3,15 @@ Analysis modules for risk assessment and repository analysis.
 """
 
 from .risk_analyzer import RiskAnalyzer
+from .manifest_analyzer import ManifestDependencyAnalyzer
 from .github_analyzer import GitHubDependencyAnalyzer
+from .local_analyzer import LocalRepositoryAnalyzer
+from .batch_pipeline import BatchPipeline
 
 __all__ = [
     'RiskAnalyzer',
-    'GitHubDependencyAnalyzer'
+    'ManifestDependencyAnalyzer',
+    'GitHubDependencyAnalyzer',
+    'LocalRepositoryAnalyzer',
+    'BatchPipeline'
 ]
\ No newline at end of file
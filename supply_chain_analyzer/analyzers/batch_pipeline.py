@@ -0,0 +1,319 @@
+"""
+Staged concurrent pipeline for multi-repository scans.
+
+Repositories flow through three stages connected by bounded queues:
+
+    fetch (I/O threads)  ->  score (CPU pool)  ->  write (single writer)
+
+The fetch stage downloads and parses manifests and builds each dependency
+graph; the score stage runs the risk analysis (and optionally an attack
+simulation) in a thread or a process pool; the writer saves the outputs
+through one OutputManager.  A full queue blocks the stage feeding it, so at
+most a bounded number of graphs are in memory whatever the number of
+repositories.  A failure only fails its own repository, which is reported
+with the stage it failed in.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..core.dependency_graph import DependencyGraph
+from ..core.org_graph import OrgGraph
+from ..core.output_manager import OutputManager
+from .github_analyzer import GitHubDependencyAnalyzer
+from .risk_analyzer import RiskAnalyzer
+
+# Marks the end of a stage's input
+_DONE = object()
+
+
+def read_url_list(path: str) -> List[str]:
+    """Repository URLs of a list file, one per line; blank lines and # comments are skipped"""
+    with open(path) as f:
+        urls = [line.split('#', 1)[0].strip() for line in f]
+    return list(dict.fromkeys(url for url in urls if url))
+
+
+@dataclass
+class RepositoryResult:
+    """Outcome of one repository in a batch"""
+    url: str
+    project_name: str
+    status: str = "ok"  # "ok", "skipped" (no dependencies found) or "failed"
+    stage: Optional[str] = None  # Stage a failed repository failed in
+    error: Optional[str] = None
+    summary: Dict[str, Any] = field(default_factory=dict)
+    outputs: Dict[str, str] = field(default_factory=dict)
+    durations: Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class BatchStats:
+    """Progress and throughput of a batch run"""
+    total: int = 0
+    succeeded: int = 0
+    skipped: int = 0
+    failed: int = 0
+    elapsed_seconds: float = 0.0
+    # Stage -> busy seconds summed over repositories
+    stage_seconds: Dict[str, float] = field(default_factory=lambda: {"fetch": 0.0, "score": 0.0, "write": 0.0})
+
+    @property
+    def completed(self) -> int:
+        return self.succeeded + self.skipped + self.failed
+
+    @property
+    def repos_per_minute(self) -> float:
+        return self.completed / self.elapsed_seconds * 60 if self.elapsed_seconds else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "repos_per_minute": round(self.repos_per_minute, 2),
+            "stage_seconds": {stage: round(seconds, 3) for stage, seconds in self.stage_seconds.items()}
+        }
+
+
+def score_repository(graph: DependencyGraph, max_depth: int,
+                     simulate: bool = False) -> Tuple[RiskAnalyzer, Dict[str, Any]]:
+    """Risk analysis of one repository graph, as in GitHubDependencyAnalyzer.analyze_repository()
+
+    The five most critical components get impact scores within max_depth
+    levels, under "impact_scores".  With simulate, an attack starting at the
+    most critical component is simulated and summarized under "simulation".
+    Module level, so it can run in a worker process.
+    """
+    analyzer = RiskAnalyzer(graph)
+    results = {
+        'stats': graph.get_graph_stats(),
+        'risk_assessment': analyzer.calculate_supply_chain_risk_score(),
+        'critical_components': graph.find_critical_components(min_dependents=1)
+    }
+    results['impact_scores'] = {
+        component_id: graph.calculate_impact_score(component_id, max_depth=max_depth)
+        for component_id, _ in results['critical_components'][:5]
+    }
+    if simulate and results['critical_components']:
+        simulation = graph.simulate_attack_propagation(results['critical_components'][0][0])
+        results['simulation'] = {key: simulation[key] for key in (
+            'initial_compromise', 'compromised_count', 'compromise_percentage', 'applications_affected')}
+    return analyzer, results
+
+
+class BatchPipeline:
+    """Analyze many repositories concurrently and save their outputs"""
+
+    def __init__(self, output_manager: OutputManager, max_components: int = 30, max_depth: int = 2,
+                 io_workers: int = 8, cpu_workers: int = 1, queue_size: int = 16,
+                 simulate: bool = False, include_timestamp: bool = True,
+                 analyzer_factory: Optional[Callable[[str], GitHubDependencyAnalyzer]] = None,
+                 org_graph: Optional[OrgGraph] = None,
+                 progress: Optional[Callable[[RepositoryResult, BatchStats], None]] = None):
+        """Create a pipeline
+
+        Args:
+            output_manager: Where the graphs, metrics and reports are saved
+            max_components: Maximum dependency components per repository
+            max_depth: Maximum dependency depth
+            io_workers: Threads fetching and parsing repositories
+            cpu_workers: Processes scoring repositories (1 scores in a thread
+                of this process)
+            queue_size: Capacity of each queue between stages
+            simulate: Also simulate an attack on every repository
+            include_timestamp: Timestamp the output file names
+            analyzer_factory: Creates the analyzer of a repository URL
+                (defaults to GitHubDependencyAnalyzer with the user configuration)
+            org_graph: Organization graph every analyzed repository is merged into
+            progress: Called with every finished repository and the running stats
+        """
+        if io_workers < 1 or cpu_workers < 1 or queue_size < 1:
+            raise ValueError("Worker counts and queue size must be at least 1")
+        self.output_manager = output_manager
+        self.max_components = max_components
+        self.max_depth = max_depth
+        self.io_workers = io_workers
+        self.cpu_workers = cpu_workers
+        self.queue_size = queue_size
+        self.simulate = simulate
+        self.include_timestamp = include_timestamp
+        self.analyzer_factory = analyzer_factory or GitHubDependencyAnalyzer
+        self.org_graph = org_graph
+        self.progress = progress or self._print_progress
+        self.stats = BatchStats()
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def _print_progress(result: RepositoryResult, stats: BatchStats) -> None:
+        detail = result.error if result.status != "ok" else \
+            f"{result.summary.get('total_components', 0)} components"
+        print(f"[{stats.completed}/{stats.total}] {result.status:7} {result.project_name}: {detail} "
+              f"({stats.repos_per_minute:.1f} repos/min)")
+
+    def _timed(self, stage: str, result: RepositoryResult, task: Callable, *args):
+        start = time.perf_counter()
+        try:
+            return task(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            result.durations[stage] = elapsed
+            with self._stats_lock:
+                self.stats.stage_seconds[stage] += elapsed
+
+    @staticmethod
+    def _fail(result: RepositoryResult, stage: str, error: Exception) -> RepositoryResult:
+        result.status, result.stage, result.error = "failed", stage, f"{type(error).__name__}: {error}"
+        return result
+
+    def _fetch_worker(self, urls: queue.Queue, graphs: queue.Queue, written: queue.Queue) -> None:
+        while True:
+            url = urls.get()
+            if url is _DONE:
+                return
+            result = RepositoryResult(url=url, project_name=url.rstrip('/').split('/')[-1].replace('.git', ''))
+            try:
+                analyzer = self.analyzer_factory(url)
+                result.project_name = f"{analyzer.repo_info['owner']}_{analyzer.repo_info['repo']}"
+                graph = self._timed("fetch", result, analyzer.create_dependency_graph,
+                                    self.max_components, self.max_depth)
+            except Exception as e:
+                written.put((self._fail(result, "fetch", e), None, None))
+                continue
+            if len(graph.components) <= 1:
+                result.status, result.error = "skipped", "no dependencies found"
+                written.put((result, None, None))
+                continue
+            result.summary['repo_info'] = dict(analyzer.repo_info)
+            graphs.put((result, graph))
+
+    def _score_worker(self, graphs: queue.Queue, written: queue.Queue,
+                      executor: Optional[ProcessPoolExecutor]) -> None:
+        while True:
+            item = graphs.get()
+            if item is _DONE:
+                return
+            result, graph = item
+            try:
+                if executor is not None:
+                    # Waiting for the result keeps one repository per worker in flight
+                    task = lambda: executor.submit(score_repository, graph, self.max_depth, self.simulate).result()
+                else:
+                    task = lambda: score_repository(graph, self.max_depth, self.simulate)
+                risk_analyzer, analysis = self._timed("score", result, task)
+            except Exception as e:
+                written.put((self._fail(result, "score", e), None, None))
+                continue
+            if executor is not None:
+                # The worker scored a copy; continue with the graph it scored
+                graph = risk_analyzer.graph
+            written.put((result, graph, (risk_analyzer, analysis)))
+
+    def _write(self, result: RepositoryResult, graph: DependencyGraph,
+               risk_analyzer: RiskAnalyzer, analysis: Dict[str, Any]) -> None:
+        project_name = result.project_name
+        analysis = {'repo_info': result.summary.get('repo_info', {}), **analysis}
+        graph_path = graph.export_to_json(output_manager=self.output_manager, project_name=project_name)
+        metrics_path = risk_analyzer.export_metrics_to_csv(output_manager=self.output_manager,
+                                                           project_name=project_name)
+        report_data = {
+            "project_info": {
+                "name": project_name,
+                "repository_url": result.url,
+                "analysis_parameters": {
+                    "max_depth": self.max_depth,
+                    "max_components": self.max_components
+                }
+            },
+            "analysis_results": analysis,
+            "file_outputs": {
+                "dependency_graph": graph_path,
+                "risk_metrics": metrics_path
+            }
+        }
+        report_path = self.output_manager.save_analysis_report(report_data, project_name,
+                                                               self.include_timestamp)
+        result.outputs = {"dependency_graph": graph_path, "risk_metrics": metrics_path,
+                          "analysis_report": report_path}
+        result.summary.update({
+            'total_components': analysis['stats']['total_components'],
+            'overall_risk_score': analysis['risk_assessment']['overall_risk_score']
+        })
+        if self.org_graph is not None:
+            self.org_graph.add_repository(f"{analysis['repo_info']['owner']}/{analysis['repo_info']['repo']}",
+                                          graph)
+
+    def _writer(self, written: queue.Queue, results: List[RepositoryResult], start: float) -> None:
+        while True:
+            item = written.get()
+            if item is _DONE:
+                return
+            result, graph, scored = item
+            if scored is not None:
+                try:
+                    self._timed("write", result, self._write, result, graph, *scored)
+                except Exception as e:
+                    self._fail(result, "write", e)
+            del graph, scored
+
+            with self._stats_lock:
+                if result.status == "ok":
+                    self.stats.succeeded += 1
+                elif result.status == "skipped":
+                    self.stats.skipped += 1
+                else:
+                    self.stats.failed += 1
+                self.stats.elapsed_seconds = time.perf_counter() - start
+            results.append(result)
+            try:
+                self.progress(result, self.stats)
+            except Exception as e:
+                # The writer must keep draining its queue, or the stages feeding it block
+                print(f"Progress callback failed: {e}")
+
+    def run(self, urls: List[str]) -> List[RepositoryResult]:
+        """Analyze the repositories and return their results, in completion order"""
+        urls = list(urls)
+        self.stats = BatchStats(total=len(urls))
+        results: List[RepositoryResult] = []
+        start = time.perf_counter()
+
+        url_queue = queue.Queue(maxsize=self.queue_size)
+        graph_queue = queue.Queue(maxsize=self.queue_size)
+        write_queue = queue.Queue(maxsize=self.queue_size)
+
+        executor = ProcessPoolExecutor(max_workers=self.cpu_workers) if self.cpu_workers > 1 else None
+        try:
+            fetchers = [threading.Thread(target=self._fetch_worker, args=(url_queue, graph_queue, write_queue),
+                                         daemon=True) for _ in range(self.io_workers)]
+            scorers = [threading.Thread(target=self._score_worker, args=(graph_queue, write_queue, executor),
+                                        daemon=True) for _ in range(self.cpu_workers)]
+            writer = threading.Thread(target=self._writer, args=(write_queue, results, start), daemon=True)
+            for thread in fetchers + scorers + [writer]:
+                thread.start()
+
+            # Each stage is closed once the stage feeding it has drained
+            for url in urls:
+                url_queue.put(url)
+            for _ in fetchers:
+                url_queue.put(_DONE)
+            for thread in fetchers:
+                thread.join()
+            for _ in scorers:
+                graph_queue.put(_DONE)
+            for thread in scorers:
+                thread.join()
+            write_queue.put(_DONE)
+            writer.join()
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        self.stats.elapsed_seconds = time.perf_counter() - start
+        return results
@@ -0,0 +1,222 @@
+"""
+Transitive dependency resolution.
+
+A DependencyResolver expands packages into their own requirements, level by
+level up to a maximum depth, asking a pluggable metadata source for each
+(name, version).  Lookups of one level run concurrently, and answers are
+kept in a persistent SQLite memo shared by every run and repository, so a
+popular package is resolved once per fleet scan rather than once per repo.
+
+Both sources read the same layout, a package index of JSON documents at
+<index>/<name>/<version>.json (with <name>/latest.json as the fallback):
+
+    {"name": "requests", "version": "2.31.0",
+     "requires": [{"name": "urllib3", "version": "2.0.7"}, ...]}
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ..config.settings import get_config_directory
+from .request_scheduler import RequestFailedError, RequestScheduler
+
+Package = Tuple[str, str]
+
+
+def _parse_requires(document: Dict) -> List[Package]:
+    requires = []
+    for requirement in document.get("requires", []):
+        version = re.sub(r'[^\d.]', '', str(requirement.get("version") or ""))
+        requires.append((requirement["name"], version or "latest"))
+    return requires
+
+
+class LocalIndexSource:
+    """Package metadata from an index directory on disk"""
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.source_id = f"file:{self.directory.resolve()}"
+
+    def requirements(self, name: str, version: str) -> Optional[List[Package]]:
+        """Requirements of a package, or None if the index doesn't know it"""
+        for candidate in (version, "latest"):
+            path = self.directory / name / f"{candidate}.json"
+            if path.is_file():
+                with open(path) as f:
+                    return _parse_requires(json.load(f))
+        return None
+
+
+class HTTPIndexSource:
+    """Package metadata from an index served over HTTP"""
+
+    def __init__(self, base_url: str, scheduler: Optional[RequestScheduler] = None):
+        self.base_url = base_url.rstrip("/")
+        self.source_id = self.base_url
+        self.scheduler = scheduler if scheduler is not None else RequestScheduler()
+
+    def requirements(self, name: str, version: str) -> Optional[List[Package]]:
+        """Requirements of a package, or None if the index doesn't know it
+
+        Only a 404 means unknown; any other unsuccessful status raises
+        RequestFailedError rather than dropping the package's requirements.
+        """
+        for candidate in (version, "latest"):
+            url = f"{self.base_url}/{name}/{candidate}.json"
+            response = self.scheduler.get(url)
+            if response.status_code == 200:
+                return _parse_requires(response.json())
+            if response.status_code != 404:
+                raise RequestFailedError(url, f"HTTP {response.status_code}")
+        return None
+
+
+def create_index_source(index: str, scheduler: Optional[RequestScheduler] = None):
+    """Source for an index given as a directory path or an http(s) URL"""
+    if index.startswith(("http://", "https://")):
+        return HTTPIndexSource(index, scheduler)
+    if not Path(index).is_dir():
+        raise ValueError(f"Package index directory not found: {index}")
+    return LocalIndexSource(index)
+
+
+class ResolverMemo:
+    """Persistent (source, name, version) -> requirements memo stored in SQLite
+
+    Requirements of a pinned version never change and are kept for good;
+    "unknown package" answers are only trusted for negative_ttl_seconds,
+    like the 404s of the HTTP cache, as the index may learn the package.
+    """
+
+    def __init__(self, db_path: str, negative_ttl_seconds: float = 86400):
+        self.db_path = Path(db_path)
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS requirements (
+                    source TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    requires TEXT,  -- JSON list of [name, version]; NULL if unknown
+                    resolved REAL NOT NULL,
+                    PRIMARY KEY (source, name, version)
+                )
+            """)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get_many(self, source: str, packages: List[Package]) -> Dict[Package, Optional[List[Package]]]:
+        """Memoized answers for the packages that have one"""
+        found = {}
+        negative_cutoff = time.time() - self.negative_ttl_seconds
+        with self._connect() as conn:
+            for name, version in packages:
+                row = conn.execute(
+                    "SELECT requires FROM requirements WHERE source = ? AND name = ? AND version = ? "
+                    "AND (requires IS NOT NULL OR resolved > ?)",
+                    (source, name, version, negative_cutoff)
+                ).fetchone()
+                if row is not None:
+                    found[(name, version)] = ([tuple(r) for r in json.loads(row[0])]
+                                              if row[0] is not None else None)
+        return found
+
+    def put_many(self, source: str, answers: Dict[Package, Optional[List[Package]]]) -> None:
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO requirements VALUES (?, ?, ?, ?, ?)",
+                [(source, name, version, json.dumps(requires) if requires is not None else None, time.time())
+                 for (name, version), requires in answers.items()]
+            )
+
+
+class DependencyResolver:
+    """Expand packages into their transitive requirements"""
+
+    def __init__(self, source, memo: Optional[ResolverMemo] = None, max_workers: int = 8):
+        """Create a resolver
+
+        Args:
+            source: Metadata source with requirements(name, version) and a source_id
+            memo: Persistent memo shared across runs (None keeps answers for this resolver only)
+            max_workers: Concurrent metadata lookups
+        """
+        self.source = source
+        self.memo = memo
+        self.max_workers = max_workers
+        self._known: Dict[Package, Optional[List[Package]]] = {}
+        self._lock = threading.Lock()
+        self.memo_hits = 0
+        self.fetched = 0
+
+    def requirements_of(self, packages: List[Package]) -> Dict[Package, Optional[List[Package]]]:
+        """Requirements of several packages, from memory, the memo or the source"""
+        with self._lock:
+            missing = [package for package in dict.fromkeys(packages) if package not in self._known]
+
+        if missing and self.memo is not None:
+            memoized = self.memo.get_many(self.source.source_id, missing)
+            with self._lock:
+                self._known.update(memoized)
+                self.memo_hits += len(memoized)
+            missing = [package for package in missing if package not in memoized]
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing))) as executor:
+                answers = dict(zip(missing, executor.map(lambda p: self.source.requirements(*p), missing)))
+            with self._lock:
+                self._known.update(answers)
+                self.fetched += len(answers)
+            if self.memo is not None:
+                # "latest" moves over time, so only pinned versions are kept across runs
+                pinned = {package: requires for package, requires in answers.items() if package[1] != "latest"}
+                self.memo.put_many(self.source.source_id, pinned)
+
+        with self._lock:
+            return {package: self._known[package] for package in packages}
+
+    def resolve(self, roots: List[Package], max_depth: int) -> Dict[Package, List[Package]]:
+        """Requirements of every package reachable from roots within max_depth levels
+
+        Returns package -> requirements for the roots and every package
+        expanded below them; packages unknown to the source map to [].
+        """
+        resolved: Dict[Package, List[Package]] = {}
+        frontier = list(dict.fromkeys(roots))
+        for _ in range(max_depth):
+            frontier = [package for package in frontier if package not in resolved]
+            if not frontier:
+                break
+            answers = self.requirements_of(frontier)
+            next_frontier = []
+            for package in frontier:
+                requires = answers[package] or []
+                resolved[package] = requires
+                next_frontier.extend(requires)
+            frontier = list(dict.fromkeys(next_frontier))
+        return resolved
+
+
+def create_resolver(index: str, scheduler: Optional[RequestScheduler] = None,
+                    use_memo: bool = True, max_workers: int = 8,
+                    negative_ttl_seconds: float = 86400) -> DependencyResolver:
+    """Resolver for a package index, memoized in the configuration directory when use_memo is on"""
+    memo = (ResolverMemo(get_config_directory() / "resolver_memo.sqlite", negative_ttl_seconds)
+            if use_memo else None)
+    return DependencyResolver(create_index_source(index, scheduler), memo, max_workers)
@@ -10,24 +10,69 @@ Currently supports:
 - Java (pom.xml, build.gradle)
 - Go (go.mod)
 - Rust (Cargo.toml)
+- C# (*.csproj)
 """
 
 import re
-import json
-import requests
-from typing import Dict, List, Optional, Tuple
+import tarfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
+from typing import Dict, Iterable, List, Optional
+from ..config.settings import GitHubSettings, get_config_directory, load_config
 from ..core.dependency_graph import DependencyGraph, SoftwareComponent, SoftwareType
+from ..core.org_graph import OrgGraph
+from .dependency_resolver import DependencyResolver
+from .http_cache import CacheEntry, HTTPCache
+from .manifest_analyzer import ManifestDependencyAnalyzer
+from .request_scheduler import RequestFailedError, RequestScheduler, get_shared_scheduler
 from .risk_analyzer import RiskAnalyzer
 from ..core.output_manager import OutputManager
 
 
-class GitHubDependencyAnalyzer:
+class GitHubDependencyAnalyzer(ManifestDependencyAnalyzer):
     """Automatically analyze dependencies from any GitHub repository"""
 
-    def __init__(self, github_url: str):
+    SOURCE_LABEL = "GitHub Repository"
+
+    MAX_MANIFEST_BYTES = 5 * 1024 * 1024
+
+    def __init__(self, github_url: str, settings: Optional[GitHubSettings] = None,
+                 scheduler: Optional[RequestScheduler] = None,
+                 http_cache: Optional[HTTPCache] = None,
+                 fetch_mode: Optional[str] = None,
+                 resolver: Optional[DependencyResolver] = None):
+        """Create an analyzer for one repository
+
+        Args:
+            github_url: Repository URL, optionally with /tree/<branch>
+            settings: GitHub settings (defaults to the user configuration)
+            scheduler: Request scheduler (defaults to the one shared by all
+                analyzers, which enforces the configured rate limits)
+            http_cache: Persistent response cache (defaults to one in the
+                configuration directory when settings.http_cache is on)
+            fetch_mode: "files" requests each manifest from the raw content
+                host; "archive" downloads the repository tarball once and
+                extracts the manifests from it (defaults to settings.fetch_mode)
+            resolver: Expands direct dependencies into their transitive
+                requirements (without one, only direct dependencies are graphed)
+        """
+        self.settings = settings if settings is not None else load_config().github
+        super().__init__(resolver, self.settings.max_concurrent_requests)
+        self.fetch_mode = fetch_mode if fetch_mode is not None else self.settings.fetch_mode
+        if self.fetch_mode not in ("files", "archive"):
+            raise ValueError(f"Unknown fetch mode: {self.fetch_mode}")
+        # Manifest path -> content, filled by the archive download
+        self._archive_files: Optional[Dict[str, str]] = None
+        self.scheduler = scheduler if scheduler is not None else get_shared_scheduler(self.settings)
+        if http_cache is None and self.settings.http_cache:
+            http_cache = HTTPCache(get_config_directory() / "http_cache",
+                                   self.settings.negative_cache_ttl_seconds)
+        self.http_cache = http_cache
+
         self.github_url = github_url
         self.repo_info = self._parse_github_url(github_url)
-        self.raw_base_url = f"https://raw.githubusercontent.com/{self.repo_info['owner']}/{self.repo_info['repo']}/{self.repo_info['branch']}"
+        self.raw_base_url = f"{self.settings.raw_content_url}/{self.repo_info['owner']}/{self.repo_info['repo']}/{self.repo_info['branch']}"
 
     def _parse_github_url(self, url: str) -> Dict[str, str]:
         """Parse GitHub URL to extract owner, repo, and branch"""
@@ -45,220 +90,176 @@ class GitHubDependencyAnalyzer:
                 # Remove .git suffix if present
                 repo = repo.replace('.git', '')
 
-                # If no branch specified, try to detect the default branch
+                # If no branch specified, try to detect the default branch;
+                # archives of HEAD are served from the default branch directly
                 if not branch:
-                    branch = self._detect_default_branch(owner, repo)
+                    branch = 'HEAD' if self._uses_archive else self._detect_default_branch(owner, repo)
 
                 return {'owner': owner, 'repo': repo, 'branch': branch}
 
         raise ValueError(f"Could not parse GitHub URL: {url}")
 
     def _detect_default_branch(self, owner: str, repo: str) -> str:
-        """Try to detect the default branch by testing common options"""
-        common_branches = ['main', 'dev', 'master', 'develop']
-
-        for branch in common_branches:
-            test_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/README.md"
-            try:
-                response = requests.get(test_url)
-                if response.status_code == 200:
-                    return branch
-            except:
-                continue
+        """Try to detect the default branch by testing common options
+
+        All candidates are probed concurrently; the first one in the
+        configured order that has a README wins.
+        """
+        common_branches = self.settings.default_branch_order
+
+        def has_readme(branch: str) -> bool:
+            test_url = f"{self.settings.raw_content_url}/{owner}/{repo}/{branch}/README.md"
+            return self._get_text(test_url) is not None
+
+        with ThreadPoolExecutor(max_workers=len(common_branches) or 1) as executor:
+            found = list(executor.map(has_readme, common_branches))
+
+        for branch, branch_found in zip(common_branches, found):
+            if branch_found:
+                return branch
 
         # Default fallback
         return 'main'
 
-    def fetch_file_content(self, file_path: str) -> Optional[str]:
-        """Fetch content of a file from the repository"""
-        url = f"{self.raw_base_url}/{file_path}"
-        try:
-            response = requests.get(url)
-            if response.status_code == 200:
-                return response.text
-            return None
-        except Exception as e:
-            print(f"Error fetching {file_path}: {e}")
+    def _get_text(self, url: str) -> Optional[str]:
+        """GET a text resource through the persistent cache; None if it doesn't exist
+
+        Cached bodies are revalidated with a conditional request, cached 404s
+        are trusted until they expire, and in offline mode only the cache is
+        consulted.  Only a 404 means missing: any other unsuccessful status
+        (401, a 403 that is not a rate limit, 410, ...) raises
+        RequestFailedError, so a manifest is never silently left out.
+        """
+        entry = self.http_cache.get(url) if self.http_cache is not None else None
+        if self.settings.offline:
+            return entry.body if entry is not None and entry.status == 200 else None
+        if entry is not None and self.http_cache.is_fresh_negative(entry):
             return None
 
-    def detect_project_type(self) -> List[str]:
-        """Detect what types of projects this repository contains"""
-        project_types = []
+        headers = entry.conditional_headers() if entry is not None and entry.status == 200 else {}
+        response = self.scheduler.get(url, headers=headers)
+
+        if response.status_code == 304 and headers:
+            entry.fetched_at = time.time()
+            self.http_cache.put(entry)
+            return entry.body
+        if response.status_code == 200:
+            if self.http_cache is not None:
+                self.http_cache.put(CacheEntry(
+                    url=url, status=200, body=response.text,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                    fetched_at=time.time()
+                ))
+            return response.text
+        if response.status_code == 404:
+            if self.http_cache is not None:
+                self.http_cache.put(CacheEntry(url=url, status=404, fetched_at=time.time()))
+            return None
+        raise RequestFailedError(url, f"HTTP {response.status_code}")
+
+    @property
+    def _uses_archive(self) -> bool:
+        # The archive is never cached, so offline runs read single files from the cache
+        return self.fetch_mode == "archive" and not self.settings.offline
+
+    def _load_archive(self) -> Dict[str, str]:
+        """Download the repository tarball once and extract its manifest files in memory"""
+        with self._cache_lock:
+            if self._archive_files is not None:
+                return self._archive_files
+            if self.settings.offline:
+                raise ValueError("Repository archives cannot be downloaded in offline mode")
+
+            url = (f"{self.settings.archive_url}/{self.repo_info['owner']}/"
+                   f"{self.repo_info['repo']}/archive/{self.repo_info['branch']}.tar.gz")
+            response = self.scheduler.get(url, stream=True)
+            if response.status_code != 200:
+                raise ValueError(f"Could not download repository archive {url}: HTTP {response.status_code}")
+
+            files = {}
+            with response, tarfile.open(fileobj=response.raw, mode="r|gz") as archive:
+                for member in archive:
+                    # Members are nested under a single "<repo>-<ref>/" directory
+                    path = member.name.split("/", 1)[1] if "/" in member.name else ""
+                    name = path.rsplit("/", 1)[-1]
+                    if (not member.isfile() or member.size > self.MAX_MANIFEST_BYTES
+                            or not any(fnmatch(name, pattern) for pattern in self.MANIFEST_PATTERNS)):
+                        continue
+                    files[path] = archive.extractfile(member).read().decode("utf-8", errors="replace")
+
+            self._archive_files = files
+            return files
+
+    def manifest_files(self) -> Dict[str, str]:
+        """All manifest files in the repository archive, by path (archive mode only)"""
+        if not self._uses_archive:
+            raise ValueError("manifest_files() requires fetch_mode='archive'")
+        return dict(self._load_archive())
 
-        # Check for various dependency files
-        files_to_check = {
-            'python': ['requirements.txt', 'setup.py', 'pyproject.toml', 'Pipfile'],
-            'nodejs': ['package.json'],
-            'java': ['pom.xml', 'build.gradle', 'build.gradle.kts'],
-            'go': ['go.mod'],
-            'rust': ['Cargo.toml'],
-            'csharp': ['*.csproj', 'packages.config'],
-            'ruby': ['Gemfile'],
-            'php': ['composer.json']
-        }
-
-        for project_type, files in files_to_check.items():
-            for file_pattern in files:
-                if '*' in file_pattern:
-                    # For wildcard patterns, we'd need directory listing
-                    continue
-                content = self.fetch_file_content(file_pattern)
-                if content:
-                    project_types.append(project_type)
-                    break
+    def fetch_file_content(self, file_path: str) -> Optional[str]:
+        """Fetch content of a file from the repository (cached for this analyzer)
 
-        return project_types
+        Returns None if the file does not exist. Raises RequestFailedError
+        if it could not be fetched, rather than treating it as missing.
+        """
+        if self._uses_archive:
+            return self._load_archive().get(file_path)
 
-    def parse_python_dependencies(self) -> List[Dict[str, str]]:
-        """Parse Python dependencies from various sources"""
-        dependencies = []
+        with self._cache_lock:
+            if file_path in self._content_cache:
+                return self._content_cache[file_path]
 
-        # Try requirements.txt
-        req_content = self.fetch_file_content('requirements.txt')
-        if req_content:
-            dependencies.extend(self._parse_requirements_txt(req_content))
+        content = self._get_text(f"{self.raw_base_url}/{file_path}")
+        with self._cache_lock:
+            self._content_cache[file_path] = content
+        return content
 
-        # Try setup.py
-        setup_content = self.fetch_file_content('setup.py')
-        if setup_content:
-            dependencies.extend(self._parse_setup_py(setup_content))
+    def fetch_files(self, file_paths: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Fetch several files concurrently through the request scheduler"""
+        file_paths = list(dict.fromkeys(file_paths))
+        if self._uses_archive:
+            archive_files = self._load_archive()
+            return {path: archive_files.get(path) for path in file_paths}
 
-        # Try pyproject.toml
-        pyproject_content = self.fetch_file_content('pyproject.toml')
-        if pyproject_content:
-            dependencies.extend(self._parse_pyproject_toml(pyproject_content))
+        with self._cache_lock:
+            missing = [path for path in file_paths if path not in self._content_cache]
 
-        return dependencies
+        if missing:
+            workers = min(self.settings.max_concurrent_requests, len(missing))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(self.fetch_file_content, missing))
 
-    def _parse_requirements_txt(self, content: str) -> List[Dict[str, str]]:
-        """Parse requirements.txt format"""
-        dependencies = []
-        lines = content.strip().split('\n')
+        with self._cache_lock:
+            return {path: self._content_cache[path] for path in file_paths}
 
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
+    def detect_project_type(self) -> List[str]:
+        """Detect what types of projects this repository contains"""
+        project_types = []
 
-            # Handle various requirement formats
-            # package==1.0.0, package>=1.0.0, package, etc.
-            match = re.match(r'^([a-zA-Z0-9_-]+)([>=<!=~]+)?([0-9.]+)?', line)
-            if match:
-                name = match.group(1)
-                version = match.group(3) if match.group(3) else 'latest'
-                dependencies.append({
-                    'name': name,
-                    'version': version,
-                    'type': 'library'
-                })
-
-        return dependencies
-
-    def _parse_setup_py(self, content: str) -> List[Dict[str, str]]:
-        """Extract dependencies from setup.py"""
-        dependencies = []
-
-        # Look for install_requires
-        install_requires_match = re.search(r'install_requires\s*=\s*\[(.*?)\]', content, re.DOTALL)
-        if not install_requires_match:
-            # Also look for 'requires' variable
-            install_requires_match = re.search(r'requires\s*=\s*\[(.*?)\]', content, re.DOTALL)
-
-        if install_requires_match:
-            deps_text = install_requires_match.group(1)
-            # Extract quoted strings
-            dep_matches = re.findall(r'["\']([^"\']+)["\']', deps_text)
-
-            for dep in dep_matches:
-                # Parse package name and version constraints
-                match = re.match(r'^([a-zA-Z0-9_-]+)([>=<!=~,\s]+)?([0-9.,<>=!\s]+)?', dep)
-                if match:
-                    name = match.group(1)
-                    # Extract version if present, otherwise use 'latest'
-                    version_spec = match.group(3) if match.group(3) else 'latest'
-                    if version_spec != 'latest':
-                        # Try to extract a specific version number
-                        version_match = re.search(r'([0-9]+\.[0-9]+(?:\.[0-9]+)?)', version_spec)
-                        version = version_match.group(1) if version_match else 'latest'
-                    else:
-                        version = 'latest'
-
-                    dependencies.append({
-                        'name': name,
-                        'version': version,
-                        'type': 'library'
-                    })
-
-        return dependencies
-
-    def _parse_pyproject_toml(self, content: str) -> List[Dict[str, str]]:
-        """Parse pyproject.toml dependencies (simplified)"""
-        dependencies = []
-
-        # Look for dependencies section
-        deps_match = re.search(r'dependencies\s*=\s*\[(.*?)\]', content, re.DOTALL)
-        if deps_match:
-            deps_text = deps_match.group(1)
-            dep_matches = re.findall(r'["\']([^"\']+)["\']', deps_text)
-
-            for dep in dep_matches:
-                match = re.match(r'^([a-zA-Z0-9_-]+)([>=<!=~]+)?([0-9.]+)?', dep)
-                if match:
-                    name = match.group(1)
-                    version = match.group(3) if match.group(3) else 'latest'
-                    dependencies.append({
-                        'name': name,
-                        'version': version,
-                        'type': 'library'
-                    })
-
-        return dependencies
-
-    def parse_nodejs_dependencies(self) -> List[Dict[str, str]]:
-        """Parse Node.js package.json dependencies"""
-        dependencies = []
-
-        package_content = self.fetch_file_content('package.json')
-        if not package_content:
-            return dependencies
+        # Wildcard patterns need a directory listing, which only the archive provides
+        candidates = [file_pattern for files in self.MANIFEST_FILES.values()
+                      for file_pattern in files if '*' not in file_pattern]
+        if self._uses_archive:
+            contents = {path: content for path, content in self._load_archive().items() if "/" not in path}
+        else:
+            contents = self.fetch_files(candidates)
 
-        try:
-            package_data = json.loads(package_content)
-
-            # Parse dependencies
-            for dep_type in ['dependencies', 'devDependencies']:
-                if dep_type in package_data:
-                    for name, version in package_data[dep_type].items():
-                        # Clean version string (remove ^, ~, etc.)
-                        clean_version = re.sub(r'[^\d.]', '', version)
-                        if not clean_version:
-                            clean_version = 'latest'
-
-                        dependencies.append({
-                            'name': name,
-                            'version': clean_version,
-                            'type': 'library' if dep_type == 'dependencies' else 'dev_library'
-                        })
-
-        except json.JSONDecodeError:
-            print("Error parsing package.json")
-
-        return dependencies
-
-    def create_dependency_graph(self, max_components: int = 50) -> DependencyGraph:
-        """Create a dependency graph from the repository"""
-        print(f"Analyzing repository: {self.repo_info['owner']}/{self.repo_info['repo']}")
+        for project_type, files in self.MANIFEST_FILES.items():
+            if any(content for path, content in contents.items()
+                   if any(fnmatch(path, file_pattern) for file_pattern in files)):
+                project_types.append(project_type)
 
-        # Detect project types
-        project_types = self.detect_project_type()
-        print(f"Detected project types: {', '.join(project_types)}")
+        return project_types
 
-        if not project_types:
-            print("No supported project types detected")
-            return DependencyGraph(f"{self.repo_info['repo']} Dependencies")
+    def create_dependency_graph(self, max_components: int = 50, max_depth: int = 1) -> DependencyGraph:
+        """Create a dependency graph from the repository
 
-        # Create the graph
-        graph = DependencyGraph(f"{self.repo_info['repo']} Dependencies")
+        Direct dependencies are at depth 1; with a resolver, their
+        requirements are added down to max_depth. In archive mode every
+        manifest of the archive is parsed, including nested ones.
+        """
+        print(f"Analyzing repository: {self.repo_info['owner']}/{self.repo_info['repo']}")
 
         # Create main application component
         main_app = SoftwareComponent(
@@ -269,6 +270,25 @@ class GitHubDependencyAnalyzer:
             description=f"Main application from {self.github_url}",
             criticality_score=10.0
         )
+
+        if self._uses_archive:
+            manifests = self.parse_all_manifests()
+            print(f"Found {len(manifests)} manifest files in the repository archive")
+            graph = DependencyGraph(f"{self.repo_info['repo']} Dependencies")
+            graph.add_component(main_app)
+            self._add_manifest_dependencies(graph, main_app, manifests, max_components, max_depth)
+            return graph
+
+        # Detect project types
+        project_types = self.detect_project_type()
+        print(f"Detected project types: {', '.join(project_types)}")
+
+        if not project_types:
+            print("No supported project types detected")
+            return DependencyGraph(f"{self.repo_info['repo']} Dependencies")
+
+        # Create the graph
+        graph = DependencyGraph(f"{self.repo_info['repo']} Dependencies")
         graph.add_component(main_app)
 
         all_dependencies = []
@@ -300,53 +320,13 @@ class GitHubDependencyAnalyzer:
             # Add dependency relationship to main app
             graph.add_dependency(main_app.id, component.id, "direct")
 
+        direct = [(dep['name'], dep['version']) for dep in dependencies]
+        self._add_transitive_dependencies(graph, direct, max_depth, max_components - len(dependencies))
+
         return graph
 
-    def analyze_repository(self, max_components: int = 30, max_depth: int = 2) -> Tuple[DependencyGraph, RiskAnalyzer, Dict]:
-        """Complete analysis of a GitHub repository"""
-
-        print(f"GitHub Repository Analysis")
-        print("=" * 50)
-        print(f"Repository: {self.github_url}")
-        print(f"Owner: {self.repo_info['owner']}")
-        print(f"Repo: {self.repo_info['repo']}")
-        print(f"Branch: {self.repo_info['branch']}")
-        print(f"Max components: {max_components}")
-        print(f"Max depth: {max_depth}")
-
-        # Create dependency graph
-        graph = self.create_dependency_graph(max_components)
-
-        # Get statistics
-        stats = graph.get_graph_stats()
-        print(f"\nDependency Graph Statistics:")
-        print(f"  Total components: {stats['total_components']}")
-        print(f"  Total dependencies: {stats['total_dependencies']}")
-        print(f"  Applications: {stats['applications']}")
-        print(f"  Libraries: {stats['libraries']}")
-
-        if stats['total_components'] <= 1:
-            print("Insufficient dependencies found for analysis")
-            return graph, None, {}
-
-        # Find critical components
-        critical_components = graph.find_critical_components(min_dependents=1)
-        print(f"\nCritical Components:")
-        for comp_id, dependent_count in critical_components[:5]:
-            component = graph.components[comp_id]
-            impact = graph.calculate_impact_score(comp_id, max_depth=max_depth)
-            print(f"  {component.name}: {dependent_count} dependents, impact: {impact:.1f}")
-
-        # Risk analysis
-        analyzer = RiskAnalyzer(graph)
-        risk_assessment = analyzer.calculate_supply_chain_risk_score()
-
-        print(f"\nRisk Assessment:")
-        print(f"  Overall risk level: {analyzer._categorize_risk_level(risk_assessment['overall_risk_score'])}")
-        print(f"  Risk score: {risk_assessment['overall_risk_score']:.1f}/10")
-        print(f"  High-risk components: {risk_assessment['high_risk_components']}")
-
-        # Export results
+    def _export_results(self, graph: DependencyGraph, analyzer: RiskAnalyzer) -> None:
+        """Write the graph and risk metrics next to the working directory"""
         output_prefix = f"{self.repo_info['owner']}_{self.repo_info['repo']}"
         graph.export_to_json(f"{output_prefix}_dependencies.json")
         analyzer.export_metrics_to_csv(f"{output_prefix}_risk_metrics.csv")
@@ -355,16 +335,6 @@ class GitHubDependencyAnalyzer:
         print(f"  Dependencies: {output_prefix}_dependencies.json")
         print(f"  Risk metrics: {output_prefix}_risk_metrics.csv")
 
-        results = {
-            'repo_info': self.repo_info,
-            'stats': stats,
-            'risk_assessment': risk_assessment,
-            'critical_components': critical_components
-        }
-
-        return graph, analyzer, results
-
-
 def analyze_github_repo(github_url: str, max_components: int = 30, max_depth: int = 2):
     """Convenience function to analyze any GitHub repository"""
 
@@ -378,7 +348,7 @@ def analyze_github_repo(github_url: str, max_components: int = 30, max_depth: in
 
 
 def demo_multiple_repos():
-    """Demonstrate analysis of multiple different repositories"""
+    """Demonstrate analysis of multiple different repositories merged into one org graph"""
 
     test_repos = [
         "https://github.com/home-assistant/core",
@@ -391,6 +361,7 @@ def demo_multiple_repos():
     print("=" * 60)
 
     results = {}
+    org_graph = OrgGraph()
 
     for repo_url in test_repos:
         print(f"\n{'='*20} ANALYZING {repo_url.split('/')[-1].upper()} {'='*20}")
@@ -398,6 +369,11 @@ def demo_multiple_repos():
         try:
             graph, analyzer, analysis = analyze_github_repo(repo_url, max_components=20)
             results[repo_url] = analysis
+            if graph is not None and graph.components:
+                repo_info = analysis.get('repo_info') or {}
+                org_graph.add_repository(
+                    f"{repo_info.get('owner')}/{repo_info.get('repo')}" if repo_info else repo_url, graph
+                )
 
         except Exception as e:
             print(f"Failed to analyze {repo_url}: {e}")
@@ -420,6 +396,12 @@ def demo_multiple_repos():
             print(f"  Libraries: {stats.get('libraries', 0)}")
             print(f"  Risk Score: {risk.get('overall_risk_score', 0):.1f}")
 
+    org_stats = org_graph.get_stats()
+    print(f"\nOrganization graph: {org_stats['repositories']} repositories, "
+          f"{org_stats['shared_components']} unique packages")
+    for component_id, repo_count in org_graph.shared_components()[:10]:
+        print(f"  {component_id}: used by {repo_count} repositories")
+
 
 if __name__ == "__main__":
     # Test with Home Assistant (we know this works)
@@ -0,0 +1,86 @@
+"""
+Persistent HTTP cache for repository file fetches.
+
+Responses are stored one JSON file per URL under a cache directory (by
+default in the user configuration directory), together with their ETag and
+Last-Modified validators.  Cached bodies are revalidated with conditional
+requests, so re-scanning an unchanged repository costs only 304 responses,
+and 404 results are remembered for a configurable time so missing manifests
+are not probed again on every run.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, Optional
+
+
+@dataclass
+class CacheEntry:
+    """A cached response: the body of a 200, or a remembered 404"""
+    url: str
+    status: int
+    body: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers that revalidate this entry with the server"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HTTPCache:
+    """On-disk cache of HTTP responses keyed by URL
+
+    Entries are written atomically, so the cache can be shared by
+    concurrent fetches and by several processes.
+    """
+
+    def __init__(self, directory: str, negative_ttl_seconds: float = 86400):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.negative_ttl_seconds = negative_ttl_seconds
+
+    def _path(self, url: str) -> Path:
+        return self.directory / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """The cached entry for url, if any"""
+        try:
+            with open(self._path(url)) as f:
+                return CacheEntry(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def put(self, entry: CacheEntry) -> None:
+        """Store an entry, replacing any previous one for the same URL"""
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(asdict(entry), f)
+            os.replace(temp_path, self._path(entry.url))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def is_fresh_negative(self, entry: CacheEntry) -> bool:
+        """Whether a cached 404 can still be trusted without asking the server"""
+        return entry.status == 404 and entry.age() < self.negative_ttl_seconds
+
+    def clear(self) -> None:
+        """Remove every cached entry"""
+        for path in self.directory.glob("*.json"):
+            path.unlink()
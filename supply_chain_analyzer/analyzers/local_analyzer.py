@@ -0,0 +1,158 @@
+"""
+Local Repository Dependency Analyzer
+
+This module analyzes a repository checkout on disk instead of fetching files
+from GitHub.  The working tree is walked with os.scandir across a thread
+pool, skipping ignored paths, and every manifest found (including nested
+ones in monorepo subprojects and wildcard ones like *.csproj) is parsed in
+parallel by the shared ManifestDependencyAnalyzer.
+"""
+
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..core.dependency_graph import DependencyGraph, SoftwareComponent, SoftwareType
+from .dependency_resolver import DependencyResolver
+from .manifest_analyzer import ManifestDependencyAnalyzer
+
+
+class LocalRepositoryAnalyzer(ManifestDependencyAnalyzer):
+    """Analyze dependencies from a local working tree, without network access
+
+    Manifests in the repository root describe the main application;
+    manifests in subdirectories become subproject components that the main
+    application depends on.
+    """
+
+    SOURCE_LABEL = "Local Repository"
+
+    # Directories that never hold first-party manifests
+    DEFAULT_IGNORE_PATTERNS = ['.git', '.hg', '.svn', 'node_modules', '__pycache__', '.tox',
+                               '.venv', 'venv', '.mypy_cache', '.pytest_cache']
+
+    def __init__(self, path: str, ignore_patterns: Optional[List[str]] = None,
+                 max_workers: int = 8, use_gitignore: bool = True,
+                 resolver: Optional[DependencyResolver] = None):
+        """Create an analyzer for one checkout
+
+        Args:
+            path: Root of the working tree
+            ignore_patterns: Extra glob patterns, matched against names and
+                root-relative paths; a trailing "/" matches directories only
+            max_workers: Threads used for discovery and parsing
+            use_gitignore: Also honor the simple patterns of the root .gitignore
+            resolver: Expands dependencies into their transitive requirements
+        """
+        self.root = Path(path).resolve()
+        if not self.root.is_dir():
+            raise ValueError(f"Not a directory: {path}")
+        super().__init__(resolver, max_workers)
+
+        self.github_url = str(self.root)
+        self.repo_info = {'owner': 'local', 'repo': self.root.name, 'branch': 'local'}
+
+        patterns = self.DEFAULT_IGNORE_PATTERNS + list(ignore_patterns or [])
+        if use_gitignore:
+            patterns += self._read_gitignore()
+        self._ignore_files = [p for p in patterns if not p.endswith('/')]
+        self._ignore_dirs = [p.rstrip('/') for p in patterns]
+        self._manifests: Optional[Dict[str, Path]] = None
+
+    def _read_gitignore(self) -> List[str]:
+        """Plain patterns of the root .gitignore (negations are not supported)"""
+        gitignore = self.root / '.gitignore'
+        if not gitignore.is_file():
+            return []
+        patterns = []
+        for line in gitignore.read_text(errors='replace').splitlines():
+            line = line.strip()
+            if line and not line.startswith(('#', '!')):
+                patterns.append(line.lstrip('/'))
+        return patterns
+
+    def _is_ignored(self, name: str, relative_path: str, is_dir: bool) -> bool:
+        patterns = self._ignore_dirs if is_dir else self._ignore_files
+        return any(fnmatch(name, pattern) or fnmatch(relative_path, pattern) for pattern in patterns)
+
+    def _scan_directory(self, directory: str) -> Tuple[List[str], Dict[str, Path]]:
+        """Subdirectories to descend into and manifest files of one directory"""
+        subdirectories, manifests = [], {}
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                relative_path = os.path.relpath(entry.path, self.root).replace(os.sep, '/')
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if self._is_ignored(entry.name, relative_path, is_dir):
+                    continue
+                if is_dir:
+                    subdirectories.append(entry.path)
+                elif entry.is_file() and any(fnmatch(entry.name, pattern)
+                                             for pattern in self.MANIFEST_PATTERNS):
+                    manifests[relative_path] = Path(entry.path)
+        return subdirectories, manifests
+
+    def discover_manifests(self) -> Dict[str, Path]:
+        """All manifest files of the working tree, by root-relative path"""
+        if self._manifests is not None:
+            return self._manifests
+
+        found = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {executor.submit(self._scan_directory, str(self.root))}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    subdirectories, manifests = future.result()
+                    found.update(manifests)
+                    pending |= {executor.submit(self._scan_directory, d) for d in subdirectories}
+
+        self._manifests = dict(sorted(found.items()))
+        return self._manifests
+
+    def fetch_file_content(self, file_path: str) -> Optional[str]:
+        """Read a manifest of the working tree (None if it doesn't exist or is ignored)"""
+        with self._cache_lock:
+            if file_path in self._content_cache:
+                return self._content_cache[file_path]
+
+        path = self.discover_manifests().get(file_path)
+        content = path.read_text(errors='replace') if path else None
+        with self._cache_lock:
+            return self._content_cache.setdefault(file_path, content)
+
+    def fetch_files(self, file_paths) -> Dict[str, Optional[str]]:
+        return {path: self.fetch_file_content(path) for path in file_paths}
+
+    def manifest_files(self) -> Dict[str, str]:
+        """Contents of all manifest files, by path"""
+        manifests = self.discover_manifests()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            contents = list(executor.map(self.fetch_file_content, manifests))
+        return dict(zip(manifests, contents))
+
+    def detect_project_type(self) -> List[str]:
+        """Detect the project types of the repository root"""
+        root_files = [path for path in self.discover_manifests() if '/' not in path]
+        return [project_type for project_type, files in self.MANIFEST_FILES.items()
+                if any(fnmatch(path, file_pattern) for path in root_files for file_pattern in files)]
+
+    def create_dependency_graph(self, max_components: int = 50, max_depth: int = 1) -> DependencyGraph:
+        """Create a dependency graph from all manifests of the working tree"""
+        print(f"Analyzing local repository: {self.root}")
+        manifests = self.parse_all_manifests()
+        print(f"Found {len(manifests)} manifest files")
+
+        graph = DependencyGraph(f"{self.repo_info['repo']} Dependencies")
+        main_app = SoftwareComponent(
+            name=self.repo_info['repo'],
+            version="local",
+            software_type=SoftwareType.APPLICATION,
+            vendor="local",
+            description=f"Main application from {self.root}",
+            criticality_score=10.0
+        )
+        graph.add_component(main_app)
+        self._add_manifest_dependencies(graph, main_app, manifests, max_components, max_depth)
+        return graph
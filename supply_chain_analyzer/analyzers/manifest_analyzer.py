@@ -0,0 +1,471 @@
+"""
+Manifest-based dependency analysis shared by the repository analyzers.
+
+ManifestDependencyAnalyzer parses dependency manifests and builds the
+dependency graph and risk analysis of a repository; subclasses only decide
+where the manifest files come from (the GitHub hosts or a local checkout).
+
+Currently supports:
+- Python (requirements.txt, setup.py, pyproject.toml)
+- Node.js (package.json)
+- Go (go.mod)
+- Rust (Cargo.toml)
+- C# (*.csproj)
+"""
+
+import re
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
+from typing import Dict, List, Optional, Tuple
+from ..core.dependency_graph import DependencyGraph, SoftwareComponent, SoftwareType
+from .dependency_resolver import DependencyResolver
+from .risk_analyzer import RiskAnalyzer
+
+
+class ManifestDependencyAnalyzer:
+    """Build dependency graphs from the manifest files of a repository
+
+    Subclasses set github_url and repo_info (owner, repo and branch) and
+    provide fetch_file_content(), manifest_files(), detect_project_type()
+    and create_dependency_graph().
+    """
+
+    SOURCE_LABEL = "Repository"
+
+    # Dependency files that identify each project type, in probing order
+    MANIFEST_FILES = {
+        'python': ['requirements.txt', 'setup.py', 'pyproject.toml', 'Pipfile'],
+        'nodejs': ['package.json'],
+        'java': ['pom.xml', 'build.gradle', 'build.gradle.kts'],
+        'go': ['go.mod'],
+        'rust': ['Cargo.toml'],
+        'csharp': ['*.csproj', 'packages.config'],
+        'ruby': ['Gemfile'],
+        'php': ['composer.json']
+    }
+
+    # Names of every manifest file, matched at any depth of a repository
+    MANIFEST_PATTERNS = ['requirements*.txt'] + [
+        file_pattern for files in MANIFEST_FILES.values() for file_pattern in files
+    ]
+
+    def __init__(self, resolver: Optional[DependencyResolver] = None, max_workers: int = 8):
+        """Set up the state shared by every analyzer
+
+        Args:
+            resolver: Expands direct dependencies into their transitive
+                requirements (without one, only direct dependencies are graphed)
+            max_workers: Threads used to parse manifests
+        """
+        self.resolver = resolver
+        self.max_workers = max_workers
+        # File path -> content (None when missing), so every file is read at most once
+        self._content_cache: Dict[str, Optional[str]] = {}
+        self._cache_lock = threading.Lock()
+
+    def fetch_file_content(self, file_path: str) -> Optional[str]:
+        """Content of a repository file, or None if it doesn't exist"""
+        raise NotImplementedError
+
+    def manifest_files(self) -> Dict[str, str]:
+        """Contents of all manifest files of the repository, by path"""
+        raise NotImplementedError
+
+    def detect_project_type(self) -> List[str]:
+        """Project types of the repository root"""
+        raise NotImplementedError
+
+    def create_dependency_graph(self, max_components: int = 50, max_depth: int = 1) -> DependencyGraph:
+        """Dependency graph of the repository"""
+        raise NotImplementedError
+
+    def parse_python_dependencies(self) -> List[Dict[str, str]]:
+        """Parse Python dependencies from various sources"""
+        dependencies = []
+
+        # Try requirements.txt
+        req_content = self.fetch_file_content('requirements.txt')
+        if req_content:
+            dependencies.extend(self._parse_requirements_txt(req_content))
+
+        # Try setup.py
+        setup_content = self.fetch_file_content('setup.py')
+        if setup_content:
+            dependencies.extend(self._parse_setup_py(setup_content))
+
+        # Try pyproject.toml
+        pyproject_content = self.fetch_file_content('pyproject.toml')
+        if pyproject_content:
+            dependencies.extend(self._parse_pyproject_toml(pyproject_content))
+
+        return dependencies
+
+    def _parse_requirements_txt(self, content: str) -> List[Dict[str, str]]:
+        """Parse requirements.txt format"""
+        dependencies = []
+        lines = content.strip().split('\n')
+
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+
+            # Handle various requirement formats
+            # package==1.0.0, package>=1.0.0, package, etc.
+            match = re.match(r'^([a-zA-Z0-9_-]+)([>=<!=~]+)?([0-9.]+)?', line)
+            if match:
+                name = match.group(1)
+                version = match.group(3) if match.group(3) else 'latest'
+                dependencies.append({
+                    'name': name,
+                    'version': version,
+                    'type': 'library'
+                })
+
+        return dependencies
+
+    def _parse_setup_py(self, content: str) -> List[Dict[str, str]]:
+        """Extract dependencies from setup.py"""
+        dependencies = []
+
+        # Look for install_requires
+        install_requires_match = re.search(r'install_requires\s*=\s*\[(.*?)\]', content, re.DOTALL)
+        if not install_requires_match:
+            # Also look for 'requires' variable
+            install_requires_match = re.search(r'requires\s*=\s*\[(.*?)\]', content, re.DOTALL)
+
+        if install_requires_match:
+            deps_text = install_requires_match.group(1)
+            # Extract quoted strings
+            dep_matches = re.findall(r'["\']([^"\']+)["\']', deps_text)
+
+            for dep in dep_matches:
+                # Parse package name and version constraints
+                match = re.match(r'^([a-zA-Z0-9_-]+)([>=<!=~,\s]+)?([0-9.,<>=!\s]+)?', dep)
+                if match:
+                    name = match.group(1)
+                    # Extract version if present, otherwise use 'latest'
+                    version_spec = match.group(3) if match.group(3) else 'latest'
+                    if version_spec != 'latest':
+                        # Try to extract a specific version number
+                        version_match = re.search(r'([0-9]+\.[0-9]+(?:\.[0-9]+)?)', version_spec)
+                        version = version_match.group(1) if version_match else 'latest'
+                    else:
+                        version = 'latest'
+
+                    dependencies.append({
+                        'name': name,
+                        'version': version,
+                        'type': 'library'
+                    })
+
+        return dependencies
+
+    def _parse_pyproject_toml(self, content: str) -> List[Dict[str, str]]:
+        """Parse pyproject.toml dependencies (simplified)"""
+        dependencies = []
+
+        # Look for dependencies section
+        deps_match = re.search(r'dependencies\s*=\s*\[(.*?)\]', content, re.DOTALL)
+        if deps_match:
+            deps_text = deps_match.group(1)
+            dep_matches = re.findall(r'["\']([^"\']+)["\']', deps_text)
+
+            for dep in dep_matches:
+                match = re.match(r'^([a-zA-Z0-9_-]+)([>=<!=~]+)?([0-9.]+)?', dep)
+                if match:
+                    name = match.group(1)
+                    version = match.group(3) if match.group(3) else 'latest'
+                    dependencies.append({
+                        'name': name,
+                        'version': version,
+                        'type': 'library'
+                    })
+
+        return dependencies
+
+    def parse_nodejs_dependencies(self) -> List[Dict[str, str]]:
+        """Parse Node.js package.json dependencies"""
+        package_content = self.fetch_file_content('package.json')
+        if not package_content:
+            return []
+
+        return self._parse_package_json(package_content)
+
+    def _parse_package_json(self, content: str) -> List[Dict[str, str]]:
+        """Parse package.json dependencies and devDependencies"""
+        dependencies = []
+
+        try:
+            package_data = json.loads(content)
+
+            # Parse dependencies
+            for dep_type in ['dependencies', 'devDependencies']:
+                if dep_type in package_data:
+                    for name, version in package_data[dep_type].items():
+                        # Clean version string (remove ^, ~, etc.)
+                        clean_version = re.sub(r'[^\d.]', '', version)
+                        if not clean_version:
+                            clean_version = 'latest'
+
+                        dependencies.append({
+                            'name': name,
+                            'version': clean_version,
+                            'type': 'library' if dep_type == 'dependencies' else 'dev_library'
+                        })
+
+        except json.JSONDecodeError:
+            print("Error parsing package.json")
+
+        return dependencies
+
+    def _parse_go_mod(self, content: str) -> List[Dict[str, str]]:
+        """Parse require directives of a go.mod file"""
+        dependencies = []
+        in_require_block = False
+
+        for line in content.split('\n'):
+            line = line.split('//')[0].strip()
+            if line.startswith('require ('):
+                in_require_block = True
+                continue
+            if in_require_block and line == ')':
+                in_require_block = False
+                continue
+            if line.startswith('require '):
+                line = line[len('require '):]
+            elif not in_require_block:
+                continue
+
+            match = re.match(r'^(\S+)\s+v?([0-9][^\s]*)', line)
+            if match:
+                dependencies.append({
+                    'name': match.group(1),
+                    'version': match.group(2),
+                    'type': 'library'
+                })
+
+        return dependencies
+
+    def _parse_cargo_toml(self, content: str) -> List[Dict[str, str]]:
+        """Parse the dependency tables of a Cargo.toml file (simplified)"""
+        dependencies = []
+        section = None
+
+        for line in content.split('\n'):
+            line = line.strip()
+            if line.startswith('['):
+                section = line.strip('[]').strip()
+                continue
+            if section not in ('dependencies', 'dev-dependencies', 'build-dependencies'):
+                continue
+
+            # name = "1.0" or name = { version = "1.0", ... }
+            match = re.match(r'^([A-Za-z0-9_-]+)\s*=\s*(?:"([^"]*)"|\{.*?version\s*=\s*"([^"]*)")', line)
+            if match:
+                clean_version = re.sub(r'[^\d.]', '', match.group(2) or match.group(3) or '')
+                dependencies.append({
+                    'name': match.group(1),
+                    'version': clean_version or 'latest',
+                    'type': 'dev_library' if section == 'dev-dependencies' else 'library'
+                })
+
+        return dependencies
+
+    def _parse_csproj(self, content: str) -> List[Dict[str, str]]:
+        """Parse PackageReference items of a .csproj file"""
+        dependencies = []
+
+        for match in re.finditer(r'<PackageReference\s+([^>]*?)/?>(?:\s*<Version>([^<]*)</Version>)?',
+                                 content, re.IGNORECASE):
+            attributes = dict(re.findall(r'(\w+)\s*=\s*"([^"]*)"', match.group(1)))
+            name = attributes.get('Include')
+            if not name:
+                continue
+            version = re.sub(r'[^\d.]', '', attributes.get('Version') or match.group(2) or '')
+            dependencies.append({
+                'name': name,
+                'version': version or 'latest',
+                'type': 'library'
+            })
+
+        return dependencies
+
+    def parse_manifest(self, file_path: str, content: str) -> List[Dict[str, str]]:
+        """Parse one manifest file, chosen by its name; other files yield no dependencies"""
+        name = file_path.rsplit('/', 1)[-1]
+        if fnmatch(name, 'requirements*.txt'):
+            return self._parse_requirements_txt(content)
+        if fnmatch(name, '*.csproj'):
+            return self._parse_csproj(content)
+
+        parsers = {
+            'setup.py': self._parse_setup_py,
+            'pyproject.toml': self._parse_pyproject_toml,
+            'package.json': self._parse_package_json,
+            'go.mod': self._parse_go_mod,
+            'Cargo.toml': self._parse_cargo_toml
+        }
+        parser = parsers.get(name)
+        return parser(content) if parser else []
+
+    def parse_all_manifests(self) -> Dict[str, List[Dict[str, str]]]:
+        """Dependencies declared by every manifest, parsed in parallel, by manifest path"""
+        contents = self.manifest_files()
+
+        def parse(item):
+            path, content = item
+            return self.parse_manifest(path, content) if content else []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            parsed = list(executor.map(parse, contents.items()))
+        return dict(zip(contents, parsed))
+
+    def _add_manifest_dependencies(self, graph: DependencyGraph, main_app: SoftwareComponent,
+                                   manifests: Dict[str, List[Dict[str, str]]],
+                                   max_components: int, max_depth: int) -> int:
+        """Add the dependencies of every manifest and return the number of components added
+
+        Manifests in the repository root belong to the main application;
+        manifests in subdirectories become subproject components that the
+        main application depends on.
+        """
+        added = 0
+        direct = []
+        for manifest_path, dependencies in manifests.items():
+            directory = manifest_path.rsplit('/', 1)[0] if '/' in manifest_path else ''
+            owner_id = main_app.id
+            if directory:
+                owner_id = f"{directory}:{main_app.version}"
+                if owner_id not in graph.components:
+                    graph.add_component(SoftwareComponent(
+                        name=directory,
+                        version=main_app.version,
+                        software_type=SoftwareType.APPLICATION,
+                        vendor=main_app.vendor,
+                        description=f"Subproject {directory} of {self.repo_info['repo']}",
+                        criticality_score=8.0
+                    ))
+                    graph.add_dependency(main_app.id, owner_id, "direct")
+
+            for dep in dependencies:
+                component_id = f"{dep['name']}:{dep['version']}"
+                if component_id not in graph.components:
+                    if added >= max_components:
+                        continue
+                    added += 1
+                    graph.add_component(SoftwareComponent(
+                        name=dep['name'],
+                        version=dep['version'],
+                        software_type=SoftwareType.LIBRARY,
+                        vendor="Unknown",
+                        description=f"Dependency from {manifest_path}",
+                        criticality_score=5.0
+                    ))
+                graph.add_dependency(owner_id, component_id, "direct")
+                direct.append((dep['name'], dep['version']))
+
+        print(f"Added {added} dependency components")
+        self._add_transitive_dependencies(graph, list(dict.fromkeys(direct)), max_depth,
+                                          max_components - added)
+        return added
+
+    def _add_transitive_dependencies(self, graph: DependencyGraph, direct: List[Tuple[str, str]],
+                                     max_depth: int, max_new_components: int) -> int:
+        """Add the requirements of the direct dependencies below depth 1
+
+        Returns the number of components added, at most max_new_components;
+        edges between components already in the graph are always added.
+        """
+        if self.resolver is None or max_depth < 2 or not direct:
+            return 0
+
+        resolved = self.resolver.resolve(direct, max_depth - 1)
+        added = 0
+        # Breadth-first order, so every parent is in the graph before its requirements
+        for (name, version), requires in resolved.items():
+            parent_id = f"{name}:{version}"
+            if parent_id not in graph.components:
+                continue
+            for child_name, child_version in requires:
+                child_id = f"{child_name}:{child_version}"
+                if child_id == parent_id:
+                    continue
+                if child_id not in graph.components:
+                    if added >= max_new_components:
+                        continue
+                    added += 1
+                    graph.add_component(SoftwareComponent(
+                        name=child_name,
+                        version=child_version,
+                        software_type=SoftwareType.LIBRARY,
+                        vendor="Unknown",
+                        description=f"Transitive dependency via {name}",
+                        criticality_score=5.0
+                    ))
+                graph.add_dependency(parent_id, child_id, "transitive")
+
+        print(f"Resolved {len(resolved)} packages ({self.resolver.memo_hits} memoized, "
+              f"{self.resolver.fetched} fetched), added {added} transitive dependencies")
+        return added
+
+    def _export_results(self, graph: DependencyGraph, analyzer: RiskAnalyzer) -> None:
+        # Outputs are saved by the caller, e.g. through an OutputManager
+        pass
+
+    def analyze_repository(self, max_components: int = 30, max_depth: int = 2) -> Tuple[DependencyGraph, RiskAnalyzer, Dict]:
+        """Complete analysis of the repository"""
+
+        print(f"{self.SOURCE_LABEL} Analysis")
+        print("=" * 50)
+        print(f"Repository: {self.github_url}")
+        print(f"Owner: {self.repo_info['owner']}")
+        print(f"Repo: {self.repo_info['repo']}")
+        print(f"Branch: {self.repo_info['branch']}")
+        print(f"Max components: {max_components}")
+        print(f"Max depth: {max_depth}")
+
+        # Create dependency graph
+        graph = self.create_dependency_graph(max_components, max_depth)
+
+        # Get statistics
+        stats = graph.get_graph_stats()
+        print(f"\nDependency Graph Statistics:")
+        print(f"  Total components: {stats['total_components']}")
+        print(f"  Total dependencies: {stats['total_dependencies']}")
+        print(f"  Applications: {stats['applications']}")
+        print(f"  Libraries: {stats['libraries']}")
+
+        if stats['total_components'] <= 1:
+            print("Insufficient dependencies found for analysis")
+            return graph, None, {}
+
+        # Find critical components
+        critical_components = graph.find_critical_components(min_dependents=1)
+        print(f"\nCritical Components:")
+        for comp_id, dependent_count in critical_components[:5]:
+            component = graph.components[comp_id]
+            impact = graph.calculate_impact_score(comp_id, max_depth=max_depth)
+            print(f"  {component.name}: {dependent_count} dependents, impact: {impact:.1f}")
+
+        # Risk analysis
+        analyzer = RiskAnalyzer(graph)
+        risk_assessment = analyzer.calculate_supply_chain_risk_score()
+
+        print(f"\nRisk Assessment:")
+        print(f"  Overall risk level: {analyzer._categorize_risk_level(risk_assessment['overall_risk_score'])}")
+        print(f"  Risk score: {risk_assessment['overall_risk_score']:.1f}/10")
+        print(f"  High-risk components: {risk_assessment['high_risk_components']}")
+
+        self._export_results(graph, analyzer)
+
+        results = {
+            'repo_info': self.repo_info,
+            'stats': stats,
+            'risk_assessment': risk_assessment,
+            'critical_components': critical_components
+        }
+
+        return graph, analyzer, results
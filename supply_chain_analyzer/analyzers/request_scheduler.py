@@ -0,0 +1,205 @@
+"""
+Rate-limit-aware HTTP request scheduler.
+
+All repository traffic of GitHubDependencyAnalyzer with the same limits goes
+through one shared RequestScheduler, which combines a token bucket (steady request rate), a
+cap on concurrent requests, pooled keep-alive connections per host, and
+bounded retries that back off as instructed by Retry-After and rate-limit
+headers.  Requests that still fail after the retries raise
+RequestFailedError instead of being silently treated as missing files.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Transient server errors worth retrying
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+
+class RequestFailedError(Exception):
+    """A request that still failed after all retries"""
+
+    def __init__(self, url: str, reason: str):
+        super().__init__(f"Request to {url} failed: {reason}")
+        self.url = url
+        self.reason = reason
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def rate_limit_delay(response: requests.Response) -> Optional[float]:
+    """Seconds until an exhausted rate limit resets, from the response headers"""
+    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+    if retry_after is not None:
+        return retry_after
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        reset = response.headers.get("X-RateLimit-Reset")
+        if reset and reset.isdigit():
+            return max(0.0, int(reset) - time.time())
+    return None
+
+
+class RequestScheduler:
+    """Shared gate for HTTP requests: rate limiting, concurrency cap and retries
+
+    Thread-safe. When a server signals a rate limit, all requests through
+    the scheduler pause until it resets, not just the one that hit it.
+    """
+
+    def __init__(self, requests_per_second: Optional[float] = 10.0, burst: Optional[int] = None,
+                 max_concurrency: int = 8, max_retries: int = 3,
+                 backoff_seconds: float = 1.0, max_backoff_seconds: float = 60.0,
+                 timeout_seconds: float = 30, session: Optional[requests.Session] = None):
+        """Create a scheduler
+
+        Args:
+            requests_per_second: Steady request rate (None for no limit)
+            burst: Requests allowed at once before the rate applies
+                (defaults to max_concurrency)
+            max_concurrency: Maximum requests in flight
+            max_retries: Retries after throttling, server errors or connection errors
+            backoff_seconds: First retry delay when the server gives none; doubles per retry
+            max_backoff_seconds: Upper bound for any single wait
+            timeout_seconds: Timeout of every request
+            session: Session to send requests with (defaults to a pooled one)
+        """
+        self.requests_per_second = requests_per_second
+        self.burst = burst if burst is not None else max_concurrency
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.timeout_seconds = timeout_seconds
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=max_concurrency)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._counters = {"requests": 0, "throttled": 0, "retried": 0, "failed": 0}
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Requests sent, throttled responses, retries and requests that failed for good"""
+        with self._lock:
+            return dict(self._counters)
+
+    def _wait_for_turn(self) -> None:
+        """Take a token from the bucket, sleeping until one is due"""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._paused_until - now
+            if self.requests_per_second:
+                elapsed = now - self._last_refill
+                self._tokens = min(self.burst, self._tokens + elapsed * self.requests_per_second)
+                self._last_refill = now
+                # Reserve a token even if it is not there yet; the debt is the wait
+                self._tokens -= 1
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens / self.requests_per_second)
+        if wait > 0:
+            time.sleep(wait)
+
+    def _pause(self, seconds: float) -> None:
+        """Hold back every request through this scheduler for a while"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _backoff(self, attempt: int) -> float:
+        return min(self.max_backoff_seconds, self.backoff_seconds * (2 ** attempt))
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, retrying throttled and transient failures
+
+        Returns the response for any final status other than throttling or
+        a server error (a 404 is returned, not raised).
+        """
+        kwargs.setdefault("timeout", self.timeout_seconds)
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            self._wait_for_turn()
+            self._count("requests")
+            try:
+                with self._slots:
+                    response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if last_attempt:
+                    self._count("failed")
+                    raise RequestFailedError(url, str(e)) from e
+                self._count("retried")
+                time.sleep(self._backoff(attempt))
+                continue
+
+            delay = rate_limit_delay(response)
+            throttled = response.status_code == 429 or (response.status_code == 403 and delay is not None)
+            if throttled:
+                self._count("throttled")
+            elif response.status_code not in RETRY_STATUSES:
+                if delay:
+                    # Budget used up by this response: wait for the reset before the next one
+                    self._pause(min(delay, self.max_backoff_seconds))
+                return response
+
+            if last_attempt:
+                self._count("failed")
+                raise RequestFailedError(url, f"HTTP {response.status_code}")
+            self._count("retried")
+            wait = delay if delay is not None else self._backoff(attempt)
+            self._pause(min(wait, self.max_backoff_seconds))
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+
+# Shared schedulers by the settings they were created from
+_shared_schedulers: Dict[Tuple, RequestScheduler] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_scheduler(settings) -> RequestScheduler:
+    """The process-wide scheduler for GitHub traffic with the limits of GitHubSettings
+
+    Callers with the same limits share one scheduler, and so one rate
+    limit; callers with different limits get their own.
+    """
+    key = (settings.requests_per_second, settings.max_concurrent_requests, settings.max_retries,
+           settings.rate_limit_delay, settings.timeout_seconds)
+    with _shared_lock:
+        scheduler = _shared_schedulers.get(key)
+        if scheduler is None:
+            scheduler = _shared_schedulers[key] = RequestScheduler(
+                requests_per_second=settings.requests_per_second,
+                max_concurrency=settings.max_concurrent_requests,
+                max_retries=settings.max_retries,
+                backoff_seconds=settings.rate_limit_delay,
+                timeout_seconds=settings.timeout_seconds
+            )
+        return scheduler
@@ -5,10 +5,11 @@ This module provides advanced analysis functions and risk metrics calculation
 for dependency graphs and vulnerability propagation simulations.
 """
 
+import copy
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 import numpy as np
 from datetime import datetime, timedelta
 from ..core.dependency_graph import DependencyGraph, SoftwareType, VulnerabilityLevel
@@ -18,99 +19,288 @@ from ..core.output_manager import OutputManager
 class RiskAnalyzer:
     """Advanced risk analysis and metrics calculation for software supply chains"""
 
+    # Risk factor scales used for the component-level risk scores
+    TYPE_RISK = {
+        SoftwareType.APPLICATION: 9,
+        SoftwareType.LIBRARY: 6,
+        SoftwareType.FRAMEWORK: 7,
+        SoftwareType.UTILITY: 5,
+        SoftwareType.OPERATING_SYSTEM: 8,
+        SoftwareType.SERVICE: 8,
+        SoftwareType.DATABASE: 9
+    }
+    SEVERITY_SCORES = {
+        VulnerabilityLevel.CRITICAL: 10,
+        VulnerabilityLevel.HIGH: 7,
+        VulnerabilityLevel.MEDIUM: 4,
+        VulnerabilityLevel.LOW: 1
+    }
+    HIGH_RISK_THRESHOLD = 7.0
+    MAX_DEPENDENCY_RISK = 10
+
     def __init__(self, dependency_graph: DependencyGraph):
         self.graph = dependency_graph
 
-    def calculate_supply_chain_risk_score(self) -> Dict[str, Any]:
-        """Calculate an overall supply chain risk score for the software infrastructure"""
-
-        # Component-level risk factors
-        component_risks = {}
-        for comp_id, component in self.graph.components.items():
-
-            # Base risk from component type and criticality
-            type_risk = {
-                SoftwareType.APPLICATION: 9,
-                SoftwareType.LIBRARY: 6,
-                SoftwareType.FRAMEWORK: 7,
-                SoftwareType.UTILITY: 5,
-                SoftwareType.OPERATING_SYSTEM: 8,
-                SoftwareType.SERVICE: 8,
-                SoftwareType.DATABASE: 9
-            }
-
-            base_risk = type_risk.get(component.software_type, 5)
-            criticality_risk = component.criticality_score
-
-            # Dependency risk (more dependents = higher risk)
-            dependents_count = len(self.graph.get_dependents(comp_id))
-            dependency_risk = min(10, dependents_count)  # Cap at 10
-
-            # Vulnerability risk
-            vuln_risk = 0
-            for vuln_key in self.graph.vulnerabilities:
-                if comp_id in vuln_key:
-                    vuln = self.graph.vulnerabilities[vuln_key]
-                    severity_scores = {
-                        VulnerabilityLevel.CRITICAL: 10,
-                        VulnerabilityLevel.HIGH: 7,
-                        VulnerabilityLevel.MEDIUM: 4,
-                        VulnerabilityLevel.LOW: 1
-                    }
-                    vuln_risk = max(vuln_risk, severity_scores[vuln.severity])
-
-            # Calculate compound risk score (0-100)
-            compound_risk = (base_risk * 0.3 +
-                           criticality_risk * 0.25 +
-                           dependency_risk * 0.25 +
-                           vuln_risk * 0.2)
-
-            component_risks[comp_id] = {
-                'component_name': component.name,
-                'base_risk': base_risk,
-                'criticality_risk': criticality_risk,
-                'dependency_risk': dependency_risk,
-                'vulnerability_risk': vuln_risk,
-                'compound_risk': compound_risk
-            }
-
-        # Overall system risk
-        total_risk = sum(cr['compound_risk'] for cr in component_risks.values())
-        avg_risk = total_risk / len(component_risks) if component_risks else 0
-
-        # High-risk component threshold
-        high_risk_threshold = 7.0
-        high_risk_components = [
-            comp_id for comp_id, risk in component_risks.items()
-            if risk['compound_risk'] >= high_risk_threshold
-        ]
-
+        # Live risk table, kept in sync with the graph's change journal
+        self._component_risks: Optional[Dict[str, Dict[str, Any]]] = None
+        self._change_cursor = 0
+        self._total_risk = 0.0
+        self._high_risk_count = 0
+        self._risk_distribution = {'low': 0, 'medium': 0, 'high': 0, 'critical': 0}
+        self._critical_paths: Optional[List[Dict[str, Any]]] = None
+        self._table_revision = dependency_graph.component_table.revision
+
+        # Results memoized per graph version
+        self._memo: Dict[Tuple, Any] = {}
+        self._memo_version: Optional[int] = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def _memoized(self, key: Tuple, compute) -> Any:
+        """Return the cached result for key at the current graph version, computing it on a miss
+
+        Every call gets its own deep copy, so callers editing a result
+        cannot change what later calls return.
+        """
+        version = self.graph.version
+        if version != self._memo_version:
+            self._memo.clear()
+            self._memo_version = version
+
+        if key in self._memo:
+            self.cache_hits += 1
+            return copy.deepcopy(self._memo[key])
+
+        self.cache_misses += 1
+        value = compute()
+        self._memo[key] = value
+        return copy.deepcopy(value)
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached results, forcing a full recomputation on the next call"""
+        self._memo.clear()
+        self._memo_version = None
+        self._component_risks = None
+        self._critical_paths = None
+
+    def cache_info(self) -> Dict[str, int]:
+        """Memo statistics: hits, misses, cached entries and the graph version they belong to"""
         return {
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'entries': len(self._memo),
+            'graph_version': self._memo_version
+        }
+
+    def calculate_supply_chain_risk_score(self, include_critical_paths: bool = True) -> Dict[str, Any]:
+        """Calculate an overall supply chain risk score for the software infrastructure
+
+        Results are memoized per graph version, so repeated calls on an
+        unchanged graph return an equal assessment without recomputing it.
+
+        The component risk table is kept between calls. Later calls only
+        recompute the components affected by graph changes since the previous
+        call: a new vulnerability affects its component, and a new dependency
+        affects the dependency risk of the dependency and its ancestors.
+
+        Args:
+            include_critical_paths: Also identify critical attack paths, which
+                needs whole-graph impact scores after structural changes
+        """
+        return self._memoized(('risk_score', include_critical_paths),
+                              lambda: self._assess_supply_chain_risk(include_critical_paths))
+
+    def _assess_supply_chain_risk(self, include_critical_paths: bool) -> Dict[str, Any]:
+        """Bring the live risk table up to date and summarize it"""
+        changes, cursor = self.graph.get_changes_since(self._change_cursor)
+        table_revision = self.graph.component_table.revision
+        if self._component_risks is None or table_revision != self._table_revision:
+            # Attribute edits are not journaled, so they need a full pass
+            self._rebuild_component_risks()
+            self._table_revision = table_revision
+        elif changes:
+            self._apply_changes(changes)
+        self._change_cursor = cursor
+
+        if include_critical_paths and self._critical_paths is None:
+            self._critical_paths = self._identify_critical_attack_paths()
+
+        # Copies, so results stay as they were when the live table moves on
+        component_risks = {comp_id: dict(risk) for comp_id, risk in self._component_risks.items()}
+        total_components = len(component_risks)
+        avg_risk = self._total_risk / total_components if total_components else 0
+
+        result = {
             'overall_risk_score': avg_risk,
-            'total_components': len(self.graph.components),
-            'high_risk_components': len(high_risk_components),
-            'high_risk_percentage': (len(high_risk_components) / len(self.graph.components)) * 100,
+            'total_components': total_components,
+            'high_risk_components': self._high_risk_count,
+            'high_risk_percentage': (self._high_risk_count / total_components) * 100,
             'component_risks': component_risks,
-            'risk_distribution': self._calculate_risk_distribution(component_risks),
-            'critical_paths': self._identify_critical_attack_paths()
+            'risk_distribution': dict(self._risk_distribution)
         }
+        if include_critical_paths:
+            result['critical_paths'] = list(self._critical_paths)
+        return result
+
+    # Upper bounds of the low / medium / high risk levels; anything above is critical
+    RISK_LEVELS = ['low', 'medium', 'high', 'critical']
+    RISK_LEVEL_BOUNDS = [3, 6, 8]
+
+    def _risk_columns(self, component_ids: List[str]) -> Dict[str, np.ndarray]:
+        """Compute the risk factors of the given components as arrays, column-wise over the component table"""
+        table = self.graph.component_table
+        rows = np.array([table.rows[comp_id] for comp_id in component_ids], dtype=np.int64)
+
+        # Base risk from component type and criticality
+        base_risk = table.lookup_by_type(self.TYPE_RISK, default=5)[rows].astype(np.int64)
+        criticality_risk = table.criticality_score[rows]
+
+        # Dependency risk (more dependents = higher risk, capped)
+        dependency_risk = np.array([
+            self.graph.count_dependents(comp_id, limit=self.MAX_DEPENDENCY_RISK) for comp_id in component_ids
+        ], dtype=np.int64)
+
+        # Vulnerability risk
+        vuln_risk = np.array([
+            self.SEVERITY_SCORES.get(self.graph.get_max_severity(comp_id), 0) for comp_id in component_ids
+        ], dtype=np.int64)
+
+        # Calculate compound risk score (0-100)
+        compound_risk = (base_risk * 0.3 +
+                         criticality_risk * 0.25 +
+                         dependency_risk * 0.25 +
+                         vuln_risk * 0.2)
 
-    def _calculate_risk_distribution(self, component_risks: Dict[str, Dict]) -> Dict[str, int]:
-        """Calculate distribution of components across risk levels"""
-        distribution = {'low': 0, 'medium': 0, 'high': 0, 'critical': 0}
+        return {
+            'base_risk': base_risk,
+            'criticality_risk': criticality_risk,
+            'dependency_risk': dependency_risk,
+            'vulnerability_risk': vuln_risk,
+            'compound_risk': compound_risk,
+            'risk_level': np.digitize(compound_risk, self.RISK_LEVEL_BOUNDS)
+        }
 
-        for risk_data in component_risks.values():
-            risk_score = risk_data['compound_risk']
-            if risk_score < 3:
-                distribution['low'] += 1
-            elif risk_score < 6:
-                distribution['medium'] += 1
-            elif risk_score < 8:
-                distribution['high'] += 1
-            else:
-                distribution['critical'] += 1
+    def _compute_component_risks(self, component_ids: List[str],
+                                 columns: Dict[str, np.ndarray] = None) -> Dict[str, Dict[str, Any]]:
+        """Compute legacy risk entries for the given components"""
+        if columns is None:
+            columns = self._risk_columns(component_ids)
+
+        names = [self.graph.components[comp_id].name for comp_id in component_ids]
+        values = zip(names,
+                     columns['base_risk'].tolist(),
+                     columns['criticality_risk'].tolist(),
+                     columns['dependency_risk'].tolist(),
+                     columns['vulnerability_risk'].tolist(),
+                     columns['compound_risk'].tolist())
+        return {
+            comp_id: {
+                'component_name': name,
+                'base_risk': base,
+                'criticality_risk': criticality,
+                'dependency_risk': dependency,
+                'vulnerability_risk': vulnerability,
+                'compound_risk': compound
+            }
+            for comp_id, (name, base, criticality, dependency, vulnerability, compound)
+            in zip(component_ids, values)
+        }
 
-        return distribution
+    def calculate_component_risk_frame(self) -> pd.DataFrame:
+        """Component risk factors for every component as a typed DataFrame
+
+        Holds the same numbers as the 'component_risks' entries of
+        calculate_supply_chain_risk_score(), indexed by component id, plus
+        the categorical risk level used for the risk distribution.
+        Memoized per graph version.
+        """
+        return self._memoized(('risk_frame',), self._build_component_risk_frame)
+
+    def _build_component_risk_frame(self) -> pd.DataFrame:
+        component_ids = list(self.graph.components)
+        columns = self._risk_columns(component_ids)
+        frame = pd.DataFrame({
+            'component_name': pd.array([self.graph.components[c].name for c in component_ids], dtype='string'),
+            'base_risk': columns['base_risk'],
+            'criticality_risk': columns['criticality_risk'],
+            'dependency_risk': columns['dependency_risk'],
+            'vulnerability_risk': columns['vulnerability_risk'],
+            'compound_risk': columns['compound_risk'],
+            'risk_level': pd.Categorical.from_codes(columns['risk_level'], categories=self.RISK_LEVELS,
+                                                    ordered=True)
+        }, index=pd.Index(component_ids, name='component_id', dtype='string'))
+        return frame
+
+    def _rebuild_component_risks(self) -> None:
+        """Recompute the whole risk table and its aggregates"""
+        component_ids = list(self.graph.components)
+        columns = self._risk_columns(component_ids)
+        compound_risk = columns['compound_risk']
+
+        self._component_risks = self._compute_component_risks(component_ids, columns)
+        self._total_risk = float(compound_risk.sum())
+        self._high_risk_count = int((compound_risk >= self.HIGH_RISK_THRESHOLD).sum())
+        level_counts = np.bincount(columns['risk_level'], minlength=len(self.RISK_LEVELS))
+        self._risk_distribution = {
+            level: int(count) for level, count in zip(self.RISK_LEVELS, level_counts)
+        }
+        self._critical_paths = None
+
+    def _apply_changes(self, changes: List[Tuple[str, ...]]) -> None:
+        """Recompute the risk entries affected by a batch of graph changes"""
+        affected = set()
+        structure_changed = False
+
+        if any(change[0] == "bulk" for change in changes):
+            self._rebuild_component_risks()
+            return
+
+        for change in changes:
+            kind = change[0]
+            if kind == "vulnerability":
+                affected.add(change[1])
+            elif kind == "component":
+                affected.add(change[1])
+                structure_changed = True
+            elif kind == "dependency":
+                dependency_id = change[1]
+                structure_changed = True
+                # Dependency risk is capped, so saturated ancestors cannot change
+                for comp_id in [dependency_id] + self.graph.get_dependencies(dependency_id):
+                    current = self._component_risks.get(comp_id)
+                    if current is None or current['dependency_risk'] < self.MAX_DEPENDENCY_RISK:
+                        affected.add(comp_id)
+
+        if len(affected) > len(self.graph.components) // 2:
+            self._rebuild_component_risks()
+            return
+
+        for comp_id, risk in self._compute_component_risks(list(affected)).items():
+            previous = self._component_risks.get(comp_id)
+            if previous is not None:
+                self._count_risk(previous, -1)
+            self._component_risks[comp_id] = risk
+            self._count_risk(risk, 1)
+
+        if structure_changed:
+            self._critical_paths = None
+
+    def _count_risk(self, risk: Dict[str, Any], sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) one risk entry from the aggregates"""
+        compound_risk = risk['compound_risk']
+        self._total_risk += sign * compound_risk
+        if compound_risk >= self.HIGH_RISK_THRESHOLD:
+            self._high_risk_count += sign
+        self._risk_distribution[self._risk_level(compound_risk)] += sign
+
+    @classmethod
+    def _risk_level(cls, risk_score: float) -> str:
+        """Distribution bucket of a compound risk score"""
+        return cls.RISK_LEVELS[int(np.digitize(risk_score, cls.RISK_LEVEL_BOUNDS))]
+
+    def _impact_scores(self) -> Dict[str, float]:
+        """Unlimited-depth impact score of every component, memoized per graph version"""
+        return self._memoized(('impact_scores',), self.graph.calculate_all_impact_scores)
 
     def _identify_critical_attack_paths(self) -> List[Dict[str, Any]]:
         """Identify the most critical attack propagation paths"""
@@ -118,8 +308,7 @@ class RiskAnalyzer:
 
         # Find components with high impact potential
         high_impact_components = []
-        for comp_id in self.graph.components:
-            impact_score = self.graph.calculate_impact_score(comp_id)
+        for comp_id, impact_score in self._impact_scores().items():
             if impact_score > 15:  # Threshold for high impact
                 high_impact_components.append((comp_id, impact_score))
 
@@ -411,7 +600,7 @@ class RiskAnalyzer:
 
         # 3. Dependency Network Metrics
         ax3 = axes[0, 2]
-        dependency_counts = [len(self.graph.get_dependents(comp_id))
+        dependency_counts = [self.graph.count_dependents(comp_id)
                            for comp_id in self.graph.components]
 
         ax3.hist(dependency_counts, bins=10, color='lightcoral', alpha=0.7, edgecolor='black')
@@ -480,37 +669,34 @@ class RiskAnalyzer:
                               project_name: str = None) -> str:
         """Export detailed metrics to CSV for further analysis"""
 
-        risk_assessment = self.calculate_supply_chain_risk_score()
-
-        # Prepare data for export
-        export_data = []
-        for comp_id, component in self.graph.components.items():
-            risk_data = risk_assessment['component_risks'][comp_id]
-
-            # Count vulnerabilities for this component
-            vuln_count = len([1 for v_key in self.graph.vulnerabilities.keys()
-                            if comp_id in v_key])
-
-            export_data.append({
-                'component_id': comp_id,
-                'component_name': component.name,
-                'version': component.version,
-                'software_type': component.software_type.value,
-                'vendor': component.vendor,
-                'criticality_score': component.criticality_score,
-                'is_compromised': component.is_compromised,
-                'dependencies_count': len(self.graph.get_dependencies(comp_id)),
-                'dependents_count': len(self.graph.get_dependents(comp_id)),
-                'vulnerability_count': vuln_count,
-                'base_risk': risk_data['base_risk'],
-                'criticality_risk': risk_data['criticality_risk'],
-                'dependency_risk': risk_data['dependency_risk'],
-                'vulnerability_risk': risk_data['vulnerability_risk'],
-                'compound_risk_score': risk_data['compound_risk'],
-                'impact_score': self.graph.calculate_impact_score(comp_id)
-            })
-
-        df = pd.DataFrame(export_data)
+        impact_scores = self._impact_scores()
+        risk_frame = self.calculate_component_risk_frame()
+
+        # Component attributes straight from the columnar component table
+        component_ids = list(risk_frame.index)
+        table = self.graph.component_table
+        rows = np.array([table.rows[comp_id] for comp_id in component_ids], dtype=np.int64)
+        type_values = np.array([software_type.value for software_type in table.software_types], dtype=object)
+
+        df = pd.DataFrame({
+            'component_id': component_ids,
+            'component_name': risk_frame['component_name'].to_numpy(dtype=object),
+            'version': np.array(table.versions.values, dtype=object)[table.version_code[rows]],
+            'software_type': type_values[table.type_code[rows]],
+            'vendor': np.array(table.vendors.values, dtype=object)[table.vendor_code[rows]],
+            'criticality_score': table.criticality_score[rows],
+            'is_compromised': table.is_compromised[rows],
+            'dependencies_count': [self.graph.count_dependencies(comp_id) for comp_id in component_ids],
+            'dependents_count': [self.graph.count_dependents(comp_id) for comp_id in component_ids],
+            'vulnerability_count': [len(self.graph.get_component_vulnerabilities(comp_id))
+                                    for comp_id in component_ids],
+            'base_risk': risk_frame['base_risk'].to_numpy(),
+            'criticality_risk': risk_frame['criticality_risk'].to_numpy(),
+            'dependency_risk': risk_frame['dependency_risk'].to_numpy(),
+            'vulnerability_risk': risk_frame['vulnerability_risk'].to_numpy(),
+            'compound_risk_score': risk_frame['compound_risk'].to_numpy(),
+            'impact_score': [impact_scores[comp_id] for comp_id in component_ids]
+        })
 
         # Use output manager if provided, otherwise use direct filepath
         if output_manager and project_name:
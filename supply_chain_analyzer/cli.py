@@ -10,9 +10,15 @@ import sys
 from pathlib import Path
 from typing import Optional
 
+from .core.dependency_graph import DependencyGraph
+from .core.org_graph import OrgGraph
 from .core.output_manager import OutputManager
+from .analyzers.batch_pipeline import BatchPipeline, read_url_list
+from .analyzers.dependency_resolver import create_resolver
 from .analyzers.github_analyzer import GitHubDependencyAnalyzer
+from .analyzers.local_analyzer import LocalRepositoryAnalyzer
 from .analyzers.risk_analyzer import RiskAnalyzer
+from .config.settings import load_config
 
 
 class SupplyChainCLI:
@@ -34,9 +40,21 @@ Examples:
   # Analyze with custom depth and component limits
   python -m supply_chain_analyzer analyze-github https://github.com/django/django --max-depth 3 --max-components 50
 
+  # Analyze a local checkout without network access
+  python -m supply_chain_analyzer analyze-local ~/src/my-monorepo --ignore "third_party/"
+
+  # Analyze every repository listed in a file, four fetches and two scoring processes at a time
+  python -m supply_chain_analyzer analyze-batch repos.txt --io-workers 4 --cpu-workers 2
+
+  # Run attack scenarios from every component of a saved graph on 8 cores
+  python -m supply_chain_analyzer simulate outputs/graphs/requests_dependencies.json --workers 8 --seed 42
+
   # List all analyzed projects
   python -m supply_chain_analyzer list-projects
 
+  # Rebuild the output catalog after copying or deleting files by hand
+  python -m supply_chain_analyzer reindex
+
   # Clean up old output files
   python -m supply_chain_analyzer cleanup --days 30
             """
@@ -86,6 +104,25 @@ Examples:
             default=30,
             help='Maximum number of components to include (default: 30)'
         )
+        github_parser.add_argument(
+            '--fetch-mode',
+            choices=['files', 'archive'],
+            help='Fetch manifests one file at a time, or all at once from the repository archive'
+        )
+        github_parser.add_argument(
+            '--offline',
+            action='store_true',
+            help='Only use cached repository files, without network access'
+        )
+        github_parser.add_argument(
+            '--no-http-cache',
+            action='store_true',
+            help='Do not read or update the persistent HTTP cache'
+        )
+        github_parser.add_argument(
+            '--package-index',
+            help='Package index (directory or http(s) URL) used to resolve transitive dependencies'
+        )
         github_parser.add_argument(
             '--project-name',
             type=str,
@@ -97,6 +134,178 @@ Examples:
             help='Disable timestamps in output filenames'
         )
 
+        # Local checkout analysis command
+        local_parser = subparsers.add_parser(
+            'analyze-local',
+            help='Analyze a local repository checkout for supply chain risks'
+        )
+        local_parser.add_argument(
+            'path',
+            help='Root directory of the working tree'
+        )
+        local_parser.add_argument(
+            '--max-depth',
+            type=int,
+            default=2,
+            help='Maximum dependency depth to analyze (default: 2)'
+        )
+        local_parser.add_argument(
+            '--max-components',
+            type=int,
+            default=30,
+            help='Maximum number of components to include (default: 30)'
+        )
+        local_parser.add_argument(
+            '--ignore',
+            action='append',
+            dest='ignore_patterns',
+            help='Glob pattern of paths to skip (repeatable; .gitignore is honored too)'
+        )
+        local_parser.add_argument(
+            '--workers',
+            type=int,
+            default=8,
+            help='Threads for manifest discovery and parsing (default: 8)'
+        )
+        local_parser.add_argument(
+            '--package-index',
+            help='Package index (directory or http(s) URL) used to resolve transitive dependencies'
+        )
+        local_parser.add_argument(
+            '--project-name',
+            type=str,
+            help='Custom project name (default: directory name)'
+        )
+        local_parser.add_argument(
+            '--no-timestamp',
+            action='store_true',
+            help='Disable timestamps in output filenames'
+        )
+
+        # Multi-repository batch command
+        batch_parser = subparsers.add_parser(
+            'analyze-batch',
+            help='Analyze many GitHub repositories concurrently'
+        )
+        batch_parser.add_argument(
+            'url_file',
+            help='File with one repository URL per line (# starts a comment)'
+        )
+        batch_parser.add_argument(
+            '--max-depth',
+            type=int,
+            default=2,
+            help='Maximum dependency depth to analyze (default: 2)'
+        )
+        batch_parser.add_argument(
+            '--max-components',
+            type=int,
+            default=30,
+            help='Maximum number of components per repository (default: 30)'
+        )
+        batch_parser.add_argument(
+            '--io-workers',
+            type=int,
+            default=8,
+            help='Repositories fetched and parsed at a time (default: 8)'
+        )
+        batch_parser.add_argument(
+            '--cpu-workers',
+            type=int,
+            default=1,
+            help='Processes scoring repositories; 1 scores in this process (default: 1)'
+        )
+        batch_parser.add_argument(
+            '--queue-size',
+            type=int,
+            default=16,
+            help='Repositories buffered between pipeline stages (default: 16)'
+        )
+        batch_parser.add_argument(
+            '--simulate',
+            action='store_true',
+            help='Also simulate an attack from the most critical component of every repository'
+        )
+        batch_parser.add_argument(
+            '--fetch-mode',
+            choices=['files', 'archive'],
+            help='Fetch manifests one file at a time, or all at once from the repository archive'
+        )
+        batch_parser.add_argument(
+            '--offline',
+            action='store_true',
+            help='Only use cached repository files, without network access'
+        )
+        batch_parser.add_argument(
+            '--no-http-cache',
+            action='store_true',
+            help='Do not read or update the persistent HTTP cache'
+        )
+        batch_parser.add_argument(
+            '--package-index',
+            help='Package index (directory or http(s) URL) used to resolve transitive dependencies'
+        )
+        batch_parser.add_argument(
+            '--no-timestamp',
+            action='store_true',
+            help='Disable timestamps in output filenames'
+        )
+
+        # Attack simulation command
+        simulate_parser = subparsers.add_parser(
+            'simulate',
+            help='Run attack propagation scenarios on a saved dependency graph'
+        )
+        simulate_parser.add_argument(
+            'graph_file',
+            help='Dependency graph JSON file (as written by analyze-github) or snapshot directory'
+        )
+        simulate_parser.add_argument(
+            '--initial-component',
+            action='append',
+            dest='initial_components',
+            help='Component id to start an attack from (repeatable, default: every component)'
+        )
+        simulate_parser.add_argument(
+            '--days',
+            type=int,
+            default=30,
+            help='Number of simulated days per scenario (default: 30)'
+        )
+        simulate_parser.add_argument(
+            '--detection-probability',
+            type=float,
+            default=0.1,
+            help='Daily detection probability per compromised component (default: 0.1)'
+        )
+        simulate_parser.add_argument(
+            '--engine',
+            choices=['daily', 'event'],
+            default='daily',
+            help='Simulation engine: day-by-day loop or next-event queue (default: daily)'
+        )
+        simulate_parser.add_argument(
+            '--patching-race',
+            action='store_true',
+            help='Also run a patching race from the most impactful scenario'
+        )
+        simulate_parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Number of worker processes for the scenarios (default: 1)'
+        )
+        simulate_parser.add_argument(
+            '--seed',
+            type=int,
+            help='Seed for reproducible scenario results'
+        )
+        simulate_parser.add_argument(
+            '--project-name',
+            type=str,
+            help='Project name for the saved report (default: derived from the graph file)'
+        )
+
         # Analysis management commands
         list_parser = subparsers.add_parser(
             'list-projects',
@@ -119,6 +328,11 @@ Examples:
             help='Remove files older than this many days (default: 30)'
         )
 
+        reindex_parser = subparsers.add_parser(
+            'reindex',
+            help='Rebuild the output catalog from the files on disk'
+        )
+
         # Project-specific commands
         project_parser = subparsers.add_parser(
             'project-files',
@@ -151,7 +365,13 @@ Examples:
                 project_name = args.repository_url.split('/')[-1].replace('.git', '')
 
             # Analyze the repository
-            analyzer = GitHubDependencyAnalyzer(args.repository_url)
+            github_settings = load_config().github
+            github_settings.offline = args.offline
+            if args.no_http_cache:
+                github_settings.http_cache = False
+            analyzer = GitHubDependencyAnalyzer(args.repository_url, settings=github_settings,
+                                                fetch_mode=args.fetch_mode,
+                                                resolver=self._create_resolver(args))
             graph, risk_analyzer, results = analyzer.analyze_repository(
                 max_components=args.max_components,
                 max_depth=args.max_depth
@@ -161,66 +381,252 @@ Examples:
                 print("ERROR: Failed to analyze repository")
                 return 1
 
-            # Save organized outputs
-            include_timestamp = not args.no_timestamp
-
-            # Save dependency graph
-            graph_path = graph.export_to_json(
-                output_manager=self.output_manager,
-                project_name=project_name
+            return self._save_analysis_outputs(
+                args, project_name, {"repository_url": args.repository_url},
+                graph, risk_analyzer, results
             )
 
-            # Save risk metrics
-            metrics_path = risk_analyzer.export_metrics_to_csv(
-                output_manager=self.output_manager,
-                project_name=project_name
-            )
+        except Exception as e:
+            print(f"ERROR: Analysis failed - {str(e)}")
+            if args.verbose:
+                import traceback
+                traceback.print_exc()
+            return 1
 
-            # Save comprehensive analysis report
-            report_data = {
-                "project_info": {
-                    "name": project_name,
-                    "repository_url": args.repository_url,
-                    "analysis_parameters": {
-                        "max_depth": args.max_depth,
-                        "max_components": args.max_components
-                    }
-                },
-                "analysis_results": results,
-                "file_outputs": {
-                    "dependency_graph": graph_path,
-                    "risk_metrics": metrics_path
+    def _create_resolver(self, args):
+        """Transitive dependency resolver for --package-index or the configured index, if any"""
+        settings = load_config()
+        index = args.package_index or settings.analysis.package_index
+        if not index:
+            return None
+        return create_resolver(index, use_memo=settings.analysis.resolver_memo,
+                               negative_ttl_seconds=settings.github.negative_cache_ttl_seconds)
+
+    def _save_analysis_outputs(self, args, project_name: str, source_info: dict,
+                               graph, risk_analyzer, results) -> int:
+        """Save graph, metrics, report and summary of an analysis and print their locations"""
+        include_timestamp = not args.no_timestamp
+
+        # Save dependency graph
+        graph_path = graph.export_to_json(
+            output_manager=self.output_manager,
+            project_name=project_name
+        )
+
+        # Save risk metrics
+        metrics_path = risk_analyzer.export_metrics_to_csv(
+            output_manager=self.output_manager,
+            project_name=project_name
+        )
+
+        # Save comprehensive analysis report
+        report_data = {
+            "project_info": {
+                "name": project_name,
+                **source_info,
+                "analysis_parameters": {
+                    "max_depth": args.max_depth,
+                    "max_components": args.max_components
                 }
+            },
+            "analysis_results": results,
+            "file_outputs": {
+                "dependency_graph": graph_path,
+                "risk_metrics": metrics_path
             }
+        }
 
-            report_path = self.output_manager.save_analysis_report(
-                report_data, project_name, include_timestamp
+        report_path = self.output_manager.save_analysis_report(
+            report_data, project_name, include_timestamp
+        )
+
+        # Create project summary
+        summary_path = self.output_manager.create_project_summary(
+            project_name, report_data
+        )
+
+        # Display results
+        print(f"\n=== ANALYSIS COMPLETE ===")
+        print(f"Project: {project_name}")
+        print(f"Components analyzed: {results['stats']['total_components']}")
+        print(f"Risk level: {results['risk_assessment']['overall_risk_score']:.1f}/10")
+
+        print(f"\n=== OUTPUT FILES ===")
+        print(f"Dependency graph: {graph_path}")
+        print(f"Risk metrics: {metrics_path}")
+        print(f"Analysis report: {report_path}")
+        print(f"Project summary: {summary_path}")
+
+        if args.verbose:
+            self._display_detailed_results(results)
+
+        return 0
+
+    def analyze_local_repository(self, args) -> int:
+        """Analyze a local repository checkout"""
+        try:
+            if args.output_dir != 'outputs':
+                self.output_manager = OutputManager(args.output_dir)
+
+            analyzer = LocalRepositoryAnalyzer(args.path, ignore_patterns=args.ignore_patterns,
+                                               max_workers=args.workers,
+                                               resolver=self._create_resolver(args))
+            project_name = args.project_name or analyzer.repo_info['repo']
+
+            graph, risk_analyzer, results = analyzer.analyze_repository(
+                max_components=args.max_components,
+                max_depth=args.max_depth
+            )
+
+            if not graph or not results:
+                print("ERROR: Failed to analyze repository")
+                return 1
+
+            return self._save_analysis_outputs(
+                args, project_name, {"repository_path": str(analyzer.root)},
+                graph, risk_analyzer, results
             )
 
-            # Create project summary
-            summary_path = self.output_manager.create_project_summary(
-                project_name, report_data
+        except Exception as e:
+            print(f"ERROR: Analysis failed - {str(e)}")
+            if args.verbose:
+                import traceback
+                traceback.print_exc()
+            return 1
+
+    def analyze_batch(self, args) -> int:
+        """Analyze the repositories of a URL list through the staged pipeline"""
+        try:
+            if args.output_dir != 'outputs':
+                self.output_manager = OutputManager(args.output_dir)
+
+            urls = read_url_list(args.url_file)
+            if not urls:
+                print(f"ERROR: No repository URLs in {args.url_file}")
+                return 1
+
+            github_settings = load_config().github
+            github_settings.offline = args.offline
+            if args.no_http_cache:
+                github_settings.http_cache = False
+            resolver = self._create_resolver(args)
+
+            def create_analyzer(url):
+                return GitHubDependencyAnalyzer(url, settings=github_settings,
+                                                fetch_mode=args.fetch_mode, resolver=resolver)
+
+            org_graph = OrgGraph()
+            pipeline = BatchPipeline(
+                self.output_manager,
+                max_components=args.max_components,
+                max_depth=args.max_depth,
+                io_workers=args.io_workers,
+                cpu_workers=args.cpu_workers,
+                queue_size=args.queue_size,
+                simulate=args.simulate,
+                include_timestamp=not args.no_timestamp,
+                analyzer_factory=create_analyzer,
+                org_graph=org_graph
             )
+            print(f"Analyzing {len(urls)} repositories")
+            results = pipeline.run(urls)
+            stats = pipeline.stats
+
+            print(f"\n=== BATCH COMPLETE ===")
+            print(f"Repositories: {stats.succeeded} analyzed, {stats.skipped} without dependencies, "
+                  f"{stats.failed} failed")
+            print(f"Elapsed: {stats.elapsed_seconds:.1f}s ({stats.repos_per_minute:.1f} repos/min)")
+            print("Stage time: " + ", ".join(f"{stage} {seconds:.1f}s"
+                                             for stage, seconds in stats.stage_seconds.items()))
+
+            shared = org_graph.shared_components()
+            if shared:
+                print(f"\nMost shared packages:")
+                for component_id, repo_count in shared[:10]:
+                    print(f"  {component_id}: {repo_count} repositories")
+
+            failures = [result for result in results if result.status == "failed"]
+            if failures:
+                print(f"\nFailures:")
+                for result in failures:
+                    print(f"  {result.url} ({result.stage}): {result.error}")
+
+            return 0 if stats.succeeded else 1
+
+        except Exception as e:
+            print(f"ERROR: Batch analysis failed - {str(e)}")
+            if args.verbose:
+                import traceback
+                traceback.print_exc()
+            return 1
 
-            # Display results
-            print(f"\n=== ANALYSIS COMPLETE ===")
-            print(f"Project: {project_name}")
-            print(f"Components analyzed: {results['stats']['total_components']}")
-            print(f"Risk level: {results['risk_assessment']['overall_risk_score']:.1f}/10")
+    def run_simulations(self, args) -> int:
+        """Run attack propagation scenarios on a saved dependency graph"""
+        try:
+            if args.output_dir != 'outputs':
+                self.output_manager = OutputManager(args.output_dir)
 
-            print(f"\n=== OUTPUT FILES ===")
-            print(f"Dependency graph: {graph_path}")
-            print(f"Risk metrics: {metrics_path}")
-            print(f"Analysis report: {report_path}")
-            print(f"Project summary: {summary_path}")
+            if Path(args.graph_file).is_dir():
+                graph = DependencyGraph.load_snapshot(args.graph_file)
+            else:
+                graph = DependencyGraph.load_from_json(args.graph_file)
+            initial_components = args.initial_components or list(graph.components)
+            missing = [comp_id for comp_id in initial_components if comp_id not in graph.components]
+            if missing:
+                print(f"ERROR: Unknown components: {', '.join(missing)}")
+                return 1
+
+            scenarios = [
+                {
+                    'name': comp_id,
+                    'initial_component': comp_id,
+                    'simulation_days': args.days,
+                    'detection_probability': args.detection_probability,
+                    'engine': args.engine
+                }
+                for comp_id in initial_components
+            ]
 
             if args.verbose:
-                self._display_detailed_results(results)
+                print(f"Running {len(scenarios)} scenarios with {args.workers} worker(s)")
 
+            comparison = graph.simulate_multiple_scenarios(
+                scenarios, workers=args.workers, seed=args.seed
+            )
+            report_data = {
+                "graph_file": args.graph_file,
+                "simulation_parameters": {
+                    "simulation_days": args.days,
+                    "detection_probability": args.detection_probability,
+                    "engine": args.engine,
+                    "workers": args.workers,
+                    "seed": args.seed
+                },
+                "scenario_comparison": comparison
+            }
+
+            most_impactful = comparison['summary']['most_impactful']
+            if args.patching_race:
+                report_data["patching_race"] = graph.simulate_patching_race(
+                    scenarios[initial_components.index(most_impactful)],
+                    workers=args.workers,
+                    seed=args.seed
+                )
+
+            project_name = args.project_name or Path(args.graph_file).stem.split('_dependencies')[0]
+            report_path = self.output_manager.save_analysis_report(
+                report_data, f"{project_name}_simulation"
+            )
+
+            print(f"\n=== SIMULATION COMPLETE ===")
+            print(f"Scenarios run: {len(scenarios)}")
+            print(f"Most impactful: {most_impactful}")
+            print(f"Average compromise rate: {comparison['summary']['avg_compromise_rate']:.1f}%")
+            print(f"Simulation report: {report_path}")
             return 0
 
         except Exception as e:
-            print(f"ERROR: Analysis failed - {str(e)}")
+            print(f"ERROR: Simulation failed - {str(e)}")
             if args.verbose:
                 import traceback
                 traceback.print_exc()
@@ -276,6 +682,15 @@ Examples:
         print("Cleanup completed.")
         return 0
 
+    def reindex_outputs(self, args) -> int:
+        """Rebuild the output catalog"""
+        if args.output_dir != 'outputs':
+            self.output_manager = OutputManager(args.output_dir)
+
+        count = self.output_manager.reindex()
+        print(f"Indexed {count} output files in {self.output_manager.base_dir}")
+        return 0
+
     def show_project_files(self, args) -> int:
         """Show files for a specific project"""
         files = self.output_manager.get_project_files(args.project_name)
@@ -322,12 +737,20 @@ Examples:
         # Route to appropriate command handler
         if parsed_args.command == 'analyze-github':
             return self.analyze_github_repository(parsed_args)
+        elif parsed_args.command == 'analyze-local':
+            return self.analyze_local_repository(parsed_args)
+        elif parsed_args.command == 'analyze-batch':
+            return self.analyze_batch(parsed_args)
+        elif parsed_args.command == 'simulate':
+            return self.run_simulations(parsed_args)
         elif parsed_args.command == 'list-projects':
             return self.list_projects(parsed_args)
         elif parsed_args.command == 'status':
             return self.show_status(parsed_args)
         elif parsed_args.command == 'cleanup':
             return self.cleanup_files(parsed_args)
+        elif parsed_args.command == 'reindex':
+            return self.reindex_outputs(parsed_args)
         elif parsed_args.command == 'project-files':
             return self.show_project_files(parsed_args)
         else:
@@ -19,6 +19,8 @@ class AnalysisSettings:
     max_components: int = 30
     include_dev_dependencies: bool = True
     vulnerability_check: bool = True
+    package_index: str = ""
+    resolver_memo: bool = True
 
 
 @dataclass
@@ -50,6 +52,15 @@ class GitHubSettings:
     default_branch_order: list = None
     timeout_seconds: int = 30
     rate_limit_delay: float = 1.0
+    max_concurrent_requests: int = 8
+    requests_per_second: float = 10.0
+    max_retries: int = 3
+    raw_content_url: str = "https://raw.githubusercontent.com"
+    fetch_mode: str = "files"
+    archive_url: str = "https://github.com"
+    http_cache: bool = True
+    negative_cache_ttl_seconds: int = 86400
+    offline: bool = False
 
     def __post_init__(self):
         if self.default_branch_order is None:
@@ -156,7 +167,9 @@ def create_sample_config() -> str:
     "max_depth": 2,
     "max_components": 30,
     "include_dev_dependencies": true,
-    "vulnerability_check": true
+    "vulnerability_check": true,
+    "package_index": "",
+    "resolver_memo": true
   },
   "output": {
     "base_directory": "outputs",
@@ -174,7 +187,16 @@ def create_sample_config() -> str:
   "github": {
     "default_branch_order": ["main", "dev", "master", "develop"],
     "timeout_seconds": 30,
-    "rate_limit_delay": 1.0
+    "rate_limit_delay": 1.0,
+    "max_concurrent_requests": 8,
+    "requests_per_second": 10.0,
+    "max_retries": 3,
+    "raw_content_url": "https://raw.githubusercontent.com",
+    "fetch_mode": "files",
+    "archive_url": "https://github.com",
+    "http_cache": true,
+    "negative_cache_ttl_seconds": 86400,
+    "offline": false
   }
 }"""
 
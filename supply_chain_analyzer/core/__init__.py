@@ -4,6 +4,10 @@ Core modules for dependency graph management and analysis.
 
 from .dependency_graph import DependencyGraph, SoftwareComponent, SoftwareType, Vulnerability, VulnerabilityLevel
 from .output_manager import OutputManager
+from .reachability import ReachabilityIndex
+from .csr_graph import CSRDiGraph
+from .propagation import MonteCarloPropagation
+from .org_graph import ComponentRegistry, OrgGraph
 
 __all__ = [
     'DependencyGraph',
@@ -11,5 +15,10 @@ __all__ = [
     'SoftwareType',
     'Vulnerability',
     'VulnerabilityLevel',
-    'OutputManager'
+    'OutputManager',
+    'ReachabilityIndex',
+    'CSRDiGraph',
+    'MonteCarloPropagation',
+    'ComponentRegistry',
+    'OrgGraph'
 ]
\ No newline at end of file
@@ -0,0 +1,178 @@
+"""
+SQLite catalog of saved analysis outputs.
+
+OutputManager records every file it saves here (project, kind, category,
+path, timestamp, size and content hash), so listing projects and summarizing
+the output tree are indexed queries instead of directory walks.  The catalog
+can be rebuilt from the files on disk with reindex().
+"""
+
+import hashlib
+import re
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+CATALOG_SCHEMA_VERSION = 1
+
+# Visualization types drawn by the library, saved as <project>_<type>.png
+VISUALIZATION_TYPES = ("dependency_graph", "impact_heatmap", "attack_path", "risk_dashboard")
+
+# Output categories (subdirectories of the output tree) and the file name
+# suffix -> kind of the outputs saved in each of them
+CATEGORY_KINDS = {
+    "graphs": {"dependencies": "dependency_graph"},
+    "reports": {"analysis_report": "analysis_report"},
+    "metrics": {"risk_metrics": "risk_metrics", "depth_profile": "depth_profile"},
+    "visualizations": {viz_type: "visualization" for viz_type in VISUALIZATION_TYPES},
+    "snapshots": {"snapshot": "snapshot"}
+}
+
+_TIMESTAMP = r"(?:_\d{8}_\d{6})?"
+
+
+def _file_pattern(suffixes) -> re.Pattern:
+    return re.compile(rf"^(?P<project>.+)_(?P<suffix>{'|'.join(suffixes)}){_TIMESTAMP}(?:\.[\w.]+)?$")
+
+
+_PATTERNS = {category: _file_pattern(kinds) for category, kinds in CATEGORY_KINDS.items()}
+
+
+def parse_output_name(category: str, filename: str) -> Optional[Tuple[str, str]]:
+    """(project, kind) of a file saved by OutputManager, or None if it isn't one"""
+    pattern = _PATTERNS.get(category)
+    if pattern is None:
+        return None
+    match = pattern.match(filename)
+    if match is None:
+        return None
+    return match.group("project"), CATEGORY_KINDS[category][match.group("suffix")]
+
+
+def content_stats(path: Path) -> Tuple[Optional[int], Optional[str]]:
+    """Size and SHA-256 of a file, or of a snapshot directory (hashing its manifest)"""
+    if path.is_dir():
+        size = sum(child.stat().st_size for child in path.iterdir() if child.is_file())
+        path = path / "manifest.json"
+        if not path.exists():
+            return size, None
+    elif path.exists():
+        size = path.stat().st_size
+    else:
+        return None, None
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return size, digest.hexdigest()
+
+
+class OutputCatalog:
+    """Catalog of the outputs under one output directory, stored in SQLite"""
+
+    def __init__(self, db_path: str):
+        self.db_path = Path(db_path).resolve()
+        self.created = not self.db_path.exists()
+        with self._connect() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS outputs (
+                    path TEXT PRIMARY KEY,
+                    project TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    created REAL NOT NULL,  -- Unix timestamp
+                    size INTEGER,
+                    content_hash TEXT
+                );
+                CREATE INDEX IF NOT EXISTS outputs_project ON outputs (project);
+            """)
+            conn.execute(f"PRAGMA user_version = {CATALOG_SCHEMA_VERSION}")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # One short-lived connection per operation keeps the catalog usable from any thread
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def record(self, path: str, project: str, kind: str, category: str) -> None:
+        """Insert or refresh the row of a saved output, keyed by its absolute path"""
+        file_path = Path(path).resolve()
+        size, content_hash = content_stats(file_path)
+        created = file_path.stat().st_mtime if file_path.exists() else time.time()
+        with self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO outputs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                         (str(file_path), project, kind, category, created, size, content_hash))
+
+    def remove_missing(self) -> int:
+        """Drop rows whose output no longer exists and return how many were dropped"""
+        with self._connect() as conn:
+            missing = [(path,) for (path,) in conn.execute("SELECT path FROM outputs")
+                       if not Path(path).exists()]
+            conn.executemany("DELETE FROM outputs WHERE path = ?", missing)
+        return len(missing)
+
+    def reindex(self, base_dir: Path) -> int:
+        """Rebuild the catalog from the files under base_dir and return the row count"""
+        rows = []
+        for category in CATEGORY_KINDS:
+            directory = Path(base_dir) / category
+            if not directory.exists():
+                continue
+            for entry in directory.iterdir():
+                parsed = parse_output_name(category, entry.name)
+                if parsed is None:
+                    continue
+                size, content_hash = content_stats(entry)
+                rows.append((str(entry.resolve()), parsed[0], parsed[1], category,
+                             entry.stat().st_mtime, size, content_hash))
+
+        with self._connect() as conn:
+            conn.execute("DELETE FROM outputs")
+            conn.executemany("INSERT OR REPLACE INTO outputs VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def projects(self) -> List[str]:
+        """All project names, sorted"""
+        with self._connect() as conn:
+            return [project for (project,) in
+                    conn.execute("SELECT DISTINCT project FROM outputs ORDER BY project")]
+
+    def recent_projects(self, limit: int = 5) -> List[str]:
+        """Projects with the most recently saved outputs, oldest first"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT project FROM outputs GROUP BY project ORDER BY MAX(created) DESC, project LIMIT ?",
+                (limit,)
+            ).fetchall()
+        return [project for (project,) in reversed(rows)]
+
+    def project_files(self, project: str) -> Dict[str, List[str]]:
+        """Output paths of one project grouped by category, oldest first"""
+        files = {category: [] for category in CATEGORY_KINDS}
+        with self._connect() as conn:
+            for category, path in conn.execute(
+                    "SELECT category, path FROM outputs WHERE project = ? ORDER BY created, path",
+                    (project,)):
+                files.setdefault(category, []).append(path)
+        return files
+
+    def category_counts(self) -> Dict[str, int]:
+        """Number of outputs in every category"""
+        counts = {category: 0 for category in CATEGORY_KINDS}
+        with self._connect() as conn:
+            for category, count in conn.execute(
+                    "SELECT category, COUNT(*) FROM outputs GROUP BY category"):
+                counts[category] = count
+        return counts
+
+    def count_projects(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(DISTINCT project) FROM outputs").fetchone()[0]
+
@@ -0,0 +1,181 @@
+"""
+Columnar component store.
+
+This module keeps the numeric and categorical attributes of every component
+of a DependencyGraph in parallel NumPy arrays, so graph-wide passes (type
+counts, risk factors, simulation hazards) are vector operations instead of
+Python loops over component objects.  Components write their attribute
+changes through to the table they are registered with.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# Attributes mirrored in the table, written through by SoftwareComponent
+TABLE_ATTRIBUTES = frozenset({
+    "software_type", "vendor", "version", "is_compromised",
+    "patch_time_days", "criticality_score"
+})
+
+
+class StringDictionary:
+    """Dictionary encoding of a string column"""
+
+    def __init__(self):
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def encode(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self._codes[value] = code
+        return code
+
+    def decode(self, code: int) -> str:
+        return self.values[code]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class ComponentTable:
+    """Parallel arrays of component attributes, one row per component id
+
+    Rows follow the insertion order of the graph's components dict; adding a
+    component under an existing id reuses its row. `revision` counts the
+    attribute changes written through by components after they were added,
+    except simulation state (is_compromised).
+    """
+
+    def __init__(self, software_types: List):
+        self.software_types = list(software_types)
+        self._type_codes = {software_type: code for code, software_type in enumerate(self.software_types)}
+
+        self.ids: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self.vendors = StringDictionary()
+        self.versions = StringDictionary()
+
+        self._size = 0
+        self.revision = 0
+        self._criticality = np.zeros(16, dtype=np.float64)
+        self._type_code = np.zeros(16, dtype=np.int8)
+        self._compromised = np.zeros(16, dtype=bool)
+        self._patch_time = np.zeros(16, dtype=np.int32)
+        self._vendor_code = np.zeros(16, dtype=np.int32)
+        self._version_code = np.zeros(16, dtype=np.int32)
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self._criticality)
+        for name in ("_criticality", "_type_code", "_compromised",
+                     "_patch_time", "_vendor_code", "_version_code"):
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:len(column)] = column
+            setattr(self, name, grown)
+
+    def add(self, component) -> int:
+        """Register a component (or replace the one with the same id) and return its row"""
+        row = self.rows.get(component.id)
+        if row is None:
+            if self._size == len(self._criticality):
+                self._grow()
+            row = self._size
+            self._size += 1
+            self.ids.append(component.id)
+            self.rows[component.id] = row
+
+        for attribute in TABLE_ATTRIBUTES:
+            self._write(row, attribute, getattr(component, attribute))
+        return row
+
+    def extend(self, components: List) -> List[int]:
+        """Register many components at once and return their rows"""
+        ids = [component.id for component in components]
+        if len(set(ids)) != len(ids) or any(comp_id in self.rows for comp_id in ids):
+            return [self.add(component) for component in components]
+
+        start = self._size
+        end = start + len(components)
+        while end > len(self._criticality):
+            self._grow()
+
+        self._criticality[start:end] = [c.criticality_score for c in components]
+        self._type_code[start:end] = [self._type_codes[c.software_type] for c in components]
+        self._compromised[start:end] = [c.is_compromised for c in components]
+        self._patch_time[start:end] = [c.patch_time_days for c in components]
+        self._vendor_code[start:end] = [self.vendors.encode(c.vendor) for c in components]
+        self._version_code[start:end] = [self.versions.encode(c.version) for c in components]
+
+        rows = list(range(start, end))
+        self.ids.extend(ids)
+        self.rows.update(zip(ids, rows))
+        self._size = end
+        return rows
+
+    def update(self, row: int, attribute: str, value) -> None:
+        """Write one attribute of one row"""
+        if attribute != "is_compromised":
+            self.revision += 1
+        self._write(row, attribute, value)
+
+    def _write(self, row: int, attribute: str, value) -> None:
+        if attribute == "criticality_score":
+            self._criticality[row] = value
+        elif attribute == "software_type":
+            self._type_code[row] = self._type_codes[value]
+        elif attribute == "is_compromised":
+            self._compromised[row] = value
+        elif attribute == "patch_time_days":
+            self._patch_time[row] = value
+        elif attribute == "vendor":
+            self._vendor_code[row] = self.vendors.encode(value)
+        elif attribute == "version":
+            self._version_code[row] = self.versions.encode(value)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def row_of(self, component_id: str) -> Optional[int]:
+        return self.rows.get(component_id)
+
+    @property
+    def criticality_score(self) -> np.ndarray:
+        return self._criticality[:self._size]
+
+    @property
+    def type_code(self) -> np.ndarray:
+        return self._type_code[:self._size]
+
+    @property
+    def is_compromised(self) -> np.ndarray:
+        return self._compromised[:self._size]
+
+    @property
+    def patch_time_days(self) -> np.ndarray:
+        return self._patch_time[:self._size]
+
+    @property
+    def vendor_code(self) -> np.ndarray:
+        return self._vendor_code[:self._size]
+
+    @property
+    def version_code(self) -> np.ndarray:
+        return self._version_code[:self._size]
+
+    def type_code_of(self, software_type) -> int:
+        return self._type_codes[software_type]
+
+    def type_counts(self) -> Dict:
+        """Number of components of every software type"""
+        counts = np.bincount(self.type_code, minlength=len(self.software_types))
+        return {software_type: int(counts[code]) for code, software_type in enumerate(self.software_types)}
+
+    def lookup_by_type(self, values: Dict, default: float = 0.0) -> np.ndarray:
+        """Map every row's software type through a {SoftwareType: value} dict"""
+        by_code = np.array([values.get(software_type, default) for software_type in self.software_types],
+                           dtype=np.float64)
+        return by_code[self.type_code]
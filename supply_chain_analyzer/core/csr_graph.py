@@ -0,0 +1,312 @@
+"""
+Compact CSR graph backend for very large dependency graphs.
+
+This module provides a directed graph that interns node ids to dense int32
+indices and stores forward and reverse adjacency as CSR NumPy arrays.  It
+implements the subset of the networkx.DiGraph interface DependencyGraph
+relies on, plus vectorized traversals, so graphs with millions of edges fit
+in a fraction of the memory of per-node attribute dicts.
+"""
+
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+
+class CSRDiGraph:
+    """Directed graph over interned string ids with CSR adjacency
+
+    Edges are appended to flat int32 buffers and compiled into sorted,
+    de-duplicated CSR arrays the first time they are queried after a change,
+    so building a graph edge by edge stays cheap.  Adding an existing edge
+    again replaces its dependency type, as with networkx.
+
+    Every compile re-sorts all edges, so this backend is meant for graphs
+    that are built (or bulk loaded) once and then queried many times.
+    Interleaving single-edge inserts with queries, e.g. add_dependency()
+    followed by a reachability or risk refresh each time, recompiles on
+    every query and grows quadratically; use the networkx backend for such
+    incremental workloads, or batch the edges with add_edges_from().
+    """
+
+    def __init__(self):
+        self._ids: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._edge_sources = array("i")
+        self._edge_targets = array("i")
+        self._edge_types = array("b")
+        self._type_names: List[str] = []
+        self._type_codes: Dict[str, int] = {}
+        self._dirty = False
+
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._indices = np.empty(0, dtype=np.int32)
+        self._types = np.empty(0, dtype=np.int8)
+        self._reverse_indptr = np.zeros(1, dtype=np.int64)
+        self._reverse_indices = np.empty(0, dtype=np.int32)
+
+    @classmethod
+    def from_csr(cls, ids: List[str], indptr: np.ndarray, indices: np.ndarray, types: np.ndarray,
+                 type_names: List[str], reverse_indptr: np.ndarray,
+                 reverse_indices: np.ndarray) -> 'CSRDiGraph':
+        """Wrap already compiled CSR arrays, e.g. memory-mapped from a snapshot
+
+        The arrays are used as they are and never written to, so read-only
+        memory maps can be shared between processes. The flat edge buffers
+        are only rebuilt from them if the graph is modified.
+        """
+        graph = cls()
+        graph._ids = list(ids)
+        graph._index = {node: i for i, node in enumerate(graph._ids)}
+        graph._type_names = list(type_names)
+        graph._type_codes = {name: code for code, name in enumerate(graph._type_names)}
+        graph._edge_sources = graph._edge_targets = graph._edge_types = None
+        graph._indptr, graph._indices, graph._types = indptr, indices, types
+        graph._reverse_indptr, graph._reverse_indices = reverse_indptr, reverse_indices
+        return graph
+
+    def _ensure_edge_buffers(self) -> None:
+        """Recreate the flat edge buffers of a graph created by from_csr()"""
+        if self._edge_sources is not None:
+            return
+        sources = np.repeat(np.arange(len(self._indptr) - 1, dtype=np.int32), np.diff(self._indptr))
+        self._edge_sources = array("i", sources.tobytes())
+        self._edge_targets = array("i", np.asarray(self._indices, dtype=np.int32).tobytes())
+        self._edge_types = array("b", np.asarray(self._types, dtype=np.int8).tobytes())
+
+    def _intern(self, node: str) -> int:
+        index = self._index.get(node)
+        if index is None:
+            index = len(self._ids)
+            self._ids.append(node)
+            self._index[node] = index
+            self._dirty = True
+        return index
+
+    def _type_code(self, dependency_type: str) -> int:
+        code = self._type_codes.get(dependency_type)
+        if code is None:
+            code = len(self._type_names)
+            self._type_names.append(dependency_type)
+            self._type_codes[dependency_type] = code
+        return code
+
+    def add_node(self, node: str, **attrs: Any) -> None:
+        """Add a node; attributes are ignored since components hold them"""
+        self._intern(node)
+
+    def add_edge(self, source: str, target: str, dependency_type: str = "direct", **attrs: Any) -> None:
+        """Add an edge source -> target"""
+        self._ensure_edge_buffers()
+        self._edge_sources.append(self._intern(source))
+        self._edge_targets.append(self._intern(target))
+        self._edge_types.append(self._type_code(dependency_type))
+        self._dirty = True
+
+    def add_nodes_from(self, nodes: Iterable) -> None:
+        """Add nodes given as ids or (id, attrs) pairs"""
+        for node in nodes:
+            self._intern(node[0] if isinstance(node, tuple) else node)
+
+    def add_edges_from(self, edges: Iterable[Tuple]) -> None:
+        """Add edges given as (source, target) or (source, target, attrs) tuples"""
+        self._ensure_edge_buffers()
+        index, intern, type_code = self._index, self._intern, self._type_code
+        sources, targets, types = [], [], []
+        for edge in edges:
+            source = index.get(edge[0])
+            target = index.get(edge[1])
+            sources.append(intern(edge[0]) if source is None else source)
+            targets.append(intern(edge[1]) if target is None else target)
+            attrs = edge[2] if len(edge) > 2 else {}
+            types.append(type_code(attrs.get("dependency_type", "direct")))
+        self._edge_sources.extend(sources)
+        self._edge_targets.extend(targets)
+        self._edge_types.extend(types)
+        self._dirty = True
+
+    def add_edge_columns(self, sources: List[str], targets: List[str], dependency_types: List[str]) -> int:
+        """Add edges given as parallel columns, skipping endpoints that are not nodes yet
+
+        Ids are resolved with one vectorized hash lookup, which is much
+        faster than add_edges_from() for large batches. Returns the number
+        of edges added.
+        """
+        if not sources:
+            return 0
+        self._ensure_edge_buffers()
+        node_index = pd.Index(self._ids)
+        source_idx = node_index.get_indexer(sources)
+        target_idx = node_index.get_indexer(targets)
+        type_names, type_idx = np.unique(np.asarray(dependency_types, dtype=object), return_inverse=True)
+        type_map = np.array([self._type_code(name) for name in type_names], dtype=np.int8)
+
+        known = (source_idx >= 0) & (target_idx >= 0)
+        self._edge_sources.frombytes(source_idx[known].astype(np.int32).tobytes())
+        self._edge_targets.frombytes(target_idx[known].astype(np.int32).tobytes())
+        self._edge_types.frombytes(type_map[type_idx.reshape(-1)[known]].tobytes())
+        self._dirty = True
+        return int(known.sum())
+
+    def _compile(self) -> None:
+        """Rebuild the CSR arrays from the edge buffers if they changed"""
+        if not self._dirty:
+            return
+        self._ensure_edge_buffers()
+
+        n = len(self._ids)
+        sources = np.frombuffer(self._edge_sources, dtype=np.int32).astype(np.int64)
+        targets = np.frombuffer(self._edge_targets, dtype=np.int32).astype(np.int64)
+        types = np.frombuffer(self._edge_types, dtype=np.int8)
+
+        # Keep the last occurrence of every (source, target) pair, sorted by key
+        keys = sources * max(n, 1) + targets
+        _, last = np.unique(keys[::-1], return_index=True)
+        keep = len(keys) - 1 - last
+        sources, targets, types = sources[keep], targets[keep], types[keep]
+
+        self._edge_sources = array("i", sources.astype(np.int32).tobytes())
+        self._edge_targets = array("i", targets.astype(np.int32).tobytes())
+        self._edge_types = array("b", types.tobytes())
+
+        self._indices = targets.astype(np.int32)
+        self._types = types.copy()
+        self._indptr = np.concatenate([[0], np.cumsum(np.bincount(sources, minlength=n))])
+
+        reverse_order = np.argsort(targets, kind="stable")
+        self._reverse_indices = sources[reverse_order].astype(np.int32)
+        self._reverse_indptr = np.concatenate([[0], np.cumsum(np.bincount(targets, minlength=n))])
+
+        self._dirty = False
+
+    def __contains__(self, node: Any) -> bool:
+        return node in self._index
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def number_of_nodes(self) -> int:
+        return len(self._ids)
+
+    def number_of_edges(self) -> int:
+        self._compile()
+        return len(self._indices)
+
+    def nodes(self) -> List[str]:
+        """Node ids in insertion order"""
+        return list(self._ids)
+
+    def edges(self, data: bool = False) -> Iterator[Tuple]:
+        """Edges as (source, target) tuples, or (source, target, attrs) with data=True
+
+        Edges are generated one source node at a time, so iterating does not
+        materialize the whole edge list.
+        """
+        self._compile()
+        ids, indptr, indices, types = self._ids, self._indptr, self._indices, self._types
+        for source in range(len(ids)):
+            start, end = indptr[source], indptr[source + 1]
+            if start == end:
+                continue
+            if not data:
+                for target in indices[start:end].tolist():
+                    yield ids[source], ids[target]
+            else:
+                for target, code in zip(indices[start:end].tolist(), types[start:end].tolist()):
+                    yield ids[source], ids[target], {"dependency_type": self._type_names[code]}
+
+    def edge_types(self) -> Tuple[np.ndarray, List[str]]:
+        """Type code of every edge, aligned with csr() indices, and the code -> name list"""
+        self._compile()
+        return self._types, list(self._type_names)
+
+    def has_edge(self, source: str, target: str) -> bool:
+        if source not in self._index or target not in self._index:
+            return False
+        self._compile()
+        i = self._index[source]
+        neighbors = self._indices[self._indptr[i]:self._indptr[i + 1]]
+        position = np.searchsorted(neighbors, self._index[target])
+        return bool(position < len(neighbors) and neighbors[position] == self._index[target])
+
+    def successors(self, node: str) -> Iterator[str]:
+        self._compile()
+        i = self._index[node]
+        return (self._ids[j] for j in self._indices[self._indptr[i]:self._indptr[i + 1]].tolist())
+
+    def predecessors(self, node: str) -> Iterator[str]:
+        self._compile()
+        i = self._index[node]
+        return (self._ids[j] for j in
+                self._reverse_indices[self._reverse_indptr[i]:self._reverse_indptr[i + 1]].tolist())
+
+    def csr(self, reverse: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """(indptr, indices) of the forward or reverse adjacency, indexed like nodes()"""
+        self._compile()
+        if reverse:
+            return self._reverse_indptr, self._reverse_indices
+        return self._indptr, self._indices
+
+    def index_layers(self, node: str, max_depth: Optional[int] = None,
+                     reverse: bool = False) -> List[np.ndarray]:
+        """Node indices first reached at each distance 1, 2, ... from node
+
+        Each step gathers the neighbors of the whole frontier with array
+        operations, so the cost is proportional to the edges scanned.
+        """
+        indptr, indices = self.csr(reverse)
+        visited = np.zeros(len(self._ids), dtype=bool)
+        start = self._index[node]
+        visited[start] = True
+        frontier = np.array([start], dtype=np.int64)
+        layers = []
+
+        while len(frontier) and (max_depth is None or len(layers) < max_depth):
+            starts = indptr[frontier]
+            lengths = indptr[frontier + 1] - starts
+            total = int(lengths.sum())
+            if total == 0:
+                break
+            offsets = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+            neighbors = indices[np.repeat(starts, lengths) + offsets]
+            neighbors = np.unique(neighbors[~visited[neighbors]])
+            if len(neighbors) == 0:
+                break
+            visited[neighbors] = True
+            layers.append(neighbors)
+            frontier = neighbors.astype(np.int64)
+
+        return layers
+
+    def depth_layers(self, node: str, max_depth: Optional[int] = None,
+                     reverse: bool = False) -> List[List[str]]:
+        """Node ids first reached at each distance from node"""
+        return [[self._ids[i] for i in layer.tolist()]
+                for layer in self.index_layers(node, max_depth, reverse)]
+
+    def descendants(self, node: str) -> List[str]:
+        """All nodes reachable from node, excluding node itself"""
+        return [node_id for layer in self.depth_layers(node) for node_id in layer]
+
+    def ancestors(self, node: str) -> List[str]:
+        """All nodes that can reach node, excluding node itself"""
+        return [node_id for layer in self.depth_layers(node, reverse=True) for node_id in layer]
+
+    def count_descendants(self, node: str) -> int:
+        return sum(len(layer) for layer in self.index_layers(node))
+
+    def count_ancestors(self, node: str) -> int:
+        return sum(len(layer) for layer in self.index_layers(node, reverse=True))
+
+    def to_networkx(self) -> nx.DiGraph:
+        """Copy into a networkx.DiGraph, e.g. for layouts and drawing"""
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self._ids)
+        graph.add_edges_from(self.edges(data=True))
+        return graph
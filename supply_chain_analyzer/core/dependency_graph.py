@@ -9,13 +9,21 @@ import networkx as nx
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from datetime import datetime, timedelta
-from typing import Dict, List, Set, Tuple, Optional, Any
+from typing import Dict, Iterable, List, Set, Tuple, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
+import gc
+import heapq
 import json
 import random
 import numpy as np
 
+from .component_table import ComponentTable, TABLE_ATTRIBUTES
+from .csr_graph import CSRDiGraph
+from .json_stream import (JsonStreamWriter, StreamedArray, StreamedMapping,
+                          load_json_file, open_text_output)
+from .reachability import ReachabilityIndex, popcount, weighted_bit_sums, within_depth_bitsets
+
 
 class SoftwareType(Enum):
     """Types of software components"""
@@ -36,21 +44,72 @@ class VulnerabilityLevel(Enum):
     LOW = "low"
 
 
-@dataclass
-class SoftwareComponent:
-    """Represents a software component in the dependency graph"""
-    name: str
-    version: str
-    software_type: SoftwareType
-    vendor: str = ""
-    description: str = ""
-    is_compromised: bool = False
-    compromise_time: Optional[datetime] = None
-    patch_time_days: int = 30  # Average days to patch
-    criticality_score: float = 1.0  # 1-10 scale for component importance
+# Ordering of severities, used to keep track of the worst vulnerability per component
+SEVERITY_RANK = {
+    VulnerabilityLevel.LOW: 0,
+    VulnerabilityLevel.MEDIUM: 1,
+    VulnerabilityLevel.HIGH: 2,
+    VulnerabilityLevel.CRITICAL: 3
+}
 
-    def __post_init__(self):
-        self.id = f"{self.name}:{self.version}"
+
+class SoftwareComponent:
+    """Represents a software component in the dependency graph
+
+    Slotted to keep large graphs small. Once added to a DependencyGraph,
+    changes to the columnar attributes are written through to the graph's
+    ComponentTable.
+    """
+    __slots__ = ("name", "version", "software_type", "vendor", "description",
+                 "is_compromised", "compromise_time", "patch_time_days",
+                 "criticality_score", "id", "_table", "_row")
+
+    def __init__(self, name: str, version: str, software_type: SoftwareType,
+                 vendor: str = "", description: str = "",
+                 is_compromised: bool = False,
+                 compromise_time: Optional[datetime] = None,
+                 patch_time_days: int = 30,  # Average days to patch
+                 criticality_score: float = 1.0):  # 1-10 scale for component importance
+        # Not registered with a table yet, so skip the write-through hook
+        set_attribute = object.__setattr__
+        set_attribute(self, "_table", None)
+        set_attribute(self, "_row", -1)
+        set_attribute(self, "name", name)
+        set_attribute(self, "version", version)
+        set_attribute(self, "software_type", software_type)
+        set_attribute(self, "vendor", vendor)
+        set_attribute(self, "description", description)
+        set_attribute(self, "is_compromised", is_compromised)
+        set_attribute(self, "compromise_time", compromise_time)
+        set_attribute(self, "patch_time_days", patch_time_days)
+        set_attribute(self, "criticality_score", criticality_score)
+        set_attribute(self, "id", f"{name}:{version}")
+
+    def __setattr__(self, attribute: str, value: Any) -> None:
+        object.__setattr__(self, attribute, value)
+        if attribute in TABLE_ATTRIBUTES:
+            table = getattr(self, "_table", None)
+            if table is not None:
+                table.update(self._row, attribute, value)
+
+    def _fields(self) -> Tuple:
+        return (self.name, self.version, self.software_type, self.vendor, self.description,
+                self.is_compromised, self.compromise_time, self.patch_time_days,
+                self.criticality_score)
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"SoftwareComponent(name={self.name!r}, version={self.version!r}, "
+                f"software_type={self.software_type!r}, vendor={self.vendor!r}, "
+                f"description={self.description!r}, is_compromised={self.is_compromised!r}, "
+                f"compromise_time={self.compromise_time!r}, patch_time_days={self.patch_time_days!r}, "
+                f"criticality_score={self.criticality_score!r})")
 
 
 @dataclass
@@ -68,16 +127,68 @@ class Vulnerability:
 class DependencyGraph:
     """Main class for managing software dependency graphs and vulnerability simulation"""
 
-    def __init__(self, name: str = "Software Dependencies"):
+    def __init__(self, name: str = "Software Dependencies", use_reachability_index: bool = False,
+                 backend: str = "networkx"):
+        """Create an empty dependency graph
+
+        Args:
+            name: Display name of the graph
+            use_reachability_index: Maintain a transitive reachability index
+            backend: "networkx" stores a networkx.DiGraph; "csr" stores interned
+                int32 ids and CSR adjacency arrays, for very large graphs that
+                are built in bulk and then queried (edits between queries
+                recompile the arrays, so incremental workloads should stay on
+                networkx)
+        """
+        if backend not in ("networkx", "csr"):
+            raise ValueError(f"Unknown graph backend: {backend}")
+
         self.name = name
-        self.graph = nx.DiGraph()
+        self.backend = backend
+        self.graph = CSRDiGraph() if backend == "csr" else nx.DiGraph()
         self.components: Dict[str, SoftwareComponent] = {}
-        self.vulnerabilities: Dict[str, Vulnerability] = {}
+        self.component_table = ComponentTable(list(SoftwareType))
+        self._vulnerabilities: Dict[str, Vulnerability] = {}
+        self._pending_vulnerabilities: List[Tuple[str, str, Dict[str, Any]]] = []
         self.simulation_log: List[Dict[str, Any]] = []
+        self._component_vulnerabilities: Dict[str, List[Vulnerability]] = {}
+        self._max_severity: Dict[str, VulnerabilityLevel] = {}
+        self._max_exploit_probability: Dict[str, float] = {}
+        self._reachability: Optional[ReachabilityIndex] = None
+        self._changes: List[Tuple[str, ...]] = []
+        self._graph_stats_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+
+        if use_reachability_index:
+            self.enable_reachability_index()
+
+    def enable_reachability_index(self) -> None:
+        """Build a transitive reachability index for fast unlimited-depth queries
+
+        The index is kept up to date by add_component / add_dependency, so
+        get_dependents / get_dependencies without max_depth and the dependent
+        counts become lookups instead of full traversals.
+        """
+        if self._reachability is None:
+            self._reachability = ReachabilityIndex(self.graph)
+
+    def disable_reachability_index(self) -> None:
+        """Drop the reachability index and fall back to per-query traversals"""
+        self._reachability = None
+
+    @property
+    def has_reachability_index(self) -> bool:
+        """Whether a reachability index is currently maintained"""
+        return self._reachability is not None
 
     def add_component(self, component: SoftwareComponent) -> None:
         """Add a software component to the dependency graph"""
+        previous = self.components.get(component.id)
+        if previous is not None and previous is not component:
+            previous._table = None
         self.components[component.id] = component
+        component._row = self.component_table.add(component)
+        component._table = self.component_table
+        self._changes.append(("component", component.id))
         self.graph.add_node(
             component.id,
             name=component.name,
@@ -86,6 +197,67 @@ class DependencyGraph:
             is_compromised=component.is_compromised,
             criticality_score=component.criticality_score
         )
+        if self._reachability is not None:
+            self._reachability.add_node(component.id)
+
+    def add_components(self, components: List[SoftwareComponent]) -> None:
+        """Add many software components at once
+
+        Equivalent to calling add_component() for each, but the component
+        table and the graph nodes are filled in single batched operations.
+        """
+        components = list(components)
+        for component in components:
+            previous = self.components.get(component.id)
+            if previous is not None and previous is not component:
+                previous._table = None
+            self.components[component.id] = component
+
+        rows = self.component_table.extend(components)
+        for component, row in zip(components, rows):
+            component._row = row
+            component._table = self.component_table
+        self._changes.append(("bulk",))
+
+        self.graph.add_nodes_from(
+            (component.id, {
+                "name": component.name,
+                "version": component.version,
+                "software_type": component.software_type.value,
+                "is_compromised": component.is_compromised,
+                "criticality_score": component.criticality_score
+            })
+            for component in components
+        )
+        if self._reachability is not None:
+            for component in components:
+                self._reachability.add_node(component.id)
+
+    def add_dependencies(self, dependencies: Iterable[Tuple[str, str, str]]) -> None:
+        """Add many (dependent_id, dependency_id, dependency_type) relationships at once
+
+        Relationships between unknown components are skipped, as in
+        add_dependency(). A reachability index is rebuilt once at the end.
+        """
+        if self.backend == "csr":
+            dependents, dependency_ids, dependency_types = [], [], []
+            for dependent_id, dependency_id, dependency_type in dependencies:
+                dependents.append(dependent_id)
+                dependency_ids.append(dependency_id)
+                dependency_types.append(dependency_type)
+            # Every csr node is a component, so unknown ids are exactly the unindexed ones
+            self.graph.add_edge_columns(dependency_ids, dependents, dependency_types)
+        else:
+            components = self.components
+            self.graph.add_edges_from(
+                (dependency_id, dependent_id, {"dependency_type": dependency_type})
+                for dependent_id, dependency_id, dependency_type in dependencies
+                if dependent_id in components and dependency_id in components
+            )
+
+        self._changes.append(("bulk",))
+        if self._reachability is not None:
+            self._reachability.rebuild()
 
     def add_dependency(self, dependent_id: str, dependency_id: str,
                       dependency_type: str = "direct") -> None:
@@ -93,17 +265,123 @@ class DependencyGraph:
         if dependent_id in self.components and dependency_id in self.components:
             self.graph.add_edge(dependency_id, dependent_id,
                               dependency_type=dependency_type)
+            if self._reachability is not None:
+                self._reachability.add_edge(dependency_id, dependent_id)
+            self._changes.append(("dependency", dependency_id, dependent_id))
 
     def add_vulnerability(self, component_id: str, vulnerability: Vulnerability) -> None:
         """Add a vulnerability to a specific component"""
         if component_id in self.components:
-            self.vulnerabilities[f"{component_id}:{vulnerability.cve_id}"] = vulnerability
+            self._load_pending_vulnerabilities()
+            self._vulnerabilities[f"{component_id}:{vulnerability.cve_id}"] = vulnerability
+            self._index_vulnerability(component_id, vulnerability)
+            self._changes.append(("vulnerability", component_id))
             # Mark component as potentially compromised
             component = self.components[component_id]
             if not vulnerability.patch_available:
                 component.is_compromised = True
                 component.compromise_time = vulnerability.discovery_date
 
+    @property
+    def vulnerabilities(self) -> Dict[str, Vulnerability]:
+        """All vulnerabilities keyed by "component_id:cve_id" """
+        self._load_pending_vulnerabilities()
+        return self._vulnerabilities
+
+    @vulnerabilities.setter
+    def vulnerabilities(self, vulnerabilities: Dict[str, Vulnerability]) -> None:
+        """Replace all vulnerabilities, rebuilding the per-component index and severity caches"""
+        self._pending_vulnerabilities = []
+        self._vulnerabilities = vulnerabilities
+        self._component_vulnerabilities = {}
+        self._max_severity = {}
+        self._max_exploit_probability = {}
+        for vuln_id, vulnerability in vulnerabilities.items():
+            suffix = f":{vulnerability.cve_id}"
+            component_id = vuln_id[:-len(suffix)] if vuln_id.endswith(suffix) else vuln_id.rsplit(":", 1)[0]
+            self._index_vulnerability(component_id, vulnerability)
+        self._changes.append(("bulk",))
+
+    def _load_pending_vulnerabilities(self) -> None:
+        """Build the vulnerabilities deferred by load_from_json()"""
+        if not self._pending_vulnerabilities:
+            return
+        pending, self._pending_vulnerabilities = self._pending_vulnerabilities, []
+
+        for component_id, vuln_id, vuln_data in pending:
+            vulnerability = Vulnerability(
+                cve_id=vuln_data["cve_id"],
+                severity=VulnerabilityLevel(vuln_data["severity"]),
+                description=vuln_data["description"],
+                affected_versions=vuln_data["affected_versions"],
+                discovery_date=datetime.fromisoformat(vuln_data["discovery_date"]),
+                patch_available=vuln_data.get("patch_available", False),
+                exploit_probability=vuln_data.get("exploit_probability", 0.1)
+            )
+            self._vulnerabilities[vuln_id] = vulnerability
+            self._index_vulnerability(component_id, vulnerability)
+
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever the graph is mutated
+
+        Covers added components, dependencies and vulnerabilities as well as
+        component attribute edits; simulation state (is_compromised,
+        compromise_time) does not count as a change.
+        """
+        return len(self._changes) + self.component_table.revision
+
+    def get_changes_since(self, cursor: int = 0) -> Tuple[List[Tuple[str, ...]], int]:
+        """Get the mutations recorded after a cursor, and the cursor to resume from
+
+        Entries are ("component", component_id), ("vulnerability", component_id)
+        or ("dependency", dependency_id, dependent_id), in the order they were
+        applied; bulk additions are recorded as a single ("bulk",) entry.
+        Direct edits of component attributes are not recorded.
+        """
+        return self._changes[cursor:], len(self._changes)
+
+    def _index_vulnerability(self, component_id: str, vulnerability: Vulnerability) -> None:
+        """Record a vulnerability in the per-component index and severity caches"""
+        indexed = self._component_vulnerabilities.setdefault(component_id, [])
+        replaced = any(v.cve_id == vulnerability.cve_id for v in indexed)
+
+        if replaced:
+            # Same key as an existing advisory: replace it and recompute the caches
+            indexed[:] = [v for v in indexed if v.cve_id != vulnerability.cve_id]
+            indexed.append(vulnerability)
+            self._max_severity[component_id] = max(
+                (v.severity for v in indexed), key=SEVERITY_RANK.__getitem__)
+            self._max_exploit_probability[component_id] = max(
+                v.exploit_probability for v in indexed)
+            return
+
+        indexed.append(vulnerability)
+        current = self._max_severity.get(component_id)
+        if current is None or SEVERITY_RANK[vulnerability.severity] > SEVERITY_RANK[current]:
+            self._max_severity[component_id] = vulnerability.severity
+        self._max_exploit_probability[component_id] = max(
+            self._max_exploit_probability.get(component_id, vulnerability.exploit_probability),
+            vulnerability.exploit_probability
+        )
+
+    def get_component_vulnerabilities(self, component_id: str) -> List[Vulnerability]:
+        """Get all vulnerabilities recorded for a specific component"""
+        self._load_pending_vulnerabilities()
+        return list(self._component_vulnerabilities.get(component_id, []))
+
+    def get_max_severity(self, component_id: str) -> Optional[VulnerabilityLevel]:
+        """Get the highest vulnerability severity of a component (None if it has none)"""
+        if self._pending_vulnerabilities:
+            self._load_pending_vulnerabilities()
+        return self._max_severity.get(component_id)
+
+    def get_max_exploit_probability(self, component_id: str) -> float:
+        """Get the highest exploit probability among a component's vulnerabilities"""
+        if self._pending_vulnerabilities:
+            self._load_pending_vulnerabilities()
+        return self._max_exploit_probability.get(component_id, 0.0)
+
     def get_dependencies(self, component_id: str, direct_only: bool = False, max_depth: int = None) -> List[str]:
         """Get dependencies of a component with configurable depth
 
@@ -120,6 +398,10 @@ class DependencyGraph:
 
         if max_depth is None:
             # Get all transitive dependencies (original behavior)
+            if self._reachability is not None:
+                return self._reachability.ancestors(component_id)
+            if self.backend == "csr":
+                return self.graph.ancestors(component_id)
             return list(nx.ancestors(self.graph, component_id))
         else:
             # Get dependencies up to specified depth
@@ -141,68 +423,113 @@ class DependencyGraph:
 
         if max_depth is None:
             # Get all transitive dependents (original behavior)
+            if self._reachability is not None:
+                return self._reachability.descendants(component_id)
+            if self.backend == "csr":
+                return self.graph.descendants(component_id)
             return list(nx.descendants(self.graph, component_id))
         else:
             # Get dependents up to specified depth
             return self._get_dependents_with_depth(component_id, max_depth)
 
-    def _get_dependencies_with_depth(self, component_id: str, max_depth: int) -> List[str]:
-        """Helper method to get dependencies within specified depth"""
-        if max_depth <= 0:
-            return []
-
-        visited = set()
-        to_visit = [(component_id, 0)]  # (node, current_depth)
-        dependencies = set()
-
-        while to_visit:
-            current_node, depth = to_visit.pop(0)
-
-            if current_node in visited or depth >= max_depth:
-                continue
+    def count_dependencies(self, component_id: str) -> int:
+        """Number of transitive dependencies of a component"""
+        if component_id not in self.graph:
+            return 0
+        if self._reachability is not None:
+            return self._reachability.count_ancestors(component_id)
+        if self.backend == "csr":
+            return self.graph.count_ancestors(component_id)
+        return len(nx.ancestors(self.graph, component_id))
 
-            visited.add(current_node)
+    def count_dependents(self, component_id: str, limit: Optional[int] = None) -> int:
+        """Number of components that transitively depend on a component
 
-            # Get direct dependencies (predecessors)
-            for predecessor in self.graph.predecessors(current_node):
-                if predecessor not in visited:
-                    dependencies.add(predecessor)
-                    if depth + 1 < max_depth:
-                        to_visit.append((predecessor, depth + 1))
+        Args:
+            component_id: The component to analyze
+            limit: Stop counting once this many dependents are found (the
+                result is then min(count, limit))
+        """
+        if component_id not in self.graph:
+            return 0
+        if limit is not None and self._reachability is None:
+            seen = {component_id}
+            to_visit = [component_id]
+            while to_visit:
+                for successor in self.graph.successors(to_visit.pop()):
+                    if successor not in seen:
+                        if len(seen) > limit:
+                            return limit
+                        seen.add(successor)
+                        to_visit.append(successor)
+            return min(len(seen) - 1, limit)
+        if limit is not None:
+            return min(self._reachability.count_descendants(component_id), limit)
+        if self._reachability is not None:
+            return self._reachability.count_descendants(component_id)
+        if self.backend == "csr":
+            return self.graph.count_descendants(component_id)
+        return len(nx.descendants(self.graph, component_id))
+
+    def get_depth_layers(self, component_id: str, max_depth: int, direction: str = "dependents") -> List[List[str]]:
+        """Get components grouped by their shortest distance from a component
+
+        The frontier is expanded one whole level at a time, so a single pass
+        yields every depth from 1 to max_depth; layers[d - 1] holds the
+        components first reached at distance d.
 
-        return list(dependencies)
+        Args:
+            component_id: The component to start from
+            max_depth: Maximum depth to traverse
+            direction: "dependents" (who uses it) or "dependencies" (what it uses)
+        """
+        if direction == "dependents":
+            neighbors = self.graph.successors
+        elif direction == "dependencies":
+            neighbors = self.graph.predecessors
+        else:
+            raise ValueError(f"Unknown traversal direction: {direction}")
 
-    def _get_dependents_with_depth(self, component_id: str, max_depth: int) -> List[str]:
-        """Helper method to get dependents within specified depth"""
-        if max_depth <= 0:
+        if component_id not in self.graph:
             return []
 
-        visited = set()
-        to_visit = [(component_id, 0)]  # (node, current_depth)
-        dependents = set()
+        if self.backend == "csr":
+            return self.graph.depth_layers(component_id, max_depth,
+                                           reverse=direction == "dependencies")
 
-        while to_visit:
-            current_node, depth = to_visit.pop(0)
+        visited = {component_id}
+        frontier = [component_id]
+        layers = []
 
-            if current_node in visited or depth >= max_depth:
-                continue
+        for _ in range(max_depth):
+            next_frontier = []
+            for node in frontier:
+                for neighbor in neighbors(node):
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        next_frontier.append(neighbor)
+            if not next_frontier:
+                break
+            layers.append(next_frontier)
+            frontier = next_frontier
 
-            visited.add(current_node)
+        return layers
 
-            # Get direct dependents (successors)
-            for successor in self.graph.successors(current_node):
-                if successor not in visited:
-                    dependents.add(successor)
-                    if depth + 1 < max_depth:
-                        to_visit.append((successor, depth + 1))
+    def _get_dependencies_with_depth(self, component_id: str, max_depth: int) -> List[str]:
+        """Helper method to get dependencies within specified depth"""
+        layers = self.get_depth_layers(component_id, max_depth, direction="dependencies")
+        return [node for layer in layers for node in layer]
 
-        return list(dependents)
+    def _get_dependents_with_depth(self, component_id: str, max_depth: int) -> List[str]:
+        """Helper method to get dependents within specified depth"""
+        layers = self.get_depth_layers(component_id, max_depth, direction="dependents")
+        return [node for layer in layers for node in layer]
 
     def find_critical_components(self, min_dependents: int = 5) -> List[Tuple[str, int]]:
         """Find components with the most dependents (potential single points of failure)"""
         critical_components = []
         for component_id in self.components:
-            dependent_count = len(self.get_dependents(component_id))
+            dependent_count = self.count_dependents(component_id)
             if dependent_count >= min_dependents:
                 critical_components.append((component_id, dependent_count))
 
@@ -219,7 +546,6 @@ class DependencyGraph:
             return 0.0
 
         component = self.components[component_id]
-        dependents = self.get_dependents(component_id, max_depth=max_depth)
 
         # Base impact from component's own criticality
         impact = component.criticality_score
@@ -230,7 +556,7 @@ class DependencyGraph:
             impact += self._calculate_depth_weighted_impact(component_id, max_depth)
         else:
             # Original behavior - simple weighting
-            for dependent_id in dependents:
+            for dependent_id in self.get_dependents(component_id):
                 if dependent_id in self.components:
                     dependent = self.components[dependent_id]
                     impact += dependent.criticality_score * 0.5  # Transitive impact is reduced
@@ -239,35 +565,107 @@ class DependencyGraph:
 
     def _calculate_depth_weighted_impact(self, component_id: str, max_depth: int) -> float:
         """Calculate impact with depth-based weighting (closer dependencies have higher impact)"""
-        if max_depth <= 0:
-            return 0.0
+        layers = self.get_depth_layers(component_id, max_depth, direction="dependents")
+        return sum(self._layer_impacts(layers))
+
+    def _layer_impacts(self, layers: List[List[str]]) -> List[float]:
+        """Weighted criticality of each dependent layer returned by get_depth_layers()"""
+        impacts = []
+        for depth, layer in enumerate(layers, start=1):
+            # Weight decreases with depth: depth 1 = 0.8, depth 2 = 0.6, etc.
+            depth_weight = max(0.1, 1.0 - depth * 0.2)
+            impacts.append(sum(
+                self.components[node].criticality_score * depth_weight
+                for node in layer if node in self.components
+            ))
+        return impacts
+
+    def calculate_all_impact_scores(self, max_depth: int = None) -> Dict[str, float]:
+        """Calculate calculate_impact_score() for every component at once
+
+        Gives the same numbers as calling calculate_impact_score() per
+        component, but the reachability work is shared: the unlimited mode
+        sums criticality over the reachability bitsets, and the depth-weighted
+        mode grows all frontiers together one level at a time.
 
-        total_impact = 0.0
-        visited = set()
-        to_visit = [(component_id, 0)]  # (node, current_depth)
+        Args:
+            max_depth: Maximum depth for dependent analysis (None for unlimited)
 
-        while to_visit:
-            current_node, depth = to_visit.pop(0)
+        Returns:
+            Dictionary mapping component id to impact score
+        """
+        component_ids = list(self.components)
+        criticality = {comp_id: comp.criticality_score for comp_id, comp in self.components.items()}
 
-            if current_node in visited or depth >= max_depth:
-                continue
+        if max_depth is None:
+            index = self._reachability or ReachabilityIndex(self.graph)
+            dependent_sums = index.descendant_weighted_sums(criticality)
+            return {
+                comp_id: criticality[comp_id] + dependent_sums[comp_id] * 0.5
+                for comp_id in component_ids
+            }
 
-            visited.add(current_node)
+        profile = self.depth_profile_matrix(max_depth, include_impact=True)
+        impacts = profile["impact"].sum(axis=1)
+        return {
+            comp_id: criticality[comp_id] + float(impacts[i])
+            for i, comp_id in enumerate(profile["components"])
+        }
 
-            # Get direct dependents and calculate their weighted impact
-            for successor in self.graph.successors(current_node):
-                if successor not in visited and successor in self.components:
-                    dependent = self.components[successor]
+    def depth_profile_matrix(self, max_depth: int = 10, include_impact: bool = False) -> Dict[str, Any]:
+        """Count dependents at every depth for every component at once
 
-                    # Weight decreases with depth: depth 1 = 0.8, depth 2 = 0.6, etc.
-                    depth_weight = max(0.1, 1.0 - (depth + 1) * 0.2)
-                    weighted_impact = dependent.criticality_score * depth_weight
-                    total_impact += weighted_impact
+        All frontiers grow together one level at a time over bitsets, so the
+        whole graph costs about as much as max_depth propagation steps rather
+        than one traversal per component and depth.
 
-                    if depth + 1 < max_depth:
-                        to_visit.append((successor, depth + 1))
+        Args:
+            max_depth: Deepest level to profile
+            include_impact: Also return the depth-weighted criticality of each level
 
-        return total_impact
+        Returns:
+            Dictionary with the component id order ("components"), the depths
+            (1..max_depth), "counts", a components x depths integer matrix of
+            dependents first reached at each depth, and, if requested,
+            "impact", the matching float matrix whose row sum plus the
+            component's criticality equals calculate_impact_score(max_depth)
+        """
+        if max_depth < 0:
+            raise ValueError("max_depth must be non-negative")
+
+        component_ids = list(self.components)
+        positions = {comp_id: i for i, comp_id in enumerate(component_ids)}
+        successors = [
+            [positions[s] for s in self.graph.successors(comp_id) if s in positions]
+            for comp_id in component_ids
+        ]
+        weights = np.array([self.components[comp_id].criticality_score for comp_id in component_ids],
+                           dtype=np.float64)
+
+        counts = np.zeros((len(component_ids), max_depth), dtype=np.int64)
+        impact = np.zeros((len(component_ids), max_depth), dtype=np.float64) if include_impact else None
+
+        previous_counts = np.ones(len(component_ids), dtype=np.int64)  # distance 0 is the component itself
+        previous_sums = weights.copy()
+        for depth, within in enumerate(within_depth_bitsets(successors, max_depth), start=1):
+            level_counts = np.array([popcount(bits) for bits in within], dtype=np.int64)
+            counts[:, depth - 1] = level_counts - previous_counts
+            previous_counts = level_counts
+
+            if include_impact:
+                sums = weighted_bit_sums(within, weights)
+                depth_weight = max(0.1, 1.0 - depth * 0.2)
+                impact[:, depth - 1] = (sums - previous_sums) * depth_weight
+                previous_sums = sums
+
+        profile = {
+            "components": component_ids,
+            "depths": list(range(1, max_depth + 1)),
+            "counts": counts
+        }
+        if include_impact:
+            profile["impact"] = impact
+        return profile
 
     def analyze_dependency_depth(self, component_id: str, max_depth: int = 5) -> Dict[str, Any]:
         """Analyze dependency relationships at different depths
@@ -293,11 +691,22 @@ class DependencyGraph:
             "summary": {}
         }
 
+        # One layered traversal per direction serves every depth level
+        dependency_layers = self.get_depth_layers(component_id, max_depth, direction="dependencies")
+        dependent_layers = self.get_depth_layers(component_id, max_depth, direction="dependents")
+        layer_impacts = self._layer_impacts(dependent_layers)
+
+        dependencies: List[str] = []
+        dependents: List[str] = []
+        impact = component.criticality_score
+
         # Analyze dependencies at each depth level
         for depth in range(1, max_depth + 1):
-            dependencies = self.get_dependencies(component_id, max_depth=depth)
-            dependents = self.get_dependents(component_id, max_depth=depth)
-            impact = self.calculate_impact_score(component_id, max_depth=depth)
+            if depth <= len(dependency_layers):
+                dependencies = dependencies + dependency_layers[depth - 1]
+            if depth <= len(dependent_layers):
+                dependents = dependents + dependent_layers[depth - 1]
+                impact += layer_impacts[depth - 1]
 
             analysis["dependencies_by_depth"][str(depth)] = {
                 "count": len(dependencies),
@@ -331,97 +740,170 @@ class DependencyGraph:
 
     def get_graph_stats(self, max_depth: int = None) -> Dict[str, Any]:
         """Get basic statistics about the dependency graph"""
+        type_counts = self.component_table.type_counts()
         return {
             "total_components": len(self.components),
             "total_dependencies": self.graph.number_of_edges(),
-            "applications": len([c for c in self.components.values()
-                               if c.software_type == SoftwareType.APPLICATION]),
-            "libraries": len([c for c in self.components.values()
-                            if c.software_type == SoftwareType.LIBRARY]),
-            "services": len([c for c in self.components.values()
-                           if c.software_type == SoftwareType.SERVICE]),
-            "compromised_components": len([c for c in self.components.values()
-                                         if c.is_compromised]),
+            "applications": type_counts[SoftwareType.APPLICATION],
+            "libraries": type_counts[SoftwareType.LIBRARY],
+            "services": type_counts[SoftwareType.SERVICE],
+            "compromised_components": int(self.component_table.is_compromised.sum()),
             "average_dependencies_per_component": (
-                sum(len(self.get_dependencies(c_id)) for c_id in self.components) /
+                sum(self.count_dependencies(c_id) for c_id in self.components) /
                 len(self.components) if self.components else 0
             ),
             "critical_components": len(self.find_critical_components())
         }
 
-    def export_to_json(self, filepath: str = None, output_manager=None, project_name: str = None) -> str:
-        """Export dependency graph to JSON format with organized output management"""
-        export_data = {
-            "name": self.name,
-            "export_timestamp": datetime.now().isoformat(),
-            "components": {
-                comp_id: {
-                    "name": comp.name,
-                    "version": comp.version,
-                    "software_type": comp.software_type.value,
-                    "vendor": comp.vendor,
-                    "description": comp.description,
-                    "is_compromised": comp.is_compromised,
-                    "compromise_time": comp.compromise_time.isoformat() if comp.compromise_time else None,
-                    "patch_time_days": comp.patch_time_days,
-                    "criticality_score": comp.criticality_score
-                }
-                for comp_id, comp in self.components.items()
-            },
-            "dependencies": [
-                {
-                    "from": edge[0],
-                    "to": edge[1],
-                    "type": self.graph.edges[edge].get("dependency_type", "direct")
-                }
-                for edge in self.graph.edges()
-            ],
-            "vulnerabilities": {
-                vuln_id: {
-                    "cve_id": vuln.cve_id,
-                    "severity": vuln.severity.value,
-                    "description": vuln.description,
-                    "affected_versions": vuln.affected_versions,
-                    "discovery_date": vuln.discovery_date.isoformat(),
-                    "patch_available": vuln.patch_available,
-                    "exploit_probability": vuln.exploit_probability
-                }
-                for vuln_id, vuln in self.vulnerabilities.items()
-            },
-            "graph_statistics": self.get_graph_stats()
-        }
+    def get_cached_graph_stats(self) -> Dict[str, Any]:
+        """get_graph_stats(), recomputed only when the graph version changed"""
+        if self._graph_stats_cache is None or self._graph_stats_cache[0] != self.version:
+            self._graph_stats_cache = (self.version, self.get_graph_stats())
+        return self._graph_stats_cache[1]
+
+    def _export_fields(self, statistics: str):
+        """Top-level members of the JSON export, with the large ones produced lazily"""
+        yield "name", self.name
+        yield "export_timestamp", datetime.now().isoformat()
+        yield "components", StreamedMapping(
+            (comp_id, {
+                "name": comp.name,
+                "version": comp.version,
+                "software_type": comp.software_type.value,
+                "vendor": comp.vendor,
+                "description": comp.description,
+                "is_compromised": comp.is_compromised,
+                "compromise_time": comp.compromise_time.isoformat() if comp.compromise_time else None,
+                "patch_time_days": comp.patch_time_days,
+                "criticality_score": comp.criticality_score
+            })
+            for comp_id, comp in self.components.items()
+        )
+        yield "dependencies", StreamedArray(
+            {
+                "from": source,
+                "to": target,
+                "type": edge_data.get("dependency_type", "direct")
+            }
+            for source, target, edge_data in self.graph.edges(data=True)
+        )
+        yield "vulnerabilities", StreamedMapping(
+            (vuln_id, {
+                "cve_id": vuln.cve_id,
+                "severity": vuln.severity.value,
+                "description": vuln.description,
+                "affected_versions": vuln.affected_versions,
+                "discovery_date": vuln.discovery_date.isoformat(),
+                "patch_available": vuln.patch_available,
+                "exploit_probability": vuln.exploit_probability
+            })
+            for vuln_id, vuln in self.vulnerabilities.items()
+        )
+        if statistics == "compute":
+            yield "graph_statistics", self.get_graph_stats()
+        elif statistics == "cached":
+            yield "graph_statistics", self.get_cached_graph_stats()
+
+    def export_to_json(self, filepath: str = None, output_manager=None, project_name: str = None,
+                       compact: bool = False, compress: bool = False,
+                       statistics: str = "compute") -> str:
+        """Export dependency graph to JSON format with organized output management
+
+        Components, dependencies and vulnerabilities are streamed to the file
+        one entry at a time, so memory stays bounded for very large graphs.
+
+        Args:
+            filepath: Destination file (used when no output manager is given)
+            output_manager: OutputManager choosing the destination under graphs/
+            project_name: Project name for the output manager file name
+            compact: Write without indentation or spaces
+            compress: Gzip the output (load_from_json reads it transparently)
+            statistics: "compute" recomputes graph statistics, "cached" reuses
+                them while the graph is unchanged, "skip" leaves them out
+        """
+        if statistics not in ("compute", "cached", "skip"):
+            raise ValueError(f"Unknown statistics mode: {statistics}")
 
         # Use output manager if provided, otherwise use direct filepath
         if output_manager and project_name:
-            saved_path = output_manager.save_dependency_graph(export_data, project_name)
-            return saved_path
-        elif filepath:
-            with open(filepath, 'w') as f:
-                json.dump(export_data, f, indent=2)
-            return filepath
-        else:
+            filepath = output_manager.get_dependency_graph_path(project_name, compress=compress)
+        elif not filepath:
             raise ValueError("Either output_manager+project_name or filepath must be provided")
 
+        with open_text_output(filepath, compress) as f:
+            JsonStreamWriter(f, indent=None if compact else 2).write_object(self._export_fields(statistics))
+        if output_manager and project_name:
+            output_manager.record_output(filepath, project_name, "dependency_graph")
+        return str(filepath)
+
+    def save_snapshot(self, directory: str = None, output_manager=None,
+                      project_name: str = None) -> str:
+        """Save the graph as a memory-mappable binary snapshot directory
+
+        Args:
+            directory: Destination directory (used when no output manager is given)
+            output_manager: OutputManager choosing the destination under snapshots/
+            project_name: Project name for the output manager directory name
+        """
+        from .snapshot import save_snapshot
+
+        if output_manager and project_name:
+            directory = output_manager.get_snapshot_path(project_name)
+        elif not directory:
+            raise ValueError("Either output_manager+project_name or directory must be provided")
+
+        directory = save_snapshot(self, directory)
+        if output_manager and project_name:
+            output_manager.record_output(directory, project_name, "snapshot")
+        return directory
+
+    @classmethod
+    def load_snapshot(cls, directory: str, backend: str = "csr", mmap: bool = True) -> 'DependencyGraph':
+        """Open a snapshot written by save_snapshot()
+
+        Args:
+            directory: Snapshot directory
+            backend: Graph backend; with "csr" the adjacency arrays stay
+                memory-mapped and are shared read-only between processes
+            mmap: Memory-map the arrays instead of reading them into memory
+        """
+        from .snapshot import load_snapshot
+
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return load_snapshot(directory, backend=backend, mmap=mmap)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    def as_networkx(self) -> nx.DiGraph:
+        """The dependency structure as a networkx.DiGraph (copied for the csr backend)"""
+        if self.backend == "csr":
+            return self.graph.to_networkx()
+        return self.graph
+
     def visualize_graph(self, output_file: str = None, highlight_compromised: bool = True,
                        show_criticality: bool = True, layout: str = "spring") -> None:
         """Visualize the dependency graph with different layouts and highlighting"""
         plt.figure(figsize=(12, 8))
+        graph = self.as_networkx()
 
         # Choose layout
         if layout == "spring":
-            pos = nx.spring_layout(self.graph, k=1, iterations=50)
+            pos = nx.spring_layout(graph, k=1, iterations=50)
         elif layout == "circular":
-            pos = nx.circular_layout(self.graph)
+            pos = nx.circular_layout(graph)
         elif layout == "hierarchical":
-            pos = nx.nx_agraph.graphviz_layout(self.graph, prog='dot')
+            pos = nx.nx_agraph.graphviz_layout(graph, prog='dot')
         else:
-            pos = nx.spring_layout(self.graph)
+            pos = nx.spring_layout(graph)
 
         # Color nodes based on software type and compromise status
         node_colors = []
         node_sizes = []
 
-        for node_id in self.graph.nodes():
+        for node_id in graph.nodes():
             component = self.components[node_id]
 
             # Base color by software type
@@ -452,11 +934,11 @@ class DependencyGraph:
             node_sizes.append(size)
 
         # Draw the graph
-        nx.draw(self.graph, pos,
+        nx.draw(graph, pos,
                 node_color=node_colors,
                 node_size=node_sizes,
                 with_labels=True,
-                labels={node: self.components[node].name for node in self.graph.nodes()},
+                labels={node: self.components[node].name for node in graph.nodes()},
                 font_size=8,
                 font_weight='bold',
                 arrows=True,
@@ -489,8 +971,9 @@ class DependencyGraph:
     def create_impact_heatmap(self, output_file: str = None) -> None:
         """Create a heatmap showing potential impact of compromising each component"""
         components = list(self.components.keys())
-        impact_scores = [self.calculate_impact_score(comp_id) for comp_id in components]
-        dependent_counts = [len(self.get_dependents(comp_id)) for comp_id in components]
+        all_impacts = self.calculate_all_impact_scores()
+        impact_scores = [all_impacts[comp_id] for comp_id in components]
+        dependent_counts = [self.count_dependents(comp_id) for comp_id in components]
 
         plt.figure(figsize=(10, 6))
 
@@ -527,11 +1010,12 @@ class DependencyGraph:
         affected_components = self.get_dependents(source_component)
 
         # Create position layout
-        pos = nx.spring_layout(self.graph, k=1, iterations=50)
+        graph = self.as_networkx()
+        pos = nx.spring_layout(graph, k=1, iterations=50)
 
         # Color nodes based on their relationship to the attack source
         node_colors = []
-        for node_id in self.graph.nodes():
+        for node_id in graph.nodes():
             if node_id == source_component:
                 node_colors.append('#E74C3C')  # Red for attack source
             elif node_id in affected_components:
@@ -540,11 +1024,11 @@ class DependencyGraph:
                 node_colors.append('#95A5A6')  # Gray for unaffected
 
         # Draw the graph
-        nx.draw(self.graph, pos,
+        nx.draw(graph, pos,
                 node_color=node_colors,
                 node_size=500,
                 with_labels=True,
-                labels={node: self.components[node].name for node in self.graph.nodes()},
+                labels={node: self.components[node].name for node in graph.nodes()},
                 font_size=8,
                 font_weight='bold',
                 arrows=True,
@@ -556,14 +1040,14 @@ class DependencyGraph:
         attack_edges = []
         for affected in affected_components:
             try:
-                path = nx.shortest_path(self.graph, source_component, affected)
+                path = nx.shortest_path(graph, source_component, affected)
                 for i in range(len(path) - 1):
                     attack_edges.append((path[i], path[i + 1]))
             except nx.NetworkXNoPath:
                 continue
 
         if attack_edges:
-            nx.draw_networkx_edges(self.graph, pos, edgelist=attack_edges,
+            nx.draw_networkx_edges(graph, pos, edgelist=attack_edges,
                                  edge_color='red', width=3, alpha=0.8, arrows=True)
 
         # Create legend
@@ -584,55 +1068,113 @@ class DependencyGraph:
             plt.show()
 
     @classmethod
-    def load_from_json(cls, filepath: str) -> 'DependencyGraph':
-        """Load dependency graph from JSON format"""
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+    def load_from_json(cls, filepath: str, backend: str = "networkx",
+                       defer_vulnerabilities: bool = True) -> 'DependencyGraph':
+        """Load dependency graph from JSON format (plain or gzip-compressed)
+
+        Components and dependencies are added in bulk. Vulnerabilities are
+        kept as raw records and only built (with their dates parsed) on first
+        access, except that unpatched ones mark their component compromised
+        right away, as add_vulnerability() does.
+
+        Args:
+            filepath: File written by export_to_json()
+            backend: Graph backend, see DependencyGraph()
+            defer_vulnerabilities: Build vulnerabilities lazily on first access
+        """
+        # Building this many objects would otherwise trigger repeated full GC passes
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return cls._load_from_data(load_json_file(filepath), backend, defer_vulnerabilities)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
 
-        graph = cls(data["name"])
+    @classmethod
+    def _load_from_data(cls, data: Dict[str, Any], backend: str,
+                        defer_vulnerabilities: bool) -> 'DependencyGraph':
+        graph = cls(data["name"], backend=backend)
 
         # Load components
-        for comp_id, comp_data in data["components"].items():
-            component = SoftwareComponent(
+        parse_date = datetime.fromisoformat
+        software_types = {software_type.value: software_type for software_type in SoftwareType}
+        graph.add_components([
+            SoftwareComponent(
                 name=comp_data["name"],
                 version=comp_data["version"],
-                software_type=SoftwareType(comp_data["software_type"]),
+                software_type=software_types[comp_data["software_type"]],
                 vendor=comp_data.get("vendor", ""),
                 description=comp_data.get("description", ""),
                 is_compromised=comp_data.get("is_compromised", False),
-                compromise_time=datetime.fromisoformat(comp_data["compromise_time"])
+                compromise_time=parse_date(comp_data["compromise_time"])
                               if comp_data.get("compromise_time") else None,
                 patch_time_days=comp_data.get("patch_time_days", 30),
                 criticality_score=comp_data.get("criticality_score", 1.0)
             )
-            graph.add_component(component)
+            for comp_data in data["components"].values()
+        ])
 
         # Load dependencies
-        for dep in data["dependencies"]:
-            graph.add_dependency(dep["to"], dep["from"], dep.get("type", "direct"))
+        graph.add_dependencies(
+            (dep["to"], dep["from"], dep.get("type", "direct")) for dep in data["dependencies"]
+        )
 
-        # Load vulnerabilities
+        # Load vulnerabilities, keyed by "component_id:cve_id"
+        pending = []
         for vuln_id, vuln_data in data["vulnerabilities"].items():
-            component_id = vuln_id.split(":")[0] + ":" + vuln_id.split(":")[1]
-            vulnerability = Vulnerability(
-                cve_id=vuln_data["cve_id"],
-                severity=VulnerabilityLevel(vuln_data["severity"]),
-                description=vuln_data["description"],
-                affected_versions=vuln_data["affected_versions"],
-                discovery_date=datetime.fromisoformat(vuln_data["discovery_date"]),
-                patch_available=vuln_data.get("patch_available", False),
-                exploit_probability=vuln_data.get("exploit_probability", 0.1)
-            )
-            graph.add_vulnerability(component_id, vulnerability)
+            suffix = ":" + vuln_data["cve_id"]
+            if vuln_id.endswith(suffix):
+                component_id = vuln_id[:-len(suffix)]
+            else:
+                component_id = vuln_id.split(":")[0] + ":" + vuln_id.split(":")[1]
+
+            component = graph.components.get(component_id)
+            if component is None:
+                continue
+            pending.append((component_id, vuln_id, vuln_data))
+
+            # Mark component as potentially compromised
+            if not vuln_data.get("patch_available", False):
+                component.is_compromised = True
+                component.compromise_time = parse_date(vuln_data["discovery_date"])
+
+        graph._pending_vulnerabilities = pending
+        if not defer_vulnerabilities:
+            graph._load_pending_vulnerabilities()
 
         return graph
 
     def simulate_attack_propagation(self, initial_compromise: str,
                                   simulation_days: int = 30,
-                                  detection_probability: float = 0.1) -> Dict[str, Any]:
-        """Simulate how a vulnerability propagates through the dependency graph over time"""
+                                  detection_probability: float = 0.1,
+                                  rng: Optional[random.Random] = None,
+                                  start_time: Optional[datetime] = None,
+                                  engine: str = "daily") -> Dict[str, Any]:
+        """Simulate how a vulnerability propagates through the dependency graph over time
+
+        Args:
+            initial_compromise: The component where the attack starts
+            simulation_days: Number of simulated days
+            detection_probability: Daily probability of detecting a compromised component
+            rng: Random generator to draw from (defaults to the global random module)
+            start_time: Date of day 0 (defaults to now)
+            engine: "daily" steps through every day; "event" samples each edge's
+                time to compromise directly and processes compromises in time
+                order, so its cost scales with the number of events instead
+                of days x compromised components
+        """
         if initial_compromise not in self.components:
             raise ValueError(f"Component {initial_compromise} not found")
+        if engine not in ("daily", "event"):
+            raise ValueError(f"Unknown simulation engine: {engine}")
+
+        rng = rng or random
+        if engine == "event":
+            return self._simulate_attack_propagation_events(
+                initial_compromise, simulation_days, detection_probability,
+                rng, start_time or datetime.now()
+            )
 
         # Reset simulation state
         for component in self.components.values():
@@ -640,21 +1182,22 @@ class DependencyGraph:
             component.compromise_time = None
 
         # Initialize the attack
-        start_time = datetime.now()
+        start_time = start_time or datetime.now()
         self.components[initial_compromise].is_compromised = True
         self.components[initial_compromise].compromise_time = start_time
 
         compromised_timeline = []
         detection_events = []
 
-        # Track which components are compromised over time
-        current_compromised = {initial_compromise}
+        # Track which components are compromised over time (insertion-ordered
+        # so that a seeded run draws the same numbers in every process)
+        current_compromised = dict.fromkeys([initial_compromise])
 
         for day in range(simulation_days):
             current_date = start_time + timedelta(days=day)
 
             # Check for new compromises from existing ones
-            new_compromises = set()
+            new_compromises = {}
 
             for comp_id in list(current_compromised):
                 component = self.components[comp_id]
@@ -679,16 +1222,12 @@ class DependencyGraph:
                         criticality_factor = dependent.criticality_score / 10.0
 
                         # Vulnerability-specific factors
-                        vuln_factor = 1.0
-                        for vuln_key in self.vulnerabilities:
-                            if dependent_id in vuln_key:
-                                vuln = self.vulnerabilities[vuln_key]
-                                vuln_factor = max(vuln_factor, vuln.exploit_probability)
+                        vuln_factor = max(1.0, self.get_max_exploit_probability(dependent_id))
 
                         compromise_probability = base_probability * time_factor * criticality_factor * vuln_factor
 
-                        if random.random() < compromise_probability:
-                            new_compromises.add(dependent_id)
+                        if rng.random() < compromise_probability:
+                            new_compromises[dependent_id] = None
                             dependent.is_compromised = True
                             dependent.compromise_time = current_date
 
@@ -706,7 +1245,7 @@ class DependencyGraph:
             # Check for detection events
             for comp_id in current_compromised:
                 component = self.components[comp_id]
-                if random.random() < detection_probability:
+                if rng.random() < detection_probability:
                     detection_events.append({
                         'day': day,
                         'date': current_date.isoformat(),
@@ -735,21 +1274,164 @@ class DependencyGraph:
             'final_compromised_components': list(current_compromised)
         }
 
-    def simulate_multiple_scenarios(self, scenarios: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Run multiple attack scenarios and compare results"""
-        results = {}
+    def _simulate_attack_propagation_events(self, initial_compromise: str,
+                                            simulation_days: int,
+                                            detection_probability: float,
+                                            rng, start_time: datetime) -> Dict[str, Any]:
+        """Next-event implementation of simulate_attack_propagation()
+
+        When a component is compromised, every edge to a clean dependent draws
+        the day it would fire under the daily model's hazard (time ramp,
+        criticality factor, vulnerability factor) and is pushed on a heap.
+        Popping the heap in day order yields the same process as the daily
+        loop: a dependent falls on the first day any of its edges fires.
+        """
+        from .propagation import (BASE_DAILY_PROBABILITY, TIME_FACTOR_RAMP_DAYS,
+                                  sample_compromise_delay, sample_detection_days)
 
-        for scenario in scenarios:
-            scenario_name = scenario['name']
-            initial_component = scenario['initial_component']
-            simulation_days = scenario.get('simulation_days', 30)
-            detection_prob = scenario.get('detection_probability', 0.1)
+        # Reset simulation state
+        for component in self.components.values():
+            component.is_compromised = False
+            component.compromise_time = None
 
-            print(f"Running scenario: {scenario_name}")
-            result = self.simulate_attack_propagation(
-                initial_component, simulation_days, detection_prob
-            )
-            results[scenario_name] = result
+        hazards: Dict[str, float] = {}
+
+        def hazard_of(component_id: str) -> float:
+            if component_id not in hazards:
+                criticality_factor = self.components[component_id].criticality_score / 10.0
+                vuln_factor = max(1.0, self.get_max_exploit_probability(component_id))
+                hazards[component_id] = BASE_DAILY_PROBABILITY * criticality_factor * vuln_factor
+            return hazards[component_id]
+
+        compromise_day: Dict[str, int] = {}
+        pending: List[Tuple[int, int, str, str]] = []  # (day, sequence, target, source)
+        sequence = 0
+
+        def compromise(component_id: str, day: int) -> None:
+            nonlocal sequence
+            compromise_day[component_id] = day
+            component = self.components[component_id]
+            component.is_compromised = True
+            component.compromise_time = start_time + timedelta(days=day)
+
+            for dependent_id in self.graph.successors(component_id):
+                if dependent_id in compromise_day:
+                    continue
+                delay = sample_compromise_delay(rng, hazard_of(dependent_id))
+                if delay is not None and day + delay < simulation_days:
+                    heapq.heappush(pending, (day + delay, sequence, dependent_id, component_id))
+                    sequence += 1
+
+        compromise(initial_compromise, 0)
+        compromised_timeline = []
+
+        while pending:
+            day, _, dependent_id, source_id = heapq.heappop(pending)
+            if dependent_id in compromise_day:
+                continue
+
+            days_since_compromise = day - compromise_day[source_id]
+            time_factor = min(1.0, days_since_compromise / TIME_FACTOR_RAMP_DAYS)
+            compromise(dependent_id, day)
+
+            compromised_timeline.append({
+                'day': day,
+                'date': (start_time + timedelta(days=day)).isoformat(),
+                'component_id': dependent_id,
+                'component_name': self.components[dependent_id].name,
+                'source_component': source_id,
+                'compromise_probability': hazard_of(dependent_id) * time_factor
+            })
+
+        # Detection does not influence spread, so sample it per component afterwards
+        detections = []
+        for rank, (comp_id, day) in enumerate(compromise_day.items()):
+            for detection_day in sample_detection_days(rng, day, simulation_days, detection_probability):
+                detections.append((detection_day, rank, comp_id))
+        detections.sort()
+
+        detection_events = [
+            {
+                'day': detection_day,
+                'date': (start_time + timedelta(days=detection_day)).isoformat(),
+                'component_id': comp_id,
+                'component_name': self.components[comp_id].name,
+                'days_since_compromise': detection_day - compromise_day[comp_id]
+            }
+            for detection_day, _, comp_id in detections
+        ]
+
+        total_components = len(self.components)
+        compromised_count = len(compromise_day)
+        applications_compromised = len([
+            comp_id for comp_id in compromise_day
+            if self.components[comp_id].software_type == SoftwareType.APPLICATION
+        ])
+
+        return {
+            'initial_compromise': initial_compromise,
+            'simulation_days': simulation_days,
+            'total_components': total_components,
+            'compromised_count': compromised_count,
+            'compromise_percentage': (compromised_count / total_components) * 100,
+            'applications_affected': applications_compromised,
+            'timeline': compromised_timeline,
+            'detection_events': detection_events,
+            'final_compromised_components': list(compromise_day)
+        }
+
+    def simulate_attack_propagation_batch(self, initial_compromise: str,
+                                          n_trials: int = 1000,
+                                          simulation_days: int = 30,
+                                          detection_probability: float = 0.1,
+                                          seed: Optional[int] = None,
+                                          return_trials: bool = False) -> Dict[str, Any]:
+        """Run many independent attack propagation trials at once
+
+        Uses the vectorized Monte Carlo engine (see core.propagation), which
+        follows the same daily model as simulate_attack_propagation() but
+        does not modify the components' compromise flags.  Numeric results
+        are averaged over the trials; pass return_trials=True to also get
+        every trial in the simulate_attack_propagation() result schema.
+        """
+        from .propagation import MonteCarloPropagation
+
+        engine = MonteCarloPropagation(self)
+        return engine.run(initial_compromise, n_trials=n_trials,
+                          simulation_days=simulation_days,
+                          detection_probability=detection_probability,
+                          seed=seed, return_trials=return_trials)
+
+    def simulate_multiple_scenarios(self, scenarios: List[Dict[str, Any]],
+                                    workers: Optional[int] = None,
+                                    seed: Optional[int] = None) -> Dict[str, Any]:
+        """Run multiple attack scenarios and compare results
+
+        Args:
+            scenarios: Scenario dicts with name, initial_component and optional
+                simulation_days / detection_probability / engine
+            workers: Number of worker processes (None or 1 runs in this process)
+            seed: Seed for the per-scenario random streams (None for fresh entropy)
+
+        Every scenario draws from its own random stream spawned from the seed,
+        so the merged results do not depend on the number of workers.
+        """
+        start_time = datetime.now()
+        tasks = [
+            (scenario['initial_component'],
+             scenario.get('simulation_days', 30),
+             scenario.get('detection_probability', 0.1),
+             task_seed,
+             start_time,
+             scenario.get('engine', 'daily'))
+            for scenario, task_seed in zip(scenarios, spawn_task_seeds(seed, len(scenarios)))
+        ]
+
+        scenario_results = run_simulation_tasks(self, _scenario_task, tasks, workers)
+        results = {
+            scenario['name']: result
+            for scenario, result in zip(scenarios, scenario_results)
+        }
 
         # Compare scenarios
         comparison = {
@@ -765,8 +1447,10 @@ class DependencyGraph:
 
         return comparison
 
-    def calculate_time_to_patch(self, component_id: str, organization_type: str = "large") -> int:
+    def calculate_time_to_patch(self, component_id: str, organization_type: str = "large",
+                                rng: Optional[random.Random] = None) -> int:
         """Calculate realistic patching timelines based on organization type and component criticality"""
+        rng = rng or random
         if component_id not in self.components:
             return 0
 
@@ -781,17 +1465,7 @@ class DependencyGraph:
         }
 
         # Determine vulnerability severity affecting this component
-        max_severity = VulnerabilityLevel.LOW
-        for vuln_key in self.vulnerabilities:
-            if component_id in vuln_key:
-                vuln = self.vulnerabilities[vuln_key]
-                if vuln.severity.value == "critical":
-                    max_severity = VulnerabilityLevel.CRITICAL
-                    break
-                elif vuln.severity.value == "high" and max_severity != VulnerabilityLevel.CRITICAL:
-                    max_severity = VulnerabilityLevel.HIGH
-                elif vuln.severity.value == "medium" and max_severity not in [VulnerabilityLevel.CRITICAL, VulnerabilityLevel.HIGH]:
-                    max_severity = VulnerabilityLevel.MEDIUM
+        max_severity = self.get_max_severity(component_id) or VulnerabilityLevel.LOW
 
         base_time = base_times[organization_type][max_severity.value]
 
@@ -807,62 +1481,132 @@ class DependencyGraph:
             base_time = int(base_time * 1.3)
 
         # Add some randomness
-        variation = random.uniform(0.8, 1.4)
+        variation = rng.uniform(0.8, 1.4)
         return int(base_time * variation)
 
     def simulate_patching_race(self, attack_scenario: Dict[str, Any],
-                             organization_types: List[str] = None) -> Dict[str, Any]:
-        """Simulate a race between attack propagation and patching efforts"""
+                             organization_types: List[str] = None,
+                             workers: Optional[int] = None,
+                             seed: Optional[int] = None) -> Dict[str, Any]:
+        """Simulate a race between attack propagation and patching efforts
+
+        Each organization type is an independent task with its own random
+        stream spawned from seed; workers > 1 runs them in a process pool.
+        """
         if organization_types is None:
             organization_types = ["enterprise", "large", "medium", "small"]
 
-        results = {}
+        start_time = datetime.now()
+        tasks = [
+            (attack_scenario, org_type, task_seed, start_time)
+            for org_type, task_seed in zip(organization_types,
+                                           spawn_task_seeds(seed, len(organization_types)))
+        ]
+
+        race_results = run_simulation_tasks(self, _patching_race_task, tasks, workers)
+        return dict(zip(organization_types, race_results))
+
+    def _run_patching_race(self, attack_scenario: Dict[str, Any], org_type: str,
+                           rng: random.Random, start_time: datetime) -> Dict[str, Any]:
+        """Run one attack simulation and patching timeline for an organization type"""
+        # Run attack simulation
+        attack_result = self.simulate_attack_propagation(
+            attack_scenario['initial_component'],
+            attack_scenario.get('simulation_days', 30),
+            attack_scenario.get('detection_probability', 0.1),
+            rng=rng,
+            start_time=start_time,
+            engine=attack_scenario.get('engine', 'daily')
+        )
 
-        for org_type in organization_types:
-            # Run attack simulation
-            attack_result = self.simulate_attack_propagation(
-                attack_scenario['initial_component'],
-                attack_scenario.get('simulation_days', 30),
-                attack_scenario.get('detection_probability', 0.1)
+        # Calculate patching timeline
+        patching_timeline = {}
+        for comp_id in self.components:
+            patch_time = self.calculate_time_to_patch(comp_id, org_type, rng=rng)
+            patching_timeline[comp_id] = patch_time
+
+        # Determine which components were compromised before they could be patched
+        vulnerable_window = []
+        for event in attack_result['timeline']:
+            comp_id = event['component_id']
+            compromise_day = event['day']
+            patch_day = patching_timeline[comp_id]
+
+            if compromise_day < patch_day:
+                vulnerable_window.append({
+                    'component_id': comp_id,
+                    'component_name': event['component_name'],
+                    'compromise_day': compromise_day,
+                    'patch_day': patch_day,
+                    'vulnerability_window': patch_day - compromise_day
+                })
+
+        return {
+            'attack_result': attack_result,
+            'patching_timeline': patching_timeline,
+            'vulnerable_window_components': vulnerable_window,
+            'components_saved_by_patching': (
+                attack_result['compromised_count'] - len(vulnerable_window)
+            ),
+            'patch_effectiveness': (
+                (attack_result['compromised_count'] - len(vulnerable_window)) /
+                attack_result['compromised_count'] * 100
+                if attack_result['compromised_count'] > 0 else 100
             )
+        }
 
-            # Calculate patching timeline
-            patching_timeline = {}
-            for comp_id in self.components:
-                patch_time = self.calculate_time_to_patch(comp_id, org_type)
-                patching_timeline[comp_id] = patch_time
-
-            # Determine which components were compromised before they could be patched
-            vulnerable_window = []
-            for event in attack_result['timeline']:
-                comp_id = event['component_id']
-                compromise_day = event['day']
-                patch_day = patching_timeline[comp_id]
-
-                if compromise_day < patch_day:
-                    vulnerable_window.append({
-                        'component_id': comp_id,
-                        'component_name': event['component_name'],
-                        'compromise_day': compromise_day,
-                        'patch_day': patch_day,
-                        'vulnerability_window': patch_day - compromise_day
-                    })
 
-            results[org_type] = {
-                'attack_result': attack_result,
-                'patching_timeline': patching_timeline,
-                'vulnerable_window_components': vulnerable_window,
-                'components_saved_by_patching': (
-                    attack_result['compromised_count'] - len(vulnerable_window)
-                ),
-                'patch_effectiveness': (
-                    (attack_result['compromised_count'] - len(vulnerable_window)) /
-                    attack_result['compromised_count'] * 100
-                    if attack_result['compromised_count'] > 0 else 100
-                )
-            }
+# Graph shared by the tasks of a simulation worker process
+_worker_graph: Optional[DependencyGraph] = None
+
+
+def spawn_task_seeds(seed: Optional[int], count: int) -> List[int]:
+    """Derive independent, reproducible seeds for a batch of simulation tasks"""
+    children = np.random.SeedSequence(seed).spawn(count)
+    return [int(child.generate_state(2, dtype=np.uint64)[0]) for child in children]
+
+
+def _init_simulation_worker(graph: DependencyGraph) -> None:
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _scenario_task(graph: DependencyGraph, initial_component: str, simulation_days: int,
+                   detection_probability: float, seed: int, start_time: datetime,
+                   engine: str) -> Dict[str, Any]:
+    return graph.simulate_attack_propagation(
+        initial_component, simulation_days, detection_probability,
+        rng=random.Random(seed), start_time=start_time, engine=engine
+    )
+
+
+def _patching_race_task(graph: DependencyGraph, attack_scenario: Dict[str, Any], org_type: str,
+                        seed: int, start_time: datetime) -> Dict[str, Any]:
+    return graph._run_patching_race(attack_scenario, org_type, random.Random(seed), start_time)
+
+
+def _run_in_worker(task_args: Tuple[Any, ...]) -> Dict[str, Any]:
+    task, args = task_args
+    return task(_worker_graph, *args)
+
+
+def run_simulation_tasks(graph: DependencyGraph, task, task_args: List[Tuple[Any, ...]],
+                         workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Run simulation tasks on a graph, optionally spread over a process pool
+
+    Results come back in task order.  With workers > 1 every worker process
+    receives its own copy of the graph once, so the caller's components are
+    left untouched.
+    """
+    if not workers or workers <= 1 or len(task_args) <= 1:
+        return [task(graph, *args) for args in task_args]
+
+    from concurrent.futures import ProcessPoolExecutor
 
-        return results
+    with ProcessPoolExecutor(max_workers=min(workers, len(task_args)),
+                             initializer=_init_simulation_worker,
+                             initargs=(graph,)) as executor:
+        return list(executor.map(_run_in_worker, [(task, args) for args in task_args]))
 
 
 def create_sample_graph() -> DependencyGraph:
@@ -0,0 +1,109 @@
+"""
+Streaming JSON writer for large exports.
+
+This module writes a top-level JSON object field by field, where large
+members can be supplied as iterators that are encoded one entry at a time,
+so exporting a graph never needs the whole document in memory.  With an
+indent the output is byte-for-byte what json.dump would have produced for
+the equivalent dict; without one it is fully compact.
+"""
+
+import gzip
+import json
+from typing import Any, IO, Iterable, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional faster decoder
+    orjson = None
+
+
+class StreamedMapping:
+    """A JSON object member whose (key, value) entries are produced lazily"""
+
+    def __init__(self, items: Iterable[Tuple[str, Any]]):
+        self.items = items
+
+
+class StreamedArray:
+    """A JSON array member whose elements are produced lazily"""
+
+    def __init__(self, items: Iterable[Any]):
+        self.items = items
+
+
+def open_text_output(filepath: str, compress: bool = False) -> IO[str]:
+    """Open a text file for writing, gzip-compressed if requested"""
+    if compress:
+        return gzip.open(filepath, "wt", encoding="utf-8")
+    return open(filepath, "w")
+
+
+def open_text_input(filepath: str) -> IO[str]:
+    """Open a text file for reading, transparently decompressing gzip files"""
+    with open(filepath, "rb") as f:
+        is_gzip = f.read(2) == b"\x1f\x8b"
+    if is_gzip:
+        return gzip.open(filepath, "rt", encoding="utf-8")
+    return open(filepath, "r")
+
+
+def load_json_file(filepath: str) -> Any:
+    """Parse a (possibly gzip-compressed) JSON file, using orjson when installed"""
+    if orjson is not None:
+        with open(filepath, "rb") as f:
+            raw = f.read()
+        if raw[:2] == b"\x1f\x8b":
+            raw = gzip.decompress(raw)
+        return orjson.loads(raw)
+
+    with open_text_input(filepath) as f:
+        return json.load(f)
+
+
+class JsonStreamWriter:
+    """Write one JSON object to a text handle, streaming large members"""
+
+    def __init__(self, handle: IO[str], indent: Optional[int] = 2):
+        self.handle = handle
+        self.indent = indent
+        self.newline = "\n" if indent else ""
+        self.colon = ": " if indent else ":"
+        self.separators = (",", ": ") if indent else (",", ":")
+
+    def _pad(self, level: int) -> str:
+        return " " * (self.indent * level) if self.indent else ""
+
+    def _encode(self, value: Any, level: int) -> str:
+        text = json.dumps(value, indent=self.indent, separators=self.separators)
+        if self.indent:
+            text = text.replace("\n", "\n" + self._pad(level))
+        return text
+
+    def write_object(self, fields: Iterable[Tuple[str, Any]]) -> None:
+        """Write the top-level object; values may be StreamedMapping / StreamedArray"""
+        self._write_container(fields, is_mapping=True, level=0)
+
+    def _write_container(self, items: Iterable, is_mapping: bool, level: int) -> None:
+        opening, closing = ("{", "}") if is_mapping else ("[", "]")
+        write = self.handle.write
+        write(opening)
+
+        empty = True
+        for item in items:
+            write(("," if not empty else "") + self.newline + self._pad(level + 1))
+            empty = False
+            if is_mapping:
+                key, item = item
+                write(json.dumps(key) + self.colon)
+            self._write_value(item, level + 1)
+
+        write(closing if empty else self.newline + self._pad(level) + closing)
+
+    def _write_value(self, value: Any, level: int) -> None:
+        if isinstance(value, StreamedMapping):
+            self._write_container(value.items, is_mapping=True, level=level)
+        elif isinstance(value, StreamedArray):
+            self._write_container(value.items, is_mapping=False, level=level)
+        else:
+            self.handle.write(self._encode(value, level))
@@ -0,0 +1,174 @@
+"""
+Organization-wide dependency graph.
+
+An OrgGraph merges the per-repository graphs of many repositories into one
+DependencyGraph.  Shared components are interned through a ComponentRegistry,
+so a library used by a thousand repositories is one node (and one
+SoftwareComponent) instead of a thousand copies, and every repository's
+application node points at the same library nodes.  An inverted index from
+component to consuming repositories answers "which repositories pull in X"
+with a lookup.
+"""
+
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from .dependency_graph import DependencyGraph, SoftwareComponent, SoftwareType
+
+
+class ComponentRegistry:
+    """Interns components by (name, version), keeping the first one seen"""
+
+    def __init__(self):
+        self._components: Dict[str, SoftwareComponent] = {}
+        self._versions: Dict[str, List[str]] = {}
+
+    def intern(self, component: SoftwareComponent) -> SoftwareComponent:
+        """The registered component with the id of component, registering a copy if there is none
+
+        A copy is registered because a component belongs to the graph it
+        was added to.
+        """
+        existing = self._components.get(component.id)
+        if existing is not None:
+            return existing
+        canonical = SoftwareComponent(
+            name=component.name,
+            version=component.version,
+            software_type=component.software_type,
+            vendor=component.vendor,
+            description=component.description,
+            patch_time_days=component.patch_time_days,
+            criticality_score=component.criticality_score
+        )
+        self._components[canonical.id] = canonical
+        self._versions.setdefault(canonical.name, []).append(canonical.version)
+        return canonical
+
+    def get(self, name: str, version: str) -> Optional[SoftwareComponent]:
+        return self._components.get(f"{name}:{version}")
+
+    def versions(self, name: str) -> List[str]:
+        """Registered versions of a package, in registration order"""
+        return list(self._versions.get(name, []))
+
+    def __contains__(self, component_id: str) -> bool:
+        return component_id in self._components
+
+    def __len__(self) -> int:
+        return len(self._components)
+
+    def __iter__(self) -> Iterator[SoftwareComponent]:
+        return iter(self._components.values())
+
+
+class OrgGraph:
+    """Merged dependency graph of the repositories of an organization
+
+    Application components are owned by their repository and renamed
+    "<repo_id>" (the root application) or "<repo_id>/<name>" (subprojects),
+    so equally named applications of different repositories stay apart.
+    All other components are shared through the registry.
+    """
+
+    def __init__(self, name: str = "Organization Dependencies", backend: str = "networkx"):
+        self.registry = ComponentRegistry()
+        self.graph = DependencyGraph(name, backend=backend)
+        # Repository id -> id of its root application component
+        self.repositories: Dict[str, str] = {}
+        # Shared component id -> ids of the repositories that depend on it
+        self._consumers: Dict[str, Set[str]] = {}
+
+    def _own_component(self, repo_id: str, component: SoftwareComponent,
+                       is_root: bool) -> SoftwareComponent:
+        owned = SoftwareComponent(
+            name=repo_id if is_root else f"{repo_id}/{component.name}",
+            version=component.version,
+            software_type=component.software_type,
+            vendor=component.vendor,
+            description=component.description,
+            patch_time_days=component.patch_time_days,
+            criticality_score=component.criticality_score
+        )
+        self.graph.add_component(owned)
+        return owned
+
+    def add_repository(self, repo_id: str, graph: DependencyGraph) -> str:
+        """Merge the graph of one repository and return the id of its application node
+
+        The root application is the application component nothing else in
+        the graph depends on (the first one if there are several). The
+        repository's vulnerabilities are merged onto the same nodes.
+        """
+        if repo_id in self.repositories:
+            raise ValueError(f"Repository already in the organization graph: {repo_id}")
+
+        structure = graph.as_networkx()
+        applications = [component_id for component_id, component in graph.components.items()
+                        if component.software_type == SoftwareType.APPLICATION]
+        # Edges point from a dependency to its dependent, so the root has no successors
+        roots = [component_id for component_id in applications if structure.out_degree(component_id) == 0]
+        root_id = (roots or applications or [None])[0]
+        if root_id is None:
+            raise ValueError(f"Graph of {repo_id} has no application component")
+
+        merged_ids = {}
+        new_components = []
+        for component_id, component in graph.components.items():
+            if component.software_type == SoftwareType.APPLICATION:
+                merged_ids[component_id] = self._own_component(repo_id, component, component_id == root_id).id
+                continue
+            is_new = component_id not in self.registry
+            canonical = self.registry.intern(component)
+            if is_new:
+                new_components.append(canonical)
+            merged_ids[component_id] = canonical.id
+            self._consumers.setdefault(canonical.id, set()).add(repo_id)
+        if new_components:
+            self.graph.add_components(new_components)
+
+        edges = []
+        for dependency_id, dependent_id, attrs in structure.edges(data=True):
+            dependency_id, dependent_id = merged_ids[dependency_id], merged_ids[dependent_id]
+            # Edges among shared components may have come with an earlier repository
+            if not self.graph.graph.has_edge(dependency_id, dependent_id):
+                edges.append((dependent_id, dependency_id, attrs.get("dependency_type", "direct")))
+        if edges:
+            self.graph.add_dependencies(edges)
+
+        # Vulnerabilities move to the merged ids; a CVE already recorded on a
+        # shared component by an earlier repository is not added again
+        known = self.graph.vulnerabilities
+        for component_id in graph.components:
+            merged_id = merged_ids[component_id]
+            for vulnerability in graph.get_component_vulnerabilities(component_id):
+                if f"{merged_id}:{vulnerability.cve_id}" not in known:
+                    self.graph.add_vulnerability(merged_id, vulnerability)
+
+        self.repositories[repo_id] = merged_ids[root_id]
+        return merged_ids[root_id]
+
+    def consumers(self, component_id: str) -> Set[str]:
+        """Repositories that depend on a shared component, directly or transitively"""
+        return set(self._consumers.get(component_id, ()))
+
+    def repositories_using(self, name: str, version: Optional[str] = None) -> List[str]:
+        """Repositories that depend on a package (any version when version is None), sorted"""
+        versions = [version] if version is not None else self.registry.versions(name)
+        repositories = set()
+        for package_version in versions:
+            repositories |= self._consumers.get(f"{name}:{package_version}", set())
+        return sorted(repositories)
+
+    def shared_components(self, min_repositories: int = 2) -> List[Tuple[str, int]]:
+        """Components used by at least min_repositories repositories, most used first"""
+        shared = [(component_id, len(repositories)) for component_id, repositories in self._consumers.items()
+                  if len(repositories) >= min_repositories]
+        return sorted(shared, key=lambda item: (-item[1], item[0]))
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "repositories": len(self.repositories),
+            "shared_components": len(self.registry),
+            "total_components": len(self.graph.components),
+            "total_dependencies": self.graph.graph.number_of_edges()
+        }
@@ -2,7 +2,9 @@
 Output Manager for organizing and managing analysis results.
 
 This module handles all file output operations, ensuring results are organized
-in a clean folder structure with proper naming conventions.
+in a clean folder structure with proper naming conventions.  Every saved
+output is recorded in an SQLite catalog, which answers project listings and
+summaries without walking the output tree.
 """
 
 import os
@@ -12,6 +14,11 @@ from datetime import datetime
 from typing import Dict, Any, Optional
 from pathlib import Path
 
+from .catalog import OutputCatalog
+from .json_stream import open_text_output
+
+CATALOG_FILENAME = "catalog.sqlite"
+
 
 class OutputManager:
     """Manages organized output of analysis results"""
@@ -20,6 +27,10 @@ class OutputManager:
         """Initialize output manager with base directory"""
         self.base_dir = Path(base_output_dir)
         self.setup_directories()
+        self.catalog = OutputCatalog(self.base_dir / CATALOG_FILENAME)
+        if self.catalog.created:
+            # Pick up outputs saved before the catalog existed
+            self.catalog.reindex(self.base_dir)
 
     def setup_directories(self):
         """Create organized directory structure"""
@@ -27,32 +38,71 @@ class OutputManager:
             self.base_dir / "graphs",
             self.base_dir / "reports",
             self.base_dir / "metrics",
-            self.base_dir / "visualizations"
+            self.base_dir / "visualizations",
+            self.base_dir / "snapshots"
         ]
 
         for directory in directories:
             directory.mkdir(parents=True, exist_ok=True)
 
+    def record_output(self, filepath: str, project_name: str, kind: str) -> None:
+        """Record an output written under this manager's directories in the catalog
+
+        Args:
+            filepath: Saved file (or snapshot directory)
+            project_name: Project the output belongs to
+            kind: Output kind, e.g. "dependency_graph" or "risk_metrics"
+        """
+        category = Path(filepath).parent.name
+        self.catalog.record(str(filepath), project_name, kind, category)
+
+    def reindex(self) -> int:
+        """Rebuild the catalog from the files on disk and return the number of outputs"""
+        return self.catalog.reindex(self.base_dir)
+
     def get_timestamped_filename(self, base_name: str, extension: str = "json") -> str:
         """Generate timestamped filename"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         return f"{base_name}_{timestamp}.{extension}"
 
-    def save_dependency_graph(self, graph_data: Dict[str, Any],
-                             project_name: str,
-                             include_timestamp: bool = True) -> str:
-        """Save dependency graph data to organized location"""
+    def get_dependency_graph_path(self, project_name: str,
+                                  include_timestamp: bool = True,
+                                  compress: bool = False) -> str:
+        """Generate filepath for dependency graph exports"""
+        extension = "json.gz" if compress else "json"
         if include_timestamp:
-            filename = self.get_timestamped_filename(f"{project_name}_dependencies")
+            filename = self.get_timestamped_filename(f"{project_name}_dependencies", extension)
         else:
-            filename = f"{project_name}_dependencies.json"
+            filename = f"{project_name}_dependencies.{extension}"
 
-        filepath = self.base_dir / "graphs" / filename
+        return str(self.base_dir / "graphs" / filename)
 
-        with open(filepath, 'w') as f:
-            json.dump(graph_data, f, indent=2)
+    def get_snapshot_path(self, project_name: str, include_timestamp: bool = True) -> str:
+        """Generate directory path for binary graph snapshots"""
+        if include_timestamp:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            dirname = f"{project_name}_snapshot_{timestamp}"
+        else:
+            dirname = f"{project_name}_snapshot"
 
-        return str(filepath)
+        return str(self.base_dir / "snapshots" / dirname)
+
+    def save_dependency_graph(self, graph_data: Dict[str, Any],
+                             project_name: str,
+                             include_timestamp: bool = True,
+                             compact: bool = False,
+                             compress: bool = False) -> str:
+        """Save dependency graph data to organized location"""
+        filepath = self.get_dependency_graph_path(project_name, include_timestamp, compress)
+
+        with open_text_output(filepath, compress) as f:
+            if compact:
+                json.dump(graph_data, f, separators=(",", ":"))
+            else:
+                json.dump(graph_data, f, indent=2)
+
+        self.record_output(filepath, project_name, "dependency_graph")
+        return filepath
 
     def save_risk_metrics(self, metrics_data: pd.DataFrame,
                          project_name: str,
@@ -66,6 +116,29 @@ class OutputManager:
         filepath = self.base_dir / "metrics" / filename
         metrics_data.to_csv(filepath, index=False)
 
+        self.record_output(filepath, project_name, "risk_metrics")
+        return str(filepath)
+
+    def save_depth_profile(self, profile: Dict[str, Any],
+                          project_name: str,
+                          include_timestamp: bool = True) -> str:
+        """Save a DependencyGraph.depth_profile_matrix() result to CSV file"""
+        if include_timestamp:
+            filename = self.get_timestamped_filename(f"{project_name}_depth_profile", "csv")
+        else:
+            filename = f"{project_name}_depth_profile.csv"
+
+        columns = {"component_id": profile["components"]}
+        for i, depth in enumerate(profile["depths"]):
+            columns[f"dependents_depth_{depth}"] = profile["counts"][:, i]
+        if "impact" in profile:
+            for i, depth in enumerate(profile["depths"]):
+                columns[f"impact_depth_{depth}"] = profile["impact"][:, i].round(4)
+
+        filepath = self.base_dir / "metrics" / filename
+        pd.DataFrame(columns).to_csv(filepath, index=False)
+
+        self.record_output(filepath, project_name, "depth_profile")
         return str(filepath)
 
     def save_analysis_report(self, report_data: Dict[str, Any],
@@ -82,17 +155,27 @@ class OutputManager:
         with open(filepath, 'w') as f:
             json.dump(report_data, f, indent=2)
 
+        self.record_output(filepath, project_name, "analysis_report")
         return str(filepath)
 
     def save_visualization(self, project_name: str, viz_type: str,
-                         include_timestamp: bool = True) -> str:
-        """Generate filepath for visualization saves"""
+                         include_timestamp: bool = True, figure=None) -> str:
+        """Generate filepath for visualization saves
+
+        With a matplotlib figure, the figure is saved there and recorded in
+        the catalog. Otherwise only the path is returned; call record_output()
+        once the image has been written. reindex() recognizes the types in
+        catalog.VISUALIZATION_TYPES.
+        """
         if include_timestamp:
             filename = self.get_timestamped_filename(f"{project_name}_{viz_type}", "png")
         else:
             filename = f"{project_name}_{viz_type}.png"
 
         filepath = self.base_dir / "visualizations" / filename
+        if figure is not None:
+            figure.savefig(filepath, dpi=300, bbox_inches='tight')
+            self.record_output(filepath, project_name, "visualization")
         return str(filepath)
 
     def create_project_summary(self, project_name: str,
@@ -106,7 +189,8 @@ class OutputManager:
                 "graphs_dir": str(self.base_dir / "graphs"),
                 "reports_dir": str(self.base_dir / "reports"),
                 "metrics_dir": str(self.base_dir / "metrics"),
-                "visualizations_dir": str(self.base_dir / "visualizations")
+                "visualizations_dir": str(self.base_dir / "visualizations"),
+                "snapshots_dir": str(self.base_dir / "snapshots")
             }
         }
 
@@ -125,51 +209,32 @@ class OutputManager:
         for root, dirs, files in os.walk(self.base_dir):
             for file in files:
                 filepath = Path(root) / file
+                if filepath.resolve() == self.catalog.db_path:
+                    continue
                 if filepath.stat().st_mtime < cutoff_time:
                     filepath.unlink()
                     print(f"Cleaned up old file: {filepath}")
 
+        # Snapshots are directories; drop the ones that are now empty
+        for snapshot_dir in (self.base_dir / "snapshots").iterdir():
+            if snapshot_dir.is_dir() and not any(snapshot_dir.iterdir()):
+                snapshot_dir.rmdir()
+        self.catalog.remove_missing()
+
     def get_project_files(self, project_name: str) -> Dict[str, list]:
         """Get all files for a specific project"""
-        project_files = {
-            "graphs": [],
-            "reports": [],
-            "metrics": [],
-            "visualizations": []
-        }
-
-        for category in project_files.keys():
-            dir_path = self.base_dir / category
-            if dir_path.exists():
-                for file in dir_path.glob(f"{project_name}*"):
-                    project_files[category].append(str(file))
-
-        return project_files
+        return self.catalog.project_files(project_name)
 
     def list_all_projects(self) -> list:
         """List all analyzed projects"""
-        projects = set()
-
-        for root, dirs, files in os.walk(self.base_dir):
-            for file in files:
-                if file.endswith(('_dependencies.json', '_risk_metrics.csv')):
-                    # Extract project name from filename
-                    project_name = file.split('_')[0]
-                    projects.add(project_name)
-
-        return sorted(list(projects))
+        return self.catalog.projects()
 
     def get_output_summary(self) -> Dict[str, Any]:
         """Get summary of all outputs"""
         summary = {
-            "total_projects": len(self.list_all_projects()),
-            "output_directories": {
-                "graphs": len(list((self.base_dir / "graphs").glob("*"))),
-                "reports": len(list((self.base_dir / "reports").glob("*"))),
-                "metrics": len(list((self.base_dir / "metrics").glob("*"))),
-                "visualizations": len(list((self.base_dir / "visualizations").glob("*")))
-            },
-            "recent_projects": self.list_all_projects()[-5:],  # Last 5 projects
+            "total_projects": self.catalog.count_projects(),
+            "output_directories": self.catalog.category_counts(),
+            "recent_projects": self.catalog.recent_projects(5),
             "base_directory": str(self.base_dir)
         }
 
@@ -0,0 +1,365 @@
+"""
+Vectorized Monte Carlo engine for attack propagation.
+
+This module runs many independent trials of the daily propagation model used
+by DependencyGraph.simulate_attack_propagation() at once.  The state of every
+trial is a row of a trials x components boolean matrix, the dependency edges
+are kept as a sparse CSR adjacency, and both compromise and detection draws
+come from a NumPy random generator.  The shared
+SoftwareComponent objects are never modified.
+"""
+
+import math
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .dependency_graph import DependencyGraph, SoftwareType
+
+
+# Parameters of the daily compromise hazard, kept in step with simulate_attack_propagation()
+BASE_DAILY_PROBABILITY = 0.05
+TIME_FACTOR_RAMP_DAYS = 7.0
+
+# Upper bound on trials x components held in memory per batch
+DEFAULT_CELL_BUDGET = 4_000_000
+
+# Delay used for edges that can never fire
+NEVER = np.iinfo(np.int32).max
+
+
+def ramp_survival(hazard: np.ndarray) -> np.ndarray:
+    """Probability that an edge has not fired after each of the ramp days
+
+    Row i holds, for k = 1..6, the probability that an edge into a target
+    with full daily hazard hazard[i] survives the first k days, given the
+    daily model's min(1, k / 7) * hazard ramp.
+    """
+    ramp_days = int(TIME_FACTOR_RAMP_DAYS) - 1
+    ramp = np.arange(1, ramp_days + 1) / TIME_FACTOR_RAMP_DAYS
+    hazard = np.minimum(np.asarray(hazard, dtype=np.float64), 1.0)
+    return np.cumprod(1.0 - ramp[None, :] * hazard[:, None], axis=1)
+
+
+def sample_compromise_delays(rng: np.random.Generator, hazard: np.ndarray,
+                             survival: np.ndarray) -> np.ndarray:
+    """Draw, per edge, the number of days until it compromises its target
+
+    Inverse-transform sampling of the first day the daily loop would fire:
+    one uniform is compared against the ramp survival curve (see
+    ramp_survival) and, past the ramp, rescaled into a geometric tail with
+    the constant full hazard.  Edges with zero hazard never fire.
+    """
+    ramp_days = survival.shape[1]
+    hazard = np.minimum(hazard, 1.0)
+    uniform = rng.random(len(hazard))
+
+    survived = (uniform[:, None] <= survival).sum(axis=1)
+    delays = np.where(survived < ramp_days, survived + 1, NEVER).astype(np.int64)
+
+    tail = (survived == ramp_days) & (hazard > 0)
+    rescaled = uniform[tail] / survival[tail, -1]
+    with np.errstate(divide="ignore"):
+        extra = np.ceil(np.log(rescaled) / np.log1p(-hazard[tail]))
+    delays[tail] = ramp_days + np.maximum(1, np.nan_to_num(extra, nan=1.0)).astype(np.int64)
+    return delays
+
+
+def sample_compromise_delay(rng, hazard: float) -> Optional[int]:
+    """Scalar counterpart of sample_compromise_delays() for a random.Random
+
+    Returns the number of days until an edge into a target with full daily
+    hazard `hazard` fires, or None if it never fires.
+    """
+    hazard = min(hazard, 1.0)
+    if hazard <= 0:
+        return None
+
+    uniform = rng.random()
+    survival = 1.0
+    for day in range(1, int(TIME_FACTOR_RAMP_DAYS)):
+        survival *= 1.0 - (day / TIME_FACTOR_RAMP_DAYS) * hazard
+        if uniform > survival:
+            return day
+
+    if hazard >= 1.0:
+        return int(TIME_FACTOR_RAMP_DAYS)
+    extra = math.ceil(math.log(uniform / survival) / math.log1p(-hazard)) if uniform > 0 else 1
+    return int(TIME_FACTOR_RAMP_DAYS) - 1 + max(1, extra)
+
+
+def sample_detection_days(rng, first_day: int, last_day: int, probability: float) -> List[int]:
+    """Days in [first_day, last_day) on which a daily check with `probability` succeeds
+
+    Gaps between successes are drawn as geometric variables, so the cost is
+    proportional to the number of detections rather than to the horizon.
+    """
+    if probability <= 0 or first_day >= last_day:
+        return []
+    if probability >= 1:
+        return list(range(first_day, last_day))
+
+    days = []
+    log_miss = math.log1p(-probability)
+    day = first_day - 1
+    while True:
+        uniform = rng.random()
+        day += 1 + (int(math.log(uniform) / log_miss) if uniform > 0 else 0)
+        if day >= last_day:
+            return days
+        days.append(day)
+
+
+class MonteCarloPropagation:
+    """Batched Monte Carlo simulation of attack propagation over a dependency graph"""
+
+    def __init__(self, graph: DependencyGraph):
+        self.graph = graph
+        self.component_ids: List[str] = list(graph.components)
+        self.positions = {comp_id: i for i, comp_id in enumerate(self.component_ids)}
+
+        edges = [
+            (self.positions[source], self.positions[target])
+            for source, target in graph.graph.edges()
+            if source in self.positions and target in self.positions
+        ]
+        edge_array = np.array(edges, dtype=np.int64).reshape(-1, 2)
+        order = np.argsort(edge_array[:, 0], kind="stable")
+        self.edge_sources = edge_array[order, 0]
+        self.edge_targets = edge_array[order, 1]
+
+        # CSR view of the out-edges: edges of node i are edge_targets[indptr[i]:indptr[i + 1]]
+        self.out_degree = np.bincount(self.edge_sources, minlength=len(self.component_ids))
+        self.indptr = np.concatenate([[0], np.cumsum(self.out_degree)])
+
+        table = graph.component_table
+        rows = np.array([table.rows[comp_id] for comp_id in self.component_ids], dtype=np.int64)
+        criticality_factor = table.criticality_score[rows] / 10.0
+        vuln_factor = np.array([
+            max(1.0, graph.get_max_exploit_probability(comp_id)) for comp_id in self.component_ids
+        ], dtype=np.float64)
+
+        # Per-target part of the daily hazard; the time ramp depends on the source
+        self.target_hazard = BASE_DAILY_PROBABILITY * criticality_factor * vuln_factor
+        self.ramp_survival = ramp_survival(self.target_hazard)
+        self.is_application = table.type_code[rows] == table.type_code_of(SoftwareType.APPLICATION)
+
+    def _expand_out_edges(self, nodes: np.ndarray):
+        """Positions in the edge arrays of all out-edges of the given nodes, and their owner"""
+        degrees = self.out_degree[nodes]
+        owner = np.repeat(np.arange(len(nodes)), degrees)
+        offsets = np.arange(len(owner)) - np.repeat(np.cumsum(degrees) - degrees, degrees)
+        return self.indptr[nodes][owner] + offsets, owner
+
+    def _run_batch(self, rng: np.random.Generator, trials: int, source: int,
+                   simulation_days: int):
+        """Propagate one batch of trials
+
+        Every out-edge of a newly compromised cell draws its delay once (see
+        sample_compromise_delays) and is queued in the bucket of the day it
+        would fire, so the work is proportional to the edges touched rather
+        than to days x edges.
+
+        Returns the compromised (trial, component) cells as parallel arrays of
+        trial, component, compromise day and source component (-1 for the
+        initial compromise), in the order the compromises happened.
+        """
+        n = len(self.component_ids)
+        compromised = np.zeros((trials, n), dtype=bool)
+        compromised[:, source] = True
+
+        record_trials = [np.arange(trials)]
+        record_nodes = [np.full(trials, source, dtype=np.int64)]
+        record_days = [np.zeros(trials, dtype=np.int64)]
+        record_sources = [np.full(trials, -1, dtype=np.int64)]
+
+        # Pending edge firings bucketed by day: (trial, target, source) arrays
+        buckets: List[List[tuple]] = [[] for _ in range(simulation_days)]
+
+        def schedule(cell_trials, cell_nodes, day):
+            edge_pos, owner = self._expand_out_edges(cell_nodes)
+            if len(edge_pos) == 0:
+                return
+            targets = self.edge_targets[edge_pos]
+            fire_day = day + sample_compromise_delays(
+                rng, self.target_hazard[targets], self.ramp_survival[targets])
+            keep = fire_day < simulation_days
+            fire_day = fire_day[keep]
+            pending = (cell_trials[owner][keep], targets[keep], cell_nodes[owner][keep])
+
+            order = np.argsort(fire_day, kind="stable")
+            fire_day = fire_day[order]
+            pending = tuple(column[order] for column in pending)
+            days, starts = np.unique(fire_day, return_index=True)
+            bounds = list(starts) + [len(fire_day)]
+            for i, fire in enumerate(days):
+                buckets[fire].append(tuple(column[bounds[i]:bounds[i + 1]] for column in pending))
+
+        schedule(record_trials[0], record_nodes[0], 0)
+
+        for day in range(1, simulation_days):
+            if not buckets[day]:
+                continue
+            pending = [np.concatenate(column) for column in zip(*buckets[day])]
+            buckets[day] = []
+            pair_trials, targets, sources = pending
+
+            open_pairs = ~compromised[pair_trials, targets]
+            if not open_pairs.any():
+                continue
+
+            # A component hit by several edges on the same day keeps the first source
+            hit_cells = pair_trials[open_pairs] * n + targets[open_pairs]
+            hit_cells, first = np.unique(hit_cells, return_index=True)
+            hit_trials, hit_targets = np.divmod(hit_cells, n)
+            hit_sources = sources[open_pairs][first]
+
+            compromised[hit_trials, hit_targets] = True
+            record_trials.append(hit_trials)
+            record_nodes.append(hit_targets)
+            record_days.append(np.full(len(hit_cells), day, dtype=np.int64))
+            record_sources.append(hit_sources)
+
+            schedule(hit_trials, hit_targets, day)
+
+        return (np.concatenate(record_trials), np.concatenate(record_nodes),
+                np.concatenate(record_days), np.concatenate(record_sources))
+
+    def _trial_result(self, rng: np.random.Generator, initial_compromise: str,
+                      nodes: np.ndarray, days: np.ndarray, sources: np.ndarray,
+                      simulation_days: int, detection_probability: float,
+                      start_time: datetime) -> Dict[str, Any]:
+        """Build a result in the simulate_attack_propagation() schema for one trial"""
+        dates = [(start_time + timedelta(days=day)).isoformat() for day in range(simulation_days)]
+        day_of = dict(zip(nodes.tolist(), days.tolist()))
+
+        timeline = []
+        for idx, day, source in zip(nodes.tolist(), days.tolist(), sources.tolist()):
+            if source < 0:
+                continue
+            days_since = day - day_of[source]
+            probability = min(1.0, days_since / TIME_FACTOR_RAMP_DAYS) * self.target_hazard[idx]
+            timeline.append({
+                'day': day,
+                'date': dates[day],
+                'component_id': self.component_ids[idx],
+                'component_name': self.graph.components[self.component_ids[idx]].name,
+                'source_component': self.component_ids[source],
+                'compromise_probability': float(probability)
+            })
+
+        detection_events = []
+        if detection_probability > 0:
+            checked = np.arange(simulation_days)[None, :] >= days[:, None]
+            detected = checked & (rng.random(checked.shape) < detection_probability)
+            for day, row in zip(*np.nonzero(detected.T)):
+                idx = int(nodes[row])
+                detection_events.append({
+                    'day': int(day),
+                    'date': dates[day],
+                    'component_id': self.component_ids[idx],
+                    'component_name': self.graph.components[self.component_ids[idx]].name,
+                    'days_since_compromise': int(day - days[row])
+                })
+
+        total_components = len(self.component_ids)
+        return {
+            'initial_compromise': initial_compromise,
+            'simulation_days': simulation_days,
+            'total_components': total_components,
+            'compromised_count': len(nodes),
+            'compromise_percentage': (len(nodes) / total_components) * 100,
+            'applications_affected': int(self.is_application[nodes].sum()),
+            'timeline': timeline,
+            'detection_events': detection_events,
+            'final_compromised_components': [self.component_ids[i] for i in nodes]
+        }
+
+    def run(self, initial_compromise: str, n_trials: int = 1000,
+            simulation_days: int = 30, detection_probability: float = 0.1,
+            seed: Optional[int] = None, return_trials: bool = False,
+            batch_size: Optional[int] = None) -> Dict[str, Any]:
+        """Run n_trials independent propagation simulations from one component
+
+        Returns a result in the simulate_attack_propagation() schema whose
+        numeric fields are averaged over all trials.  The list-valued fields
+        (timeline, detection_events) describe the first trial, while
+        final_compromised_components lists the components compromised in at
+        least half of the trials.  Per-component compromise frequencies and
+        spreads are added under extra keys, and with return_trials=True every
+        individual trial is included under 'trials' in the same schema.
+        """
+        if initial_compromise not in self.positions:
+            raise ValueError(f"Component {initial_compromise} not found")
+        if n_trials < 1:
+            raise ValueError("n_trials must be at least 1")
+
+        rng = np.random.default_rng(seed)
+        source = self.positions[initial_compromise]
+        n = len(self.component_ids)
+        start_time = datetime.now()
+
+        if batch_size is None:
+            batch_size = max(1, DEFAULT_CELL_BUDGET // max(1, n))
+
+        compromised_counts = np.zeros(n_trials, dtype=np.int64)
+        applications = np.zeros(n_trials, dtype=np.int64)
+        detections = np.zeros(n_trials, dtype=np.int64)
+        per_component = np.zeros(n, dtype=np.int64)
+        daily_new = np.zeros(simulation_days, dtype=np.int64)
+        trials: List[Dict[str, Any]] = []
+
+        for start in range(0, n_trials, batch_size):
+            count = min(batch_size, n_trials - start)
+            trial_ids, nodes, days, sources = self._run_batch(rng, count, source, simulation_days)
+
+            compromised_counts[start:start + count] = np.bincount(trial_ids, minlength=count)
+            applications[start:start + count] = np.bincount(
+                trial_ids, weights=self.is_application[nodes], minlength=count)
+            per_component += np.bincount(nodes, minlength=n)
+            daily_new += np.bincount(days[sources >= 0], minlength=simulation_days)
+
+            # Detection does not feed back into propagation, so each compromised
+            # cell gets one binomial draw over the days it stayed compromised
+            detected = rng.binomial(simulation_days - days, detection_probability)
+            detections[start:start + count] = np.bincount(trial_ids, weights=detected, minlength=count)
+
+            wanted = count if return_trials else int(start == 0)
+            if wanted:
+                by_trial = np.argsort(trial_ids, kind="stable")
+                bounds = np.searchsorted(trial_ids[by_trial], np.arange(wanted + 1))
+                for row in range(wanted):
+                    cells = by_trial[bounds[row]:bounds[row + 1]]
+                    trials.append(self._trial_result(
+                        rng, initial_compromise, nodes[cells], days[cells], sources[cells],
+                        simulation_days, detection_probability, start_time))
+
+        percentages = compromised_counts / n * 100
+        frequency = per_component / n_trials
+
+        result = {
+            'initial_compromise': initial_compromise,
+            'simulation_days': simulation_days,
+            'total_components': n,
+            'compromised_count': float(compromised_counts.mean()),
+            'compromise_percentage': float(percentages.mean()),
+            'applications_affected': float(applications.mean()),
+            'timeline': trials[0]['timeline'],
+            'detection_events': trials[0]['detection_events'],
+            'final_compromised_components': [
+                comp_id for comp_id, f in zip(self.component_ids, frequency) if f >= 0.5
+            ],
+            'n_trials': n_trials,
+            'compromise_percentage_std': float(percentages.std()),
+            'average_detection_events': float(detections.mean()),
+            'average_daily_new_compromises': (daily_new / n_trials).tolist(),
+            'compromise_frequency': {
+                comp_id: float(f) for comp_id, f in zip(self.component_ids, frequency) if f > 0
+            }
+        }
+
+        if return_trials:
+            result['trials'] = trials
+
+        return result
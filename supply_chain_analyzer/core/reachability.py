@@ -0,0 +1,211 @@
+"""
+Reachability Index for dependency graphs.
+
+This module provides a precomputed transitive-closure index so that unlimited
+depth dependent/dependency queries do not need a fresh graph traversal on
+every call.  Strongly connected components are condensed first and every
+component of the resulting DAG stores the set of reachable nodes as a Python
+integer used as a bitset.
+"""
+
+import networkx as nx
+import numpy as np
+from typing import Dict, Iterable, Iterator, List, Sequence
+
+
+def popcount(bits: int) -> int:
+    """Number of set bits in an integer bitset"""
+    if hasattr(bits, "bit_count"):
+        return bits.bit_count()
+    return bin(bits).count("1")
+
+
+def bit_positions(bits: int) -> np.ndarray:
+    """Indices of the set bits in an integer bitset, in ascending order"""
+    if not bits:
+        return np.empty(0, dtype=np.int64)
+    nbytes = (bits.bit_length() + 7) // 8
+    raw = np.frombuffer(bits.to_bytes(nbytes, "little"), dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(raw, bitorder="little"))
+
+
+def weighted_bit_sums(bitsets: Sequence[int], weights: np.ndarray,
+                      chunk_rows: int = 1024) -> np.ndarray:
+    """Sum of weights[i] over the set bits i of every bitset
+
+    Bitsets are unpacked into a dense bit matrix a chunk of rows at a time, so
+    memory stays bounded while the summation itself is a matrix product.
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    nbits = len(weights)
+    nbytes = max(1, (nbits + 7) // 8)
+    sums = np.zeros(len(bitsets), dtype=np.float64)
+
+    for start in range(0, len(bitsets), chunk_rows):
+        rows = bitsets[start:start + chunk_rows]
+        raw = b"".join(bits.to_bytes(nbytes, "little") for bits in rows)
+        matrix = np.frombuffer(raw, dtype=np.uint8).reshape(len(rows), nbytes)
+        unpacked = np.unpackbits(matrix, axis=1, bitorder="little")[:, :nbits]
+        sums[start:start + len(rows)] = unpacked @ weights
+
+    return sums
+
+
+def within_depth_bitsets(successors: Sequence[Sequence[int]], max_depth: int) -> Iterator[List[int]]:
+    """Yield, for d = 1..max_depth, the bitset of nodes within distance d of every node
+
+    Level d is derived from level d - 1 by one union over each node's direct
+    successors, so all sources share the frontier work.  Iteration stops
+    early once no node's reachable set grows any further.
+    """
+    within = [1 << node for node in range(len(successors))]
+
+    for _ in range(max_depth):
+        grown = []
+        changed = False
+        for node, node_successors in enumerate(successors):
+            bits = within[node]
+            for successor in node_successors:
+                bits |= within[successor]
+            if bits != within[node]:
+                changed = True
+            grown.append(bits)
+        within = grown
+        yield within
+        if not changed:
+            break
+
+
+class ReachabilityIndex:
+    """Transitive reachability of a DiGraph stored as per-SCC bitsets
+
+    Edges point from a dependency to its dependent, so the descendants of a
+    node are its dependents and the ancestors are its dependencies.  The index
+    is updated in place when nodes or edges are added; an edge that closes a
+    new cycle merges SCCs and marks the index stale, in which case it is
+    rebuilt lazily on the next query.
+    """
+
+    def __init__(self, graph):
+        self._graph = graph
+        self._stale = True
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Recompute the index from the current graph"""
+        self._node_ids: List[str] = list(self._graph.nodes())
+        self._bit: Dict[str, int] = {node: i for i, node in enumerate(self._node_ids)}
+
+        # The compact CSR backend is converted for the SCC condensation
+        graph = self._graph.to_networkx() if hasattr(self._graph, "to_networkx") else self._graph
+        condensed = nx.condensation(graph)
+        mapping = condensed.graph["mapping"]
+        self._scc_of: List[int] = [mapping[node] for node in self._node_ids]
+
+        members = [0] * condensed.number_of_nodes()
+        for bit, scc in enumerate(self._scc_of):
+            members[scc] |= 1 << bit
+
+        order = list(nx.topological_sort(condensed))
+        self._descendants: List[int] = list(members)
+        self._ancestors: List[int] = list(members)
+
+        for scc in reversed(order):
+            bits = self._descendants[scc]
+            for successor in condensed.successors(scc):
+                bits |= self._descendants[successor]
+            self._descendants[scc] = bits
+
+        for scc in order:
+            bits = self._ancestors[scc]
+            for predecessor in condensed.predecessors(scc):
+                bits |= self._ancestors[predecessor]
+            self._ancestors[scc] = bits
+
+        self._stale = False
+
+    def _ensure_fresh(self) -> None:
+        if self._stale:
+            self.rebuild()
+
+    def _sccs_of_bits(self, bits: int) -> Iterable[int]:
+        return {self._scc_of[bit] for bit in bit_positions(bits)}
+
+    def add_node(self, node_id: str) -> None:
+        """Register a newly added (isolated) node"""
+        if self._stale or node_id in self._bit:
+            return
+        bit = len(self._node_ids)
+        self._node_ids.append(node_id)
+        self._bit[node_id] = bit
+        self._scc_of.append(len(self._descendants))
+        self._descendants.append(1 << bit)
+        self._ancestors.append(1 << bit)
+
+    def add_edge(self, source: str, target: str) -> None:
+        """Register a newly added edge source -> target"""
+        if self._stale:
+            return
+        if source not in self._bit or target not in self._bit:
+            self._stale = True
+            return
+
+        source_scc = self._scc_of[self._bit[source]]
+        target_scc = self._scc_of[self._bit[target]]
+        if source_scc == target_scc:
+            return
+
+        # Closing a cycle merges components; leave that to a full rebuild
+        if (self._descendants[target_scc] >> self._bit[source]) & 1:
+            self._stale = True
+            return
+
+        # Already reachable, closure is unchanged
+        if (self._descendants[source_scc] >> self._bit[target]) & 1:
+            return
+
+        reached = self._descendants[target_scc]
+        for scc in self._sccs_of_bits(self._ancestors[source_scc]):
+            self._descendants[scc] |= reached
+
+        reaching = self._ancestors[source_scc]
+        for scc in self._sccs_of_bits(reached):
+            self._ancestors[scc] |= reaching
+
+    def descendant_weighted_sums(self, weights: Dict[str, float]) -> Dict[str, float]:
+        """Sum of weights over the descendants of every node, excluding the node itself"""
+        self._ensure_fresh()
+        node_weights = np.array([weights.get(node, 0.0) for node in self._node_ids], dtype=np.float64)
+        scc_sums = weighted_bit_sums(self._descendants, node_weights)
+        return {
+            node: float(scc_sums[self._scc_of[bit]] - node_weights[bit])
+            for bit, node in enumerate(self._node_ids)
+        }
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._graph
+
+    def _without_self(self, bits: int, node_id: str) -> int:
+        return bits & ~(1 << self._bit[node_id])
+
+    def descendants(self, node_id: str) -> List[str]:
+        """All nodes reachable from node_id, excluding node_id itself"""
+        self._ensure_fresh()
+        bits = self._without_self(self._descendants[self._scc_of[self._bit[node_id]]], node_id)
+        return [self._node_ids[i] for i in bit_positions(bits)]
+
+    def ancestors(self, node_id: str) -> List[str]:
+        """All nodes that can reach node_id, excluding node_id itself"""
+        self._ensure_fresh()
+        bits = self._without_self(self._ancestors[self._scc_of[self._bit[node_id]]], node_id)
+        return [self._node_ids[i] for i in bit_positions(bits)]
+
+    def count_descendants(self, node_id: str) -> int:
+        """Number of nodes reachable from node_id"""
+        self._ensure_fresh()
+        return popcount(self._descendants[self._scc_of[self._bit[node_id]]]) - 1
+
+    def count_ancestors(self, node_id: str) -> int:
+        """Number of nodes that can reach node_id"""
+        self._ensure_fresh()
+        return popcount(self._ancestors[self._scc_of[self._bit[node_id]]]) - 1
@@ -0,0 +1,214 @@
+"""
+Binary snapshots of dependency graphs.
+
+A snapshot is a directory of raw .npy arrays (CSR adjacency, the columnar
+component attributes and UTF-8 string tables) plus a JSON manifest.  The
+arrays are opened as read-only memory maps, so reopening a large graph does
+not re-parse anything and several processes analyzing the same snapshot
+share its pages.  Vulnerabilities, which are few compared to components,
+are kept as JSON records and built lazily like in load_from_json().
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from .csr_graph import CSRDiGraph
+from .json_stream import load_json_file
+
+SNAPSHOT_FORMAT = "supply-chain-graph-snapshot"
+SNAPSHOT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+VULNERABILITIES_NAME = "vulnerabilities.json"
+
+
+def pack_strings(values: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Encode strings as one UTF-8 byte blob and int64 end offsets"""
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def unpack_strings(blob: np.ndarray, offsets: np.ndarray) -> List[str]:
+    """Decode strings packed by pack_strings()"""
+    raw = blob.tobytes()
+    bounds = offsets.tolist()
+    text = raw.decode("utf-8")
+    if len(text) == len(raw):
+        # Pure ASCII: byte offsets are character offsets
+        return [text[bounds[i]:bounds[i + 1]] for i in range(len(bounds) - 1)]
+    return [raw[bounds[i]:bounds[i + 1]].decode("utf-8") for i in range(len(bounds) - 1)]
+
+
+def _adjacency(graph) -> Dict[str, Any]:
+    """CSR arrays of a DependencyGraph, indexed like graph.components"""
+    ids = list(graph.components)
+    if graph.backend == "csr" and graph.graph.nodes() == ids:
+        csr = graph.graph
+    else:
+        csr = CSRDiGraph()
+        csr.add_nodes_from(ids)
+        edges = list(graph.graph.edges(data=True))
+        csr.add_edge_columns([edge[0] for edge in edges], [edge[1] for edge in edges],
+                             [edge[2].get("dependency_type", "direct") for edge in edges])
+
+    indptr, indices = csr.csr()
+    reverse_indptr, reverse_indices = csr.csr(reverse=True)
+    types, type_names = csr.edge_types()
+    return {
+        "arrays": {
+            "indptr": indptr, "indices": indices, "edge_types": types,
+            "reverse_indptr": reverse_indptr, "reverse_indices": reverse_indices
+        },
+        "dependency_types": type_names
+    }
+
+
+def save_snapshot(graph, directory: str) -> str:
+    """Write a DependencyGraph to a snapshot directory and return its path"""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    # The manifest is removed first and written last, so an interrupted save
+    # is never loadable, even over an existing snapshot
+    (directory / MANIFEST_NAME).unlink(missing_ok=True)
+
+    components = list(graph.components.values())
+    table = graph.component_table
+    adjacency = _adjacency(graph)
+    arrays = dict(adjacency["arrays"])
+
+    # Component rows follow graph.components, as the table's rows do
+    arrays.update({
+        "criticality_score": table.criticality_score,
+        "type_code": table.type_code,
+        "is_compromised": table.is_compromised,
+        "patch_time_days": table.patch_time_days,
+        "vendor_code": table.vendor_code,
+        "version_code": table.version_code,
+        "compromise_time": np.array([c.compromise_time for c in components], dtype="datetime64[us]")
+    })
+    for column, values in (("names", [c.name for c in components]),
+                           ("descriptions", [c.description for c in components]),
+                           ("vendors", table.vendors.values),
+                           ("versions", table.versions.values)):
+        arrays[f"{column}_blob"], arrays[f"{column}_offsets"] = pack_strings(values)
+
+    for array_name, values in arrays.items():
+        np.save(directory / f"{array_name}.npy", np.ascontiguousarray(values))
+
+    with open(directory / VULNERABILITIES_NAME, "w") as f:
+        json.dump([
+            {
+                "component_id": component_id,
+                "id": f"{component_id}:{vuln.cve_id}",
+                "cve_id": vuln.cve_id,
+                "severity": vuln.severity.value,
+                "description": vuln.description,
+                "affected_versions": vuln.affected_versions,
+                "discovery_date": vuln.discovery_date.isoformat(),
+                "patch_available": vuln.patch_available,
+                "exploit_probability": vuln.exploit_probability
+            }
+            for component_id in graph.components
+            for vuln in graph.get_component_vulnerabilities(component_id)
+        ], f, separators=(",", ":"))
+
+    manifest = {
+        "format": SNAPSHOT_FORMAT,
+        "version": SNAPSHOT_VERSION,
+        "name": graph.name,
+        "created": datetime.now().isoformat(),
+        "components": len(components),
+        "dependencies": int(len(arrays["indices"])),
+        "software_types": [software_type.value for software_type in table.software_types],
+        "dependency_types": adjacency["dependency_types"],
+        "arrays": sorted(arrays)
+    }
+    with open(directory / MANIFEST_NAME, "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    return str(directory)
+
+
+def read_manifest(directory: str) -> Dict[str, Any]:
+    """Read and validate the manifest of a snapshot directory"""
+    path = Path(directory) / MANIFEST_NAME
+    if not path.exists():
+        raise ValueError(f"No graph snapshot found in {directory}")
+    with open(path) as f:
+        manifest = json.load(f)
+    if manifest.get("format") != SNAPSHOT_FORMAT:
+        raise ValueError(f"{directory} is not a dependency graph snapshot")
+    if manifest.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version {manifest.get('version')} "
+                         f"(expected {SNAPSHOT_VERSION})")
+    return manifest
+
+
+def load_snapshot(directory: str, backend: str = "csr", mmap: bool = True):
+    """Open a snapshot written by save_snapshot() as a DependencyGraph
+
+    With the csr backend the adjacency arrays stay memory-mapped; component
+    objects and the component table are built from the mapped columns.
+    """
+    from .dependency_graph import DependencyGraph, SoftwareComponent, SoftwareType
+
+    manifest = read_manifest(directory)
+    directory = Path(directory)
+    mmap_mode = "r" if mmap else None
+    arrays = {name: np.load(directory / f"{name}.npy", mmap_mode=mmap_mode)
+              for name in manifest["arrays"]}
+
+    def strings(column: str) -> List[str]:
+        return unpack_strings(arrays[f"{column}_blob"], arrays[f"{column}_offsets"])
+
+    software_types = [SoftwareType(value) for value in manifest["software_types"]]
+    names = strings("names")
+    vendors, versions = strings("vendors"), strings("versions")
+    components = [
+        SoftwareComponent(
+            name=name,
+            version=versions[version_code],
+            software_type=software_types[type_code],
+            vendor=vendors[vendor_code],
+            description=description,
+            is_compromised=is_compromised,
+            compromise_time=compromise_time,
+            patch_time_days=patch_time_days,
+            criticality_score=criticality_score
+        )
+        for name, version_code, type_code, vendor_code, description, is_compromised,
+        compromise_time, patch_time_days, criticality_score in zip(
+            names, arrays["version_code"].tolist(), arrays["type_code"].tolist(),
+            arrays["vendor_code"].tolist(), strings("descriptions"),
+            arrays["is_compromised"].tolist(), arrays["compromise_time"].tolist(),
+            arrays["patch_time_days"].tolist(), arrays["criticality_score"].tolist()
+        )
+    ]
+
+    graph = DependencyGraph(manifest["name"], backend=backend)
+    ids = [component.id for component in components]
+    if backend == "csr":
+        graph.graph = CSRDiGraph.from_csr(
+            ids, arrays["indptr"], arrays["indices"], arrays["edge_types"],
+            manifest["dependency_types"], arrays["reverse_indptr"], arrays["reverse_indices"]
+        )
+    graph.add_components(components)
+    if backend != "csr":
+        indptr, indices = arrays["indptr"], arrays["indices"]
+        dependency_types = manifest["dependency_types"]
+        sources = np.repeat(np.arange(len(ids)), np.diff(indptr)).tolist()
+        graph.add_dependencies(
+            (ids[target], ids[source], dependency_types[code])
+            for source, target, code in zip(sources, indices.tolist(), arrays["edge_types"].tolist())
+        )
+
+    graph._pending_vulnerabilities = [
+        (record["component_id"], record["id"], record)
+        for record in load_json_file(str(directory / VULNERABILITIES_NAME))
+    ]
+    return graph
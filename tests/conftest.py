@@ -0,0 +1,97 @@
+"""
+Shared fixtures: a local stand-in for the GitHub file hosts.
+"""
+
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class StandInServer:
+    """Serves canned files over HTTP and records every request
+
+    Files are served with an ETag and answer matching If-None-Match
+    requests with 304, like the real hosts. `scripted` queues one-off
+    (status, headers) responses per path, e.g. to simulate rate limiting.
+    """
+
+    def __init__(self):
+        self.files = {}
+        self.delay = 0.0
+        self.requests = []
+        self.statuses = []
+        self.scripted = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with server._lock:
+                    server.requests.append((self.path, dict(self.headers)))
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                    scripted = server.scripted.get(self.path)
+                    scripted = scripted.pop(0) if scripted else None
+                try:
+                    if server.delay:
+                        time.sleep(server.delay)
+                    if scripted is not None:
+                        self._respond(scripted[0], headers=scripted[1])
+                    else:
+                        self._serve_file()
+                finally:
+                    with server._lock:
+                        server.in_flight -= 1
+
+            def _serve_file(self):
+                body = server.files.get(self.path)
+                if body is None:
+                    self._respond(404)
+                    return
+                etag = '"%s"' % hashlib.sha1(body).hexdigest()
+                if self.headers.get("If-None-Match") == etag:
+                    self._respond(304)
+                    return
+                self._respond(200, body, {"ETag": etag})
+
+            def _respond(self, status, body=b"", headers=None):
+                with server._lock:
+                    server.statuses.append(status)
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, args=(0.05,), daemon=True)
+        self.thread.start()
+
+    def add_file(self, path: str, content) -> None:
+        self.files[path] = content.encode() if isinstance(content, str) else content
+
+    def paths_requested(self):
+        with self._lock:
+            return [path for path, _ in self.requests]
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def stand_in_github():
+    server = StandInServer()
+    yield server
+    server.close()
@@ -0,0 +1,82 @@
+"""
+Tests for archive fetch mode in GitHubDependencyAnalyzer, against a local stand-in server.
+"""
+
+import io
+import tarfile
+
+import pytest
+
+from supply_chain_analyzer.analyzers.github_analyzer import GitHubDependencyAnalyzer
+from supply_chain_analyzer.analyzers.request_scheduler import RequestScheduler
+from supply_chain_analyzer.config.settings import GitHubSettings
+
+
+def _tarball(files):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for path, content in files.items():
+            data = content.encode()
+            member = tarfile.TarInfo(f"widgets-main/{path}")
+            member.size = len(data)
+            archive.addfile(member, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+def _analyzer(server, url="https://github.com/octo/widgets"):
+    settings = GitHubSettings(raw_content_url=server.url, archive_url=server.url, http_cache=False)
+    return GitHubDependencyAnalyzer(url, settings=settings, fetch_mode="archive",
+                                    scheduler=RequestScheduler(requests_per_second=None))
+
+
+def test_archive_mode_uses_a_single_request(stand_in_github):
+    stand_in_github.add_file("/octo/widgets/archive/HEAD.tar.gz", _tarball({
+        "README.md": "# widgets",
+        "requirements.txt": "requests==2.31.0\n",
+        "requirements-dev.txt": "pytest==8.0\n",
+        "package.json": '{"dependencies": {"lodash": "^4.17.21"}}',
+        "Widgets.csproj": "<Project />",
+        "services/api/go.mod": "module api\n",
+        "src/widgets.py": "print('hi')\n"
+    }))
+    analyzer = _analyzer(stand_in_github)
+
+    assert analyzer.repo_info["branch"] == "HEAD"
+    assert analyzer.detect_project_type() == ["python", "nodejs", "csharp"]
+    assert [dep["name"] for dep in analyzer.parse_python_dependencies()] == ["requests"]
+    assert set(analyzer.manifest_files()) == {
+        "requirements.txt", "requirements-dev.txt", "package.json", "Widgets.csproj", "services/api/go.mod"
+    }
+
+    graph = analyzer.create_dependency_graph()
+    assert set(graph.components) == {"widgets:main", "requests:2.31.0", "pytest:8.0", "lodash:4.17.21",
+                                     "services/api:main"}
+    assert stand_in_github.paths_requested() == ["/octo/widgets/archive/HEAD.tar.gz"]
+
+
+def test_archive_manifests_of_every_ecosystem_reach_the_graph(stand_in_github):
+    stand_in_github.add_file("/octo/widgets/archive/HEAD.tar.gz", _tarball({
+        "go.mod": "module widgets\n\nrequire github.com/gin-gonic/gin v1.9.1\n",
+        "Widgets.csproj": '<Project><ItemGroup><PackageReference Include="Serilog" Version="3.1.1" />'
+                          '</ItemGroup></Project>',
+        "worker/Cargo.toml": '[package]\nname = "worker"\n\n[dependencies]\ntokio = "1.35"\n'
+    }))
+    graph = _analyzer(stand_in_github).create_dependency_graph()
+
+    assert graph.graph.has_edge("github.com/gin-gonic/gin:1.9.1", "widgets:main")
+    assert graph.graph.has_edge("Serilog:3.1.1", "widgets:main")
+    assert graph.graph.has_edge("tokio:1.35", "worker:main")
+    assert graph.graph.has_edge("worker:main", "widgets:main")
+
+
+def test_archive_of_explicit_branch(stand_in_github):
+    stand_in_github.add_file("/octo/widgets/archive/dev.tar.gz", _tarball({"go.mod": "module widgets\n"}))
+    analyzer = _analyzer(stand_in_github, "https://github.com/octo/widgets/tree/dev")
+
+    assert analyzer.detect_project_type() == ["go"]
+
+
+def test_missing_archive_is_an_error(stand_in_github):
+    analyzer = _analyzer(stand_in_github)
+    with pytest.raises(ValueError, match="HTTP 404"):
+        analyzer.detect_project_type()
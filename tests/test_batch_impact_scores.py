@@ -0,0 +1,57 @@
+"""
+Tests for whole-graph batch impact scoring.
+
+calculate_all_impact_scores() must agree with calculate_impact_score()
+component by component, for unlimited and depth-weighted modes.
+"""
+
+import random
+
+import pytest
+
+from supply_chain_analyzer.core.dependency_graph import DependencyGraph, SoftwareComponent, SoftwareType
+
+
+def build_random_graph(seed: int, components: int = 30, edges: int = 60) -> DependencyGraph:
+    rng = random.Random(seed)
+    graph = DependencyGraph("Random")
+    for i in range(components):
+        graph.add_component(SoftwareComponent(f"pkg{i}", "1.0", SoftwareType.LIBRARY,
+                                              criticality_score=rng.uniform(1, 10)))
+    ids = list(graph.components)
+    for _ in range(edges):
+        graph.add_dependency(rng.choice(ids), rng.choice(ids))
+    return graph
+
+
+@pytest.mark.parametrize("max_depth", [None, 1, 2, 3, 6])
+def test_batch_scores_match_per_component(max_depth):
+    for seed in range(4):
+        graph = build_random_graph(seed)
+        batch = graph.calculate_all_impact_scores(max_depth=max_depth)
+
+        assert list(batch) == list(graph.components)
+        for comp_id, score in batch.items():
+            assert score == pytest.approx(graph.calculate_impact_score(comp_id, max_depth=max_depth))
+
+
+def test_batch_scores_use_reachability_index_when_enabled():
+    graph = build_random_graph(11)
+    expected = graph.calculate_all_impact_scores()
+    graph.enable_reachability_index()
+
+    assert graph.calculate_all_impact_scores() == pytest.approx(expected)
+
+
+def test_diamond_dependent_is_counted_once():
+    graph = DependencyGraph("Diamond")
+    for name in ["base", "left", "right", "app"]:
+        graph.add_component(SoftwareComponent(name, "1.0", SoftwareType.LIBRARY, criticality_score=2.0))
+    graph.add_dependency("left:1.0", "base:1.0")
+    graph.add_dependency("right:1.0", "base:1.0")
+    graph.add_dependency("app:1.0", "left:1.0")
+    graph.add_dependency("app:1.0", "right:1.0")
+
+    # base (2.0) + left/right at depth 1 (2 * 2.0 * 0.8) + app once at depth 2 (2.0 * 0.6)
+    assert graph.calculate_impact_score("base:1.0", max_depth=2) == pytest.approx(6.4)
+    assert graph.calculate_all_impact_scores(max_depth=2)["base:1.0"] == pytest.approx(6.4)
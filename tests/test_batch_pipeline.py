@@ -0,0 +1,150 @@
+"""
+Tests for the staged multi-repository pipeline and the analyze-batch command, against a local stand-in server.
+"""
+
+import threading
+import time
+
+import pytest
+
+from supply_chain_analyzer.analyzers.batch_pipeline import BatchPipeline, read_url_list, score_repository
+from supply_chain_analyzer.analyzers.github_analyzer import GitHubDependencyAnalyzer
+from supply_chain_analyzer.analyzers.request_scheduler import RequestScheduler
+from supply_chain_analyzer.cli import SupplyChainCLI
+from supply_chain_analyzer.config.settings import GitHubSettings, Settings
+from supply_chain_analyzer.core.dependency_graph import DependencyGraph, SoftwareComponent, SoftwareType
+from supply_chain_analyzer.core.org_graph import OrgGraph
+from supply_chain_analyzer.core.output_manager import OutputManager
+
+
+def _serve_repositories(server, count=3):
+    urls = []
+    for i in range(count):
+        server.add_file(f"/acme/service{i}/main/requirements.txt",
+                        f"requests==2.31.0\nservice{i}-client==1.{i}\n")
+        urls.append(f"https://github.com/acme/service{i}/tree/main")
+    server.add_file("/acme/empty/main/README.md", "# nothing here")
+    server.scripted["/acme/broken/main/requirements.txt"] = [(500, {})]
+    return urls + ["https://github.com/acme/empty/tree/main", "https://github.com/acme/broken/tree/main"]
+
+
+def _factory(server):
+    settings = GitHubSettings(raw_content_url=server.url, http_cache=False)
+    scheduler = RequestScheduler(requests_per_second=None, max_retries=0)
+
+    def create(url):
+        return GitHubDependencyAnalyzer(url, settings=settings, scheduler=scheduler)
+    return create
+
+
+def test_read_url_list(tmp_path):
+    url_file = tmp_path / "repos.txt"
+    url_file.write_text("# fleet\nhttps://github.com/a/b\n\nhttps://github.com/c/d  # api\nhttps://github.com/a/b\n")
+    assert read_url_list(str(url_file)) == ["https://github.com/a/b", "https://github.com/c/d"]
+
+
+def test_failures_are_isolated_per_repository(stand_in_github, tmp_path):
+    urls = _serve_repositories(stand_in_github)
+    output_manager = OutputManager(str(tmp_path / "outputs"))
+    org_graph = OrgGraph()
+    seen = []
+    pipeline = BatchPipeline(output_manager, io_workers=2, queue_size=1, include_timestamp=False,
+                             analyzer_factory=_factory(stand_in_github), org_graph=org_graph,
+                             progress=lambda result, stats: seen.append(stats.completed))
+
+    results = {result.project_name: result for result in pipeline.run(urls)}
+
+    assert seen == [1, 2, 3, 4, 5]
+    assert pipeline.stats.to_dict()["succeeded"] == 3
+    assert (pipeline.stats.skipped, pipeline.stats.failed) == (1, 1)
+    assert results["acme_empty"].status == "skipped"
+    broken = results["acme_broken"]
+    assert (broken.status, broken.stage) == ("failed", "fetch") and "500" in broken.error
+
+    service = results["acme_service0"]
+    assert service.status == "ok" and service.summary["total_components"] == 3
+    assert set(service.durations) == {"fetch", "score", "write"}
+    files = output_manager.get_project_files("acme_service0")
+    assert files["graphs"] == [service.outputs["dependency_graph"]]
+    assert len(files["metrics"]) == 1 and len(files["reports"]) == 1
+
+    assert org_graph.repositories_using("requests") == ["acme/service0", "acme/service1", "acme/service2"]
+
+
+def test_backpressure_bounds_repositories_in_flight(stand_in_github, tmp_path):
+    urls = _serve_repositories(stand_in_github, count=12)[:12]
+    create = _factory(stand_in_github)
+    lock = threading.Lock()
+    in_flight = {"current": 0, "max": 0}
+
+    def counting_factory(url):
+        with lock:
+            in_flight["current"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["current"])
+        return create(url)
+
+    def slow_writer(result, stats):
+        with lock:
+            in_flight["current"] -= 1
+        time.sleep(0.02)
+
+    pipeline = BatchPipeline(OutputManager(str(tmp_path / "outputs")), io_workers=1, queue_size=1,
+                             analyzer_factory=counting_factory, progress=slow_writer)
+    results = pipeline.run(urls)
+
+    assert len(results) == 12 and all(result.status == "ok" for result in results)
+    # One repository per fetcher, scorer and writer plus one per queue slot
+    assert in_flight["max"] <= 5
+    assert pipeline.stats.repos_per_minute > 0
+
+
+def test_scoring_in_worker_processes(stand_in_github, tmp_path):
+    urls = _serve_repositories(stand_in_github, count=2)[:2]
+    output_manager = OutputManager(str(tmp_path / "outputs"))
+    pipeline = BatchPipeline(output_manager, cpu_workers=2, simulate=True,
+                             analyzer_factory=_factory(stand_in_github), progress=lambda *args: None)
+
+    results = pipeline.run(urls)
+
+    assert [result.status for result in results] == ["ok", "ok"]
+    assert len(output_manager.list_all_projects()) == 2
+
+
+def test_analyze_batch_command(stand_in_github, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    urls = _serve_repositories(stand_in_github, count=2)
+    url_file = tmp_path / "repos.txt"
+    url_file.write_text("\n".join(urls))
+
+    settings = Settings()
+    settings.github = GitHubSettings(raw_content_url=stand_in_github.url, http_cache=False,
+                                     requests_per_second=None, max_retries=0)
+    monkeypatch.setattr("supply_chain_analyzer.cli.load_config", lambda: settings)
+    # The command uses the process-wide scheduler for the settings above
+    monkeypatch.setattr("supply_chain_analyzer.analyzers.request_scheduler._shared_schedulers", {})
+    output_dir = tmp_path / "outputs"
+
+    assert SupplyChainCLI().run(["--output-dir", str(output_dir), "analyze-batch", str(url_file),
+                                 "--io-workers", "2", "--no-timestamp"]) == 0
+    assert OutputManager(str(output_dir)).list_all_projects() == ["acme_service0", "acme_service1"]
+
+
+def test_impact_scores_are_depth_limited():
+    graph = DependencyGraph("Chain")
+    names = ["base", "middle", "top", "app"]
+    for name in names:
+        graph.add_component(SoftwareComponent(name, "1.0", SoftwareType.LIBRARY, criticality_score=5.0))
+    for dependency, dependent in zip(names, names[1:]):
+        graph.add_dependency(f"{dependent}:1.0", f"{dependency}:1.0")
+    _, shallow = score_repository(graph, max_depth=1)
+    _, deep = score_repository(graph, max_depth=3)
+
+    top = shallow['critical_components'][0][0]
+    assert shallow['impact_scores'][top] == graph.calculate_impact_score(top, max_depth=1)
+    assert deep['impact_scores'][top] == graph.calculate_impact_score(top, max_depth=3)
+    assert deep['impact_scores'][top] > shallow['impact_scores'][top]
+
+
+def test_rejects_invalid_sizes(tmp_path):
+    with pytest.raises(ValueError):
+        BatchPipeline(OutputManager(str(tmp_path / "outputs")), queue_size=0)
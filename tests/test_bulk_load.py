@@ -0,0 +1,90 @@
+"""
+Tests for the bulk JSON loader and the batched add_components/add_dependencies.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from supply_chain_analyzer.analyzers.risk_analyzer import RiskAnalyzer
+from supply_chain_analyzer.core.dependency_graph import (
+    DependencyGraph, SoftwareComponent, SoftwareType, Vulnerability, VulnerabilityLevel,
+    create_sample_graph
+)
+
+
+def _snapshot(graph):
+    return {
+        "components": {comp_id: (c.name, c.version, c.software_type, c.is_compromised, c.compromise_time)
+                       for comp_id, c in graph.components.items()},
+        "edges": sorted((u, v, d["dependency_type"]) for u, v, d in graph.graph.edges(data=True)),
+        "vulnerabilities": sorted(graph.vulnerabilities),
+        "max_severity": {comp_id: graph.get_max_severity(comp_id) for comp_id in graph.components}
+    }
+
+
+@pytest.mark.parametrize("backend", ["networkx", "csr"])
+def test_load_matches_original_graph(tmp_path, backend):
+    graph = create_sample_graph()
+    path = str(tmp_path / "graph.json")
+    graph.export_to_json(filepath=path)
+
+    loaded = DependencyGraph.load_from_json(path, backend=backend)
+    assert _snapshot(loaded) == _snapshot(graph)
+
+
+def test_vulnerabilities_are_built_on_first_access(tmp_path):
+    graph = create_sample_graph()
+    path = str(tmp_path / "graph.json")
+    graph.export_to_json(filepath=path)
+
+    loaded = DependencyGraph.load_from_json(path)
+    assert loaded._pending_vulnerabilities
+    assert loaded._vulnerabilities == {}
+
+    # Compromise flags are applied at load time, without building the records
+    assert {c.id for c in loaded.components.values() if c.is_compromised} == \
+        {c.id for c in graph.components.values() if c.is_compromised}
+
+    assert len(loaded.vulnerabilities) == len(graph.vulnerabilities)
+    assert not loaded._pending_vulnerabilities
+
+
+def test_gzip_export_and_component_names_with_colons(tmp_path):
+    graph = DependencyGraph("colons")
+    lib = SoftwareComponent("org:lib", "1.0", SoftwareType.LIBRARY)
+    app = SoftwareComponent("app", "2.0", SoftwareType.APPLICATION)
+    graph.add_component(lib)
+    graph.add_component(app)
+    graph.add_dependency(app.id, lib.id)
+    graph.add_vulnerability(lib.id, Vulnerability(
+        "CVE-2024-0001", VulnerabilityLevel.HIGH, "test", ["1.0"], datetime(2024, 1, 1)
+    ))
+
+    path = str(tmp_path / "graph.json.gz")
+    graph.export_to_json(filepath=path, compress=True)
+
+    loaded = DependencyGraph.load_from_json(path, defer_vulnerabilities=False)
+    assert _snapshot(loaded) == _snapshot(graph)
+    assert loaded.get_max_severity(lib.id) == VulnerabilityLevel.HIGH
+
+
+def test_bulk_additions_skip_unknown_components_and_refresh_risk():
+    graph = DependencyGraph("bulk", backend="csr")
+    components = [SoftwareComponent(f"lib{i}", "1.0", SoftwareType.LIBRARY) for i in range(3)]
+    graph.add_component(components[0])
+    analyzer = RiskAnalyzer(graph)
+    analyzer.calculate_supply_chain_risk_score()
+
+    graph.add_components(components[1:])
+    graph.add_dependencies([
+        (components[1].id, components[0].id, "direct"),
+        (components[2].id, components[1].id, "transitive"),
+        (components[2].id, "missing:1.0", "direct")
+    ])
+
+    assert graph.graph.number_of_edges() == 2
+    assert list(graph.graph.successors(components[0].id)) == [components[1].id]
+
+    incremental = analyzer.calculate_supply_chain_risk_score()
+    assert incremental == RiskAnalyzer(graph).calculate_supply_chain_risk_score()
@@ -0,0 +1,67 @@
+"""
+Tests for the slotted SoftwareComponent and the columnar component table.
+"""
+
+import pickle
+
+from supply_chain_analyzer.core.dependency_graph import (
+    DependencyGraph, SoftwareComponent, SoftwareType, create_sample_graph
+)
+
+
+def test_components_are_slotted():
+    component = SoftwareComponent("lodash", "4.17.21", SoftwareType.LIBRARY)
+    assert not hasattr(component, "__dict__")
+    assert component.id == "lodash:4.17.21"
+    assert component == SoftwareComponent("lodash", "4.17.21", SoftwareType.LIBRARY)
+
+
+def test_attribute_changes_write_through():
+    graph = create_sample_graph()
+    table = graph.component_table
+    component = graph.components["lodash:4.17.21"]
+    row = table.row_of(component.id)
+
+    component.criticality_score = 2.5
+    component.is_compromised = True
+    component.vendor = "openjs"
+    assert table.criticality_score[row] == 2.5
+    assert table.is_compromised[row]
+    assert table.vendors.decode(table.vendor_code[row]) == "openjs"
+
+
+def test_table_matches_components():
+    graph = create_sample_graph()
+    graph.simulate_attack_propagation("lodash:4.17.21", 20)
+    table = graph.component_table
+
+    for comp_id, component in graph.components.items():
+        row = table.row_of(comp_id)
+        assert table.criticality_score[row] == component.criticality_score
+        assert table.is_compromised[row] == component.is_compromised
+        assert table.software_types[table.type_code[row]] == component.software_type
+
+    counts = table.type_counts()
+    stats = graph.get_graph_stats()
+    assert stats["applications"] == counts[SoftwareType.APPLICATION]
+    assert stats["compromised_components"] == sum(c.is_compromised for c in graph.components.values())
+
+
+def test_replacing_component_reuses_row_and_detaches_old():
+    graph = DependencyGraph()
+    old = SoftwareComponent("pkg", "1.0", SoftwareType.LIBRARY, criticality_score=3)
+    new = SoftwareComponent("pkg", "1.0", SoftwareType.SERVICE, criticality_score=8)
+    graph.add_component(old)
+    graph.add_component(new)
+
+    old.criticality_score = 1
+    assert len(graph.component_table) == 1
+    assert graph.component_table.criticality_score[0] == 8
+    assert graph.get_graph_stats()["services"] == 1
+
+
+def test_graph_pickles_with_table():
+    graph = pickle.loads(pickle.dumps(create_sample_graph()))
+    component = graph.components["redis:7.0.0"]
+    component.criticality_score = 4.0
+    assert graph.component_table.criticality_score[graph.component_table.row_of(component.id)] == 4.0
@@ -0,0 +1,96 @@
+"""
+Tests for the compact CSR graph backend.
+
+A DependencyGraph built with backend="csr" must answer every query the same
+way as the default networkx backend.
+"""
+
+import random
+
+import pytest
+
+from supply_chain_analyzer.analyzers.risk_analyzer import RiskAnalyzer
+from supply_chain_analyzer.core.csr_graph import CSRDiGraph
+from supply_chain_analyzer.core.dependency_graph import (
+    DependencyGraph, SoftwareComponent, SoftwareType, create_sample_graph
+)
+
+
+def build_pair(seed: int, components: int = 40, edges: int = 90):
+    rng = random.Random(seed)
+    specs = [(f"pkg{i}", rng.choice(list(SoftwareType)), rng.uniform(1, 10)) for i in range(components)]
+    ids = [f"{name}:1.0" for name, _, _ in specs]
+    edge_list = [(rng.choice(ids), rng.choice(ids), rng.choice(["direct", "dev"])) for _ in range(edges)]
+
+    graphs = []
+    for backend in ("networkx", "csr"):
+        graph = DependencyGraph("Random", backend=backend)
+        for name, software_type, criticality in specs:
+            graph.add_component(SoftwareComponent(name, "1.0", software_type, criticality_score=criticality))
+        for dependent, dependency, kind in edge_list:
+            graph.add_dependency(dependent, dependency, kind)
+        graphs.append(graph)
+    return graphs
+
+
+def test_queries_match_networkx_backend():
+    for seed in range(3):
+        nx_graph, csr_graph = build_pair(seed)
+        assert csr_graph.graph.number_of_edges() == nx_graph.graph.number_of_edges()
+        assert (sorted(csr_graph.graph.edges(data=True), key=str) ==
+                sorted(nx_graph.graph.edges(data=True), key=str))
+
+        for comp_id in nx_graph.components:
+            for depth in (None, 1, 3):
+                assert (sorted(csr_graph.get_dependents(comp_id, max_depth=depth)) ==
+                        sorted(nx_graph.get_dependents(comp_id, max_depth=depth)))
+                assert (sorted(csr_graph.get_dependencies(comp_id, max_depth=depth)) ==
+                        sorted(nx_graph.get_dependencies(comp_id, max_depth=depth)))
+                assert (csr_graph.calculate_impact_score(comp_id, max_depth=depth) ==
+                        pytest.approx(nx_graph.calculate_impact_score(comp_id, max_depth=depth)))
+            assert csr_graph.count_dependents(comp_id) == nx_graph.count_dependents(comp_id)
+            assert sorted(csr_graph.get_dependents(comp_id, direct_only=True)) == \
+                sorted(nx_graph.get_dependents(comp_id, direct_only=True))
+
+
+def test_batch_scores_and_risk_analysis_match():
+    nx_graph, csr_graph = build_pair(5)
+    for depth in (None, 2):
+        expected = nx_graph.calculate_all_impact_scores(depth)
+        actual = csr_graph.calculate_all_impact_scores(depth)
+        assert actual == pytest.approx(expected)
+
+    csr_graph.enable_reachability_index()
+    assert csr_graph.calculate_all_impact_scores() == pytest.approx(nx_graph.calculate_all_impact_scores())
+
+    expected = RiskAnalyzer(nx_graph).calculate_supply_chain_risk_score()
+    actual = RiskAnalyzer(csr_graph).calculate_supply_chain_risk_score()
+    assert actual['component_risks'] == expected['component_risks']
+    assert actual['overall_risk_score'] == pytest.approx(expected['overall_risk_score'])
+
+
+def test_repeated_edge_keeps_latest_type():
+    graph = CSRDiGraph()
+    graph.add_edge("a", "b", dependency_type="dev")
+    graph.add_edge("a", "c")
+    graph.add_edge("a", "b", dependency_type="direct")
+    assert graph.number_of_edges() == 2
+    assert ("a", "b", {"dependency_type": "direct"}) in graph.edges(data=True)
+    assert graph.has_edge("a", "c") and not graph.has_edge("c", "a")
+    assert list(graph.predecessors("b")) == ["a"]
+
+
+def test_export_and_simulation_with_csr_backend(tmp_path):
+    graph = DependencyGraph.load_from_json(
+        create_sample_graph().export_to_json(filepath=str(tmp_path / "sample.json")), backend="csr"
+    )
+    assert graph.backend == "csr"
+    result = graph.simulate_attack_propagation('lodash:4.17.21', 30, rng=random.Random(3))
+    assert result['final_compromised_components'][0] == 'lodash:4.17.21'
+    batch = graph.simulate_attack_propagation_batch('lodash:4.17.21', n_trials=50, seed=1)
+    assert batch['n_trials'] == 50
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        DependencyGraph(backend="igraph")
@@ -0,0 +1,129 @@
+"""
+Tests for transitive dependency resolution and its persistent memo.
+"""
+
+import json
+
+import pytest
+
+from supply_chain_analyzer.analyzers.dependency_resolver import (
+    DependencyResolver, HTTPIndexSource, LocalIndexSource, ResolverMemo, create_index_source
+)
+from supply_chain_analyzer.analyzers.local_analyzer import LocalRepositoryAnalyzer
+from supply_chain_analyzer.analyzers.request_scheduler import RequestFailedError, RequestScheduler
+
+INDEX = {
+    "requests/2.31.0": ["urllib3==2.0.7", "idna==3.4", "certifi"],
+    "urllib3/2.0.7": [],
+    "idna/3.4": [],
+    "certifi/latest": ["chain==1.0"],
+    "chain/1.0": ["deeper==1.0"],
+    "deeper/1.0": [],
+    "flask/3.0.0": ["requests==2.31.0"]
+}
+
+
+def _document(key, requires):
+    name, version = key.split("/")
+    return json.dumps({"name": name, "version": version, "requires": [
+        {"name": r.split("==")[0], "version": r.split("==")[1] if "==" in r else None} for r in requires
+    ]})
+
+
+@pytest.fixture
+def index_dir(tmp_path):
+    root = tmp_path / "index"
+    for key, requires in INDEX.items():
+        path = root / f"{key}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(_document(key, requires))
+    return root
+
+
+def test_resolve_expands_level_by_level(index_dir):
+    resolver = DependencyResolver(LocalIndexSource(str(index_dir)))
+
+    one_level = resolver.resolve([("requests", "2.31.0")], max_depth=1)
+    assert one_level == {("requests", "2.31.0"): [("urllib3", "2.0.7"), ("idna", "3.4"), ("certifi", "latest")]}
+
+    resolved = resolver.resolve([("requests", "2.31.0"), ("unknown", "1.0")], max_depth=3)
+    assert resolved[("certifi", "latest")] == [("chain", "1.0")]
+    assert resolved[("chain", "1.0")] == [("deeper", "1.0")]
+    assert ("deeper", "1.0") not in resolved
+    assert resolved[("unknown", "1.0")] == []
+
+
+def test_memo_is_shared_across_resolvers(index_dir, tmp_path):
+    memo = ResolverMemo(str(tmp_path / "memo.sqlite"))
+    first = DependencyResolver(LocalIndexSource(str(index_dir)), memo)
+    expected = first.resolve([("flask", "3.0.0"), ("unknown", "1.0")], max_depth=3)
+    assert first.memo_hits == 0
+
+    second = DependencyResolver(LocalIndexSource(str(index_dir)), ResolverMemo(str(tmp_path / "memo.sqlite")))
+    assert second.resolve([("flask", "3.0.0"), ("unknown", "1.0")], max_depth=3) == expected
+    # Pinned packages and unknown ones come from the memo; "latest" is looked up again
+    assert second.fetched == 1
+    assert second.memo_hits == first.fetched - 1
+
+
+def test_unknown_answers_expire_from_the_memo(index_dir, tmp_path):
+    DependencyResolver(LocalIndexSource(str(index_dir)), ResolverMemo(str(tmp_path / "memo.sqlite"))) \
+        .requirements_of([("unknown", "1.0"), ("idna", "3.4")])
+
+    resolver = DependencyResolver(LocalIndexSource(str(index_dir)),
+                                  ResolverMemo(str(tmp_path / "memo.sqlite"), negative_ttl_seconds=0))
+    assert resolver.requirements_of([("unknown", "1.0"), ("idna", "3.4")]) == {
+        ("unknown", "1.0"): None, ("idna", "3.4"): []}
+    assert (resolver.memo_hits, resolver.fetched) == (1, 1)
+
+
+def test_http_index_failures_raise_and_are_not_memoized(stand_in_github, tmp_path):
+    stand_in_github.add_file("/pypi/idna/3.4.json", _document("idna/3.4", []))
+    stand_in_github.scripted["/pypi/idna/3.4.json"] = [(403, {})]
+    source = HTTPIndexSource(f"{stand_in_github.url}/pypi", RequestScheduler(requests_per_second=None))
+    memo = ResolverMemo(str(tmp_path / "memo.sqlite"))
+
+    with pytest.raises(RequestFailedError, match="HTTP 403"):
+        DependencyResolver(source, memo).requirements_of([("idna", "3.4")])
+    assert memo.get_many(source.source_id, [("idna", "3.4")]) == {}
+    assert DependencyResolver(source, memo).requirements_of([("idna", "3.4")]) == {("idna", "3.4"): []}
+
+
+def test_http_index_is_queried_concurrently(stand_in_github):
+    for key, requires in INDEX.items():
+        stand_in_github.add_file(f"/pypi/{key}.json", _document(key, requires))
+    stand_in_github.delay = 0.1
+    source = create_index_source(f"{stand_in_github.url}/pypi",
+                                 RequestScheduler(requests_per_second=None))
+    assert isinstance(source, HTTPIndexSource)
+
+    resolved = DependencyResolver(source).resolve([("requests", "2.31.0")], max_depth=2)
+    assert resolved[("certifi", "latest")] == [("chain", "1.0")]
+    assert stand_in_github.max_in_flight > 1
+
+
+def test_missing_index_directory_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        create_index_source(str(tmp_path / "missing"))
+
+
+def test_analyzer_adds_transitive_dependencies(index_dir, tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "requirements.txt").write_text("flask==3.0.0\n")
+
+    def build(max_depth, max_components=30):
+        resolver = DependencyResolver(LocalIndexSource(str(index_dir)))
+        analyzer = LocalRepositoryAnalyzer(str(repo), resolver=resolver)
+        return analyzer.create_dependency_graph(max_components, max_depth)
+
+    assert set(build(max_depth=1).components) == {"repo:local", "flask:3.0.0"}
+
+    graph = build(max_depth=3)
+    assert {"requests:2.31.0", "urllib3:2.0.7", "certifi:latest"} <= set(graph.components)
+    assert "chain:1.0" not in graph.components
+    # Edges point from a dependency to its dependent
+    assert graph.graph.has_edge("requests:2.31.0", "flask:3.0.0")
+    assert graph.graph.edges["urllib3:2.0.7", "requests:2.31.0"]["dependency_type"] == "transitive"
+
+    assert len(build(max_depth=3, max_components=2).components) == 3
@@ -0,0 +1,68 @@
+"""
+Tests for the level-synchronous depth traversal.
+
+Layers, depth-limited queries and analyze_dependency_depth() must agree with
+shortest-path distances computed independently by networkx.
+"""
+
+import random
+
+import networkx as nx
+import pytest
+
+from supply_chain_analyzer.core.dependency_graph import (
+    DependencyGraph, SoftwareComponent, SoftwareType, create_sample_graph
+)
+
+
+def build_random_graph(seed: int, components: int = 40, edges: int = 90) -> DependencyGraph:
+    rng = random.Random(seed)
+    graph = DependencyGraph("Random")
+    for i in range(components):
+        graph.add_component(SoftwareComponent(f"pkg{i}", "1.0", SoftwareType.LIBRARY,
+                                              criticality_score=rng.uniform(1, 10)))
+    ids = list(graph.components)
+    for _ in range(edges):
+        graph.add_dependency(rng.choice(ids), rng.choice(ids))
+    return graph
+
+
+def reference_layers(graph, component_id, max_depth, reverse=False):
+    source_graph = graph.graph.reverse(copy=False) if reverse else graph.graph
+    distances = nx.single_source_shortest_path_length(source_graph, component_id, cutoff=max_depth)
+    layers = {}
+    for node, distance in distances.items():
+        if distance > 0:
+            layers.setdefault(distance, set()).add(node)
+    return [layers[d] for d in sorted(layers)]
+
+
+@pytest.mark.parametrize("max_depth", [1, 2, 4, 10])
+def test_layers_match_shortest_path_distances(max_depth):
+    for seed in range(3):
+        graph = build_random_graph(seed)
+        for comp_id in graph.components:
+            dependents = graph.get_depth_layers(comp_id, max_depth)
+            dependencies = graph.get_depth_layers(comp_id, max_depth, direction="dependencies")
+            assert [set(layer) for layer in dependents] == reference_layers(graph, comp_id, max_depth)
+            assert ([set(layer) for layer in dependencies] ==
+                    reference_layers(graph, comp_id, max_depth, reverse=True))
+
+
+def test_depth_analysis_matches_per_depth_queries():
+    graph = build_random_graph(7)
+    comp_id = next(iter(graph.components))
+    analysis = graph.analyze_dependency_depth(comp_id, max_depth=6)
+
+    for depth in range(1, 7):
+        key = str(depth)
+        assert analysis["dependents_by_depth"][key]["count"] == len(graph.get_dependents(comp_id, max_depth=depth))
+        assert (analysis["dependencies_by_depth"][key]["count"] ==
+                len(graph.get_dependencies(comp_id, max_depth=depth)))
+        assert analysis["impact_by_depth"][key] == round(graph.calculate_impact_score(comp_id, max_depth=depth), 2)
+
+
+def test_unknown_direction_rejected():
+    graph = create_sample_graph()
+    with pytest.raises(ValueError):
+        graph.get_depth_layers("lodash:4.17.21", 2, direction="sideways")
@@ -0,0 +1,59 @@
+"""
+Tests for the all-components depth profile matrix.
+
+Every row must match the per-component layered traversal, and the profile
+must round-trip through the OutputManager metrics export.
+"""
+
+import random
+
+import pandas as pd
+import pytest
+
+from supply_chain_analyzer.core.dependency_graph import DependencyGraph, SoftwareComponent, SoftwareType
+from supply_chain_analyzer.core.output_manager import OutputManager
+
+
+def build_random_graph(seed: int, components: int = 40, edges: int = 80) -> DependencyGraph:
+    rng = random.Random(seed)
+    graph = DependencyGraph("Random")
+    for i in range(components):
+        graph.add_component(SoftwareComponent(f"pkg{i}", "1.0", SoftwareType.LIBRARY,
+                                              criticality_score=rng.uniform(1, 10)))
+    ids = list(graph.components)
+    for _ in range(edges):
+        graph.add_dependency(rng.choice(ids), rng.choice(ids))
+    return graph
+
+
+@pytest.mark.parametrize("max_depth", [1, 3, 10])
+def test_profile_rows_match_layers(max_depth):
+    for seed in range(3):
+        graph = build_random_graph(seed)
+        profile = graph.depth_profile_matrix(max_depth, include_impact=True)
+        assert profile["counts"].shape == (len(graph.components), max_depth)
+
+        for i, comp_id in enumerate(profile["components"]):
+            layers = graph.get_depth_layers(comp_id, max_depth)
+            expected = [len(layer) for layer in layers] + [0] * (max_depth - len(layers))
+            assert profile["counts"][i].tolist() == expected
+            score = graph.calculate_impact_score(comp_id, max_depth=max_depth)
+            criticality = graph.components[comp_id].criticality_score
+            assert profile["impact"][i].sum() + criticality == pytest.approx(score)
+
+
+def test_impact_omitted_by_default():
+    graph = build_random_graph(1)
+    assert "impact" not in graph.depth_profile_matrix(4)
+
+
+def test_save_depth_profile(tmp_path):
+    graph = build_random_graph(2)
+    profile = graph.depth_profile_matrix(5, include_impact=True)
+    path = OutputManager(str(tmp_path)).save_depth_profile(profile, "random", include_timestamp=False)
+
+    frame = pd.read_csv(path)
+    assert path.endswith("metrics/random_depth_profile.csv")
+    assert list(frame["component_id"]) == profile["components"]
+    assert frame["dependents_depth_3"].tolist() == profile["counts"][:, 2].tolist()
+    assert "impact_depth_5" in frame.columns
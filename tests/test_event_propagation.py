@@ -0,0 +1,55 @@
+"""
+Tests for the event-driven (next-event) propagation engine.
+
+The event engine must produce the same result schema as the daily loop and
+agree with it in distribution.
+"""
+
+import random
+import time
+
+from supply_chain_analyzer.core.dependency_graph import create_sample_graph
+
+
+def mean_compromise_percentage(graph, engine, trials, days=30, seed=0):
+    rng = random.Random(seed)
+    total = 0.0
+    for _ in range(trials):
+        result = graph.simulate_attack_propagation(
+            'lodash:4.17.21', days, 0.1, rng=rng, engine=engine
+        )
+        total += result['compromise_percentage']
+    return total / trials
+
+
+def test_event_engine_matches_daily_schema():
+    graph = create_sample_graph()
+    daily = graph.simulate_attack_propagation('lodash:4.17.21', 30, rng=random.Random(1))
+    event = graph.simulate_attack_propagation('lodash:4.17.21', 30, rng=random.Random(1),
+                                              engine='event')
+
+    assert set(daily) == set(event)
+    assert event['final_compromised_components'][0] == 'lodash:4.17.21'
+    timeline_keys = {'day', 'date', 'component_id', 'component_name',
+                     'source_component', 'compromise_probability'}
+    for entry in event['timeline']:
+        assert set(entry) == timeline_keys
+        assert 0 < entry['day'] < 30
+    days = [entry['day'] for entry in event['timeline']]
+    assert days == sorted(days)
+
+
+def test_event_engine_agrees_with_daily_in_distribution():
+    graph = create_sample_graph()
+    daily = mean_compromise_percentage(graph, 'daily', 1500, seed=11)
+    event = mean_compromise_percentage(graph, 'event', 1500, seed=12)
+    assert abs(daily - event) < 1.5
+
+
+def test_event_engine_long_horizon_is_cheap():
+    graph = create_sample_graph()
+    start = time.perf_counter()
+    for seed in range(50):
+        graph.simulate_attack_propagation('lodash:4.17.21', 365, 0.01,
+                                          rng=random.Random(seed), engine='event')
+    assert time.perf_counter() - start < 2.0
@@ -0,0 +1,111 @@
+"""
+Tests for manifest fetching in GitHubDependencyAnalyzer, against a local stand-in server.
+"""
+
+import time
+
+from supply_chain_analyzer.analyzers.github_analyzer import GitHubDependencyAnalyzer
+from supply_chain_analyzer.analyzers.http_cache import HTTPCache
+from supply_chain_analyzer.analyzers.request_scheduler import RequestScheduler
+from supply_chain_analyzer.config.settings import GitHubSettings
+
+REPO = "/octo/widgets/main"
+
+
+def _analyzer(server, http_cache=None, **settings):
+    server.add_file(f"{REPO}/README.md", "# widgets")
+    github_settings = GitHubSettings(raw_content_url=server.url, http_cache=http_cache is not None,
+                                     **settings)
+    scheduler = RequestScheduler(requests_per_second=None,
+                                 max_concurrency=github_settings.max_concurrent_requests)
+    return GitHubDependencyAnalyzer("https://github.com/octo/widgets", settings=github_settings,
+                                    scheduler=scheduler, http_cache=http_cache)
+
+
+def test_manifests_are_fetched_once_per_run(stand_in_github):
+    stand_in_github.add_file(f"{REPO}/requirements.txt", "requests==2.31.0\nflask>=2.0\n")
+    stand_in_github.add_file(f"{REPO}/package.json", '{"dependencies": {"lodash": "^4.17.21"}}')
+    analyzer = _analyzer(stand_in_github)
+    assert analyzer.repo_info["branch"] == "main"
+
+    assert analyzer.detect_project_type() == ["python", "nodejs"]
+    probes = [path for path in stand_in_github.paths_requested() if path.startswith(REPO + "/")
+              and not path.endswith("README.md")]
+    assert len(probes) == len(set(probes))
+
+    python_deps = analyzer.parse_python_dependencies()
+    node_deps = analyzer.parse_nodejs_dependencies()
+    assert [dep["name"] for dep in python_deps] == ["requests", "flask"]
+    assert [dep["name"] for dep in node_deps] == ["lodash"]
+
+    graph = analyzer.create_dependency_graph()
+    assert len(graph.components) == 4
+    after = [path for path in stand_in_github.paths_requested() if not path.endswith("README.md")]
+    assert len(after) == len(probes)
+
+
+def test_manifest_probes_run_concurrently(stand_in_github):
+    analyzer = _analyzer(stand_in_github, max_concurrent_requests=16)
+    stand_in_github.delay = 0.2
+
+    start = time.perf_counter()
+    assert analyzer.detect_project_type() == []
+    elapsed = time.perf_counter() - start
+
+    probes = sum(1 for files in GitHubDependencyAnalyzer.MANIFEST_FILES.values()
+                 for file_pattern in files if "*" not in file_pattern)
+    assert elapsed < probes * stand_in_github.delay / 3
+
+
+def test_default_branch_follows_configured_order(stand_in_github):
+    stand_in_github.add_file("/octo/widgets/master/README.md", "# widgets")
+    stand_in_github.add_file("/octo/widgets/develop/README.md", "# widgets")
+    settings = GitHubSettings(raw_content_url=stand_in_github.url, http_cache=False)
+
+    analyzer = GitHubDependencyAnalyzer("https://github.com/octo/widgets", settings=settings,
+                                        scheduler=RequestScheduler(requests_per_second=None))
+    assert analyzer.repo_info["branch"] == "master"
+
+
+def _cached_run(server, cache, **settings):
+    analyzer = _analyzer(server, http_cache=cache, **settings)
+    return analyzer.detect_project_type(), analyzer.parse_python_dependencies()
+
+
+def test_http_cache_revalidates_and_remembers_missing_files(stand_in_github, tmp_path):
+    stand_in_github.add_file(f"{REPO}/requirements.txt", "requests==2.31.0\n")
+    cache = HTTPCache(str(tmp_path / "cache"))
+
+    first = _cached_run(stand_in_github, cache)
+    assert first[0] == ["python"]
+    statuses = list(stand_in_github.statuses)
+
+    stand_in_github.statuses.clear()
+    second = _cached_run(stand_in_github, cache)
+    assert second == first
+    # Only the files that exist (README and requirements.txt) are asked for again, as 304s
+    assert stand_in_github.statuses == [304, 304]
+    assert statuses.count(404) > 0
+
+
+def test_negative_entries_expire(stand_in_github, tmp_path):
+    cache = HTTPCache(str(tmp_path / "cache"), negative_ttl_seconds=0)
+    _cached_run(stand_in_github, cache)
+
+    stand_in_github.add_file(f"{REPO}/requirements.txt", "flask==3.0\n")
+    types, deps = _cached_run(stand_in_github, cache)
+    assert types == ["python"]
+    assert [dep["name"] for dep in deps] == ["flask"]
+
+
+def test_offline_mode_serves_only_from_cache(stand_in_github, tmp_path):
+    stand_in_github.add_file(f"{REPO}/requirements.txt", "requests==2.31.0\n")
+    cache = HTTPCache(str(tmp_path / "cache"))
+    online = _cached_run(stand_in_github, cache)
+
+    stand_in_github.requests.clear()
+    settings = GitHubSettings(raw_content_url=stand_in_github.url, offline=True)
+    analyzer = GitHubDependencyAnalyzer("https://github.com/octo/widgets", settings=settings,
+                                        scheduler=RequestScheduler(), http_cache=cache)
+    assert (analyzer.detect_project_type(), analyzer.parse_python_dependencies()) == online
+    assert stand_in_github.requests == []
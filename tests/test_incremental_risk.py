@@ -0,0 +1,119 @@
+"""
+Tests for incremental risk recomputation driven by the graph change journal.
+
+After any sequence of mutations, a long-lived RiskAnalyzer must report the
+same component risks and aggregates as a fresh one.
+"""
+
+import copy
+import random
+from datetime import datetime
+
+import pytest
+
+from supply_chain_analyzer.analyzers.risk_analyzer import RiskAnalyzer
+from supply_chain_analyzer.core.dependency_graph import (
+    DependencyGraph, SoftwareComponent, SoftwareType, Vulnerability, VulnerabilityLevel
+)
+
+
+def random_component(rng, i):
+    return SoftwareComponent(f"pkg{i}", "1.0", rng.choice(list(SoftwareType)),
+                             criticality_score=rng.uniform(1, 10))
+
+
+def random_vulnerability(rng, i):
+    return Vulnerability(f"CVE-2024-{i:05d}", rng.choice(list(VulnerabilityLevel)), "", ["1.0"],
+                         datetime(2024, 1, 1), patch_available=True)
+
+
+def assert_matches_fresh(live, graph):
+    expected = RiskAnalyzer(graph).calculate_supply_chain_risk_score()
+    actual = live.calculate_supply_chain_risk_score()
+    assert actual['component_risks'] == expected['component_risks']
+    assert actual['risk_distribution'] == expected['risk_distribution']
+    assert actual['high_risk_components'] == expected['high_risk_components']
+    assert actual['overall_risk_score'] == pytest.approx(expected['overall_risk_score'])
+    assert actual['critical_paths'] == expected['critical_paths']
+
+
+@pytest.mark.parametrize("use_index", [False, True])
+def test_incremental_updates_match_full_recompute(use_index):
+    rng = random.Random(4)
+    graph = DependencyGraph("Feed", use_reachability_index=use_index)
+    for i in range(30):
+        graph.add_component(random_component(rng, i))
+
+    live = RiskAnalyzer(graph)
+    assert_matches_fresh(live, graph)
+
+    for step in range(120):
+        ids = list(graph.components)
+        action = rng.random()
+        if action < 0.5:
+            graph.add_dependency(rng.choice(ids), rng.choice(ids))
+        elif action < 0.9:
+            graph.add_vulnerability(rng.choice(ids), random_vulnerability(rng, step))
+        else:
+            graph.add_component(random_component(rng, 30 + step))
+
+        if step % 7 == 0:
+            assert_matches_fresh(live, graph)
+    assert_matches_fresh(live, graph)
+
+
+def test_single_update_recomputes_only_affected_components():
+    rng = random.Random(9)
+    graph = DependencyGraph("Chain")
+    for i in range(200):
+        graph.add_component(random_component(rng, i))
+    ids = list(graph.components)
+    for i in range(1, 200):
+        graph.add_dependency(ids[i], ids[i - 1])
+
+    live = RiskAnalyzer(graph)
+    live.calculate_supply_chain_risk_score()
+
+    recomputed = []
+    original = live._compute_component_risks
+
+    def tracking(component_ids):
+        recomputed.extend(component_ids)
+        return original(component_ids)
+
+    live._compute_component_risks = tracking
+    graph.add_vulnerability(ids[100], random_vulnerability(rng, 1))
+    live.calculate_supply_chain_risk_score(include_critical_paths=False)
+    assert recomputed == [ids[100]]
+
+    # Ancestors of the tail already have at least 10 dependents
+    recomputed.clear()
+    graph.add_component(SoftwareComponent("leaf", "1.0", SoftwareType.APPLICATION))
+    graph.add_dependency("leaf:1.0", ids[-1])
+    live.calculate_supply_chain_risk_score(include_critical_paths=False)
+    assert sorted(recomputed) == sorted(["leaf:1.0"] + ids[-10:])
+
+
+def test_results_are_independent_of_the_live_table():
+    rng = random.Random(11)
+    graph = DependencyGraph("Feed")
+    for i in range(20):
+        graph.add_component(random_component(rng, i))
+    live = RiskAnalyzer(graph)
+
+    ids = list(graph.components)
+    first = live.calculate_supply_chain_risk_score()
+    snapshot = copy.deepcopy(first['component_risks'])
+    first['component_risks'].pop("pkg0:1.0")
+    first['component_risks'][ids[4]]['risk_score'] = 0
+    first['critical_paths'].append({})
+    # The assessment behind the memo hands out its own per-component entries too
+    live._assess_supply_chain_risk(True)['component_risks'][ids[5]]['risk_score'] = 0
+
+    graph.add_dependency(ids[1], ids[2])
+    graph.add_vulnerability(ids[3], random_vulnerability(rng, 1))
+
+    assert first['component_risks'].keys() == snapshot.keys() - {"pkg0:1.0"}
+    assert first['component_risks'][ids[3]] == snapshot[ids[3]]
+    assert live.calculate_supply_chain_risk_score()['total_components'] == 20
+    assert_matches_fresh(live, graph)
@@ -0,0 +1,76 @@
+"""
+Tests for the streaming JSON export.
+"""
+
+import gzip
+import json
+
+import pytest
+
+from supply_chain_analyzer.core.dependency_graph import DependencyGraph, create_sample_graph
+from supply_chain_analyzer.core.json_stream import JsonStreamWriter, StreamedArray, StreamedMapping
+from supply_chain_analyzer.core.output_manager import OutputManager
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_stream_writer_matches_json_dump(tmp_path, indent):
+    document = {
+        "name": "x",
+        "empty_mapping": {},
+        "empty_array": [],
+        "mapping": {"a": {"b": [1, 2, {"c": None}]}, "d\n": "eé"},
+        "array": [{"x": 1}, [], "s"]
+    }
+    path = tmp_path / "out.json"
+    with open(path, "w") as f:
+        JsonStreamWriter(f, indent=indent).write_object([
+            ("name", "x"),
+            ("empty_mapping", StreamedMapping(iter([]))),
+            ("empty_array", StreamedArray(iter([]))),
+            ("mapping", StreamedMapping(iter(document["mapping"].items()))),
+            ("array", StreamedArray(iter(document["array"])))
+        ])
+
+    separators = (",", ":") if indent is None else None
+    assert path.read_text() == json.dumps(document, indent=indent, separators=separators)
+
+
+def test_compact_gzip_round_trip(tmp_path):
+    graph = create_sample_graph()
+    plain = graph.export_to_json(filepath=str(tmp_path / "graph.json"))
+    packed = graph.export_to_json(filepath=str(tmp_path / "graph.json.gz"), compact=True, compress=True)
+
+    with gzip.open(packed, "rt") as f:
+        text = f.read()
+    assert "\n" not in text
+    assert json.loads(text)["components"] == json.load(open(plain))["components"]
+
+    loaded = DependencyGraph.load_from_json(packed)
+    assert set(loaded.components) == set(graph.components)
+    assert sorted(loaded.graph.edges()) == sorted(graph.graph.edges())
+    assert set(loaded.vulnerabilities) == set(graph.vulnerabilities)
+
+
+def test_statistics_modes(tmp_path):
+    graph = create_sample_graph()
+    skipped = graph.export_to_json(filepath=str(tmp_path / "skip.json"), statistics="skip")
+    assert "graph_statistics" not in json.load(open(skipped))
+
+    cached = graph.get_cached_graph_stats()
+    assert graph.get_cached_graph_stats() is cached
+    exported = json.load(open(graph.export_to_json(filepath=str(tmp_path / "cached.json"), statistics="cached")))
+    assert exported["graph_statistics"] == cached
+
+    graph.components["lodash:4.17.21"].criticality_score = 2.0
+    assert graph.get_cached_graph_stats() is not cached
+
+    with pytest.raises(ValueError):
+        graph.export_to_json(filepath=str(tmp_path / "bad.json"), statistics="sometimes")
+
+
+def test_output_manager_destination(tmp_path):
+    manager = OutputManager(str(tmp_path))
+    path = create_sample_graph().export_to_json(output_manager=manager, project_name="sample", compress=True)
+    assert path.startswith(str(tmp_path / "graphs"))
+    assert "sample_dependencies_" in path and path.endswith(".json.gz")
+    assert DependencyGraph.load_from_json(path).name == "Sample Software Dependencies"
@@ -0,0 +1,95 @@
+"""
+Tests for LocalRepositoryAnalyzer and the analyze-local command.
+"""
+
+import pytest
+
+from supply_chain_analyzer.analyzers.github_analyzer import GitHubDependencyAnalyzer
+from supply_chain_analyzer.analyzers.local_analyzer import LocalRepositoryAnalyzer
+from supply_chain_analyzer.cli import SupplyChainCLI
+from supply_chain_analyzer.core.output_manager import OutputManager
+
+
+def _write(root, files):
+    for path, content in files.items():
+        target = root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content)
+
+
+@pytest.fixture
+def monorepo(tmp_path):
+    root = tmp_path / "monorepo"
+    _write(root, {
+        ".gitignore": "# build output\nbuild/\n*.bak\n",
+        "requirements.txt": "requests==2.31.0\n",
+        "requirements-dev.txt": "pytest==8.0.0\n",
+        "package.json": '{"dependencies": {"lodash": "^4.17.21"}}',
+        "App.csproj": '<Project><ItemGroup>'
+                      '<PackageReference Include="Newtonsoft.Json" Version="13.0.3" />'
+                      '<PackageReference Include="Serilog"><Version>3.1.1</Version></PackageReference>'
+                      '</ItemGroup></Project>',
+        "services/api/go.mod": "module api\n\nrequire (\n\tgithub.com/gin-gonic/gin v1.9.1\n"
+                               "\tgolang.org/x/net v0.17.0 // indirect\n)\n",
+        "services/worker/Cargo.toml": '[package]\nname = "worker"\n\n[dependencies]\n'
+                                      'serde = { version = "1.0", features = ["derive"] }\ntokio = "1.35"\n',
+        "node_modules/lodash/package.json": '{"dependencies": {"evil": "1.0.0"}}',
+        "build/requirements.txt": "stale==0.1\n",
+        "old/requirements.txt.bak": "ignored==1.0\n",
+        "third_party/setup.py": "install_requires=['vendored==1.0']"
+    })
+    return root
+
+
+def test_discovers_nested_and_wildcard_manifests_honoring_ignores(monorepo):
+    analyzer = LocalRepositoryAnalyzer(str(monorepo), ignore_patterns=["third_party/"])
+
+    assert list(analyzer.discover_manifests()) == [
+        "App.csproj", "package.json", "requirements-dev.txt", "requirements.txt",
+        "services/api/go.mod", "services/worker/Cargo.toml"
+    ]
+    assert analyzer.detect_project_type() == ["python", "nodejs", "csharp"]
+
+
+def test_graph_covers_every_manifest(monorepo):
+    analyzer = LocalRepositoryAnalyzer(str(monorepo), ignore_patterns=["third_party/"])
+    graph = analyzer.create_dependency_graph(max_components=50)
+
+    assert set(graph.components) == {
+        "monorepo:local", "services/api:local", "services/worker:local",
+        "requests:2.31.0", "pytest:8.0.0", "lodash:4.17.21", "Newtonsoft.Json:13.0.3",
+        "Serilog:3.1.1", "github.com/gin-gonic/gin:1.9.1", "golang.org/x/net:0.17.0",
+        "serde:1.0", "tokio:1.35"
+    }
+    # Subproject dependencies sit one level below the main application
+    assert "services/api:local" in graph.get_dependencies("monorepo:local", max_depth=1)
+    assert "tokio:1.35" in graph.get_dependencies("services/worker:local")
+    assert "tokio:1.35" not in graph.get_dependencies("monorepo:local", max_depth=1)
+
+
+def test_rejects_missing_directory(tmp_path):
+    with pytest.raises(ValueError):
+        LocalRepositoryAnalyzer(str(tmp_path / "missing"))
+
+
+def test_analyze_local_command(monorepo, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    output_dir = tmp_path / "outputs"
+    assert SupplyChainCLI().run(["--output-dir", str(output_dir), "analyze-local", str(monorepo),
+                                 "--project-name", "mono_repo"]) == 0
+
+    files = OutputManager(str(output_dir)).get_project_files("mono_repo")
+    assert len(files["graphs"]) == 1 and len(files["reports"]) == 1
+    # Nothing is written outside the output directory
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["monorepo", "outputs"]
+
+
+def test_reads_each_manifest_once_without_network_state(monorepo):
+    analyzer = LocalRepositoryAnalyzer(str(monorepo))
+
+    assert not isinstance(analyzer, GitHubDependencyAnalyzer)
+    assert not hasattr(analyzer, "scheduler") and not hasattr(analyzer, "settings")
+    contents = analyzer.manifest_files()
+    assert contents["requirements.txt"] == "requests==2.31.0\n"
+    assert analyzer._content_cache == contents
+    assert analyzer.fetch_file_content("missing.txt") is None
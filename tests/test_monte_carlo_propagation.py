@@ -0,0 +1,60 @@
+"""
+Tests for the vectorized Monte Carlo attack propagation engine.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from supply_chain_analyzer.core.dependency_graph import DependencyGraph, SoftwareComponent, SoftwareType
+
+
+def build_chain_graph() -> DependencyGraph:
+    graph = DependencyGraph("Chain")
+    names = ["core", "utils", "framework", "service", "app"]
+    for i, name in enumerate(names):
+        software_type = SoftwareType.APPLICATION if name == "app" else SoftwareType.LIBRARY
+        graph.add_component(SoftwareComponent(name, "1.0", software_type, criticality_score=10.0))
+        if i:
+            graph.add_dependency(f"{name}:1.0", f"{names[i - 1]}:1.0")
+    graph.add_dependency("app:1.0", "core:1.0")
+    return graph
+
+
+def test_batch_result_keeps_legacy_schema_and_does_not_mutate_graph():
+    graph = build_chain_graph()
+    legacy_keys = set(graph.simulate_attack_propagation("core:1.0", 10))
+    for component in graph.components.values():
+        component.is_compromised = False
+
+    result = graph.simulate_attack_propagation_batch("core:1.0", n_trials=50, seed=1, return_trials=True)
+    assert legacy_keys <= set(result)
+    assert len(result['trials']) == 50
+    assert all(set(trial) == legacy_keys for trial in result['trials'])
+    assert not any(c.is_compromised for c in graph.components.values())
+    assert result['compromise_percentage'] == pytest.approx(
+        np.mean([t['compromise_percentage'] for t in result['trials']]))
+
+
+def test_batch_is_reproducible_with_seed():
+    graph = build_chain_graph()
+    first = graph.simulate_attack_propagation_batch("core:1.0", n_trials=200, seed=7)
+    second = graph.simulate_attack_propagation_batch("core:1.0", n_trials=200, seed=7)
+    for key in ['compromise_percentage', 'compromise_frequency', 'average_detection_events',
+                'final_compromised_components']:
+        assert first[key] == second[key]
+    assert [e['component_id'] for e in first['timeline']] == [e['component_id'] for e in second['timeline']]
+
+
+def test_batch_matches_sequential_simulation_statistically():
+    graph = build_chain_graph()
+    random.seed(3)
+    sequential = [
+        graph.simulate_attack_propagation("core:1.0", 30, 0.1)['compromise_percentage']
+        for _ in range(400)
+    ]
+    batch = graph.simulate_attack_propagation_batch("core:1.0", n_trials=4000, seed=3)
+
+    assert batch['compromise_percentage'] == pytest.approx(np.mean(sequential), abs=3.0)
+    assert batch['average_detection_events'] > 0
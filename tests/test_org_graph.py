@@ -0,0 +1,109 @@
+"""
+Tests for the organization-wide merged graph and its component registry.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from supply_chain_analyzer.analyzers.risk_analyzer import RiskAnalyzer
+from supply_chain_analyzer.core.dependency_graph import (
+    DependencyGraph, SoftwareComponent, SoftwareType, Vulnerability, VulnerabilityLevel
+)
+from supply_chain_analyzer.core.org_graph import ComponentRegistry, OrgGraph
+
+
+def _repo_graph(app_name, dependencies, transitive=(), subprojects=(), backend="networkx"):
+    graph = DependencyGraph(f"{app_name} Dependencies", backend=backend)
+    app = SoftwareComponent(app_name, "main", SoftwareType.APPLICATION, criticality_score=10.0)
+    graph.add_component(app)
+    for name in subprojects:
+        graph.add_component(SoftwareComponent(name, "local", SoftwareType.APPLICATION))
+        graph.add_dependency(app.id, f"{name}:local")
+    for owner, name, version in dependencies:
+        component = SoftwareComponent(name, version, SoftwareType.LIBRARY)
+        graph.add_component(component)
+        graph.add_dependency(owner or app.id, component.id)
+    for dependent_id, name, version in transitive:
+        graph.add_component(SoftwareComponent(name, version, SoftwareType.LIBRARY))
+        graph.add_dependency(dependent_id, f"{name}:{version}", "transitive")
+    return graph
+
+
+def test_registry_interns_by_name_and_version():
+    registry = ComponentRegistry()
+    first = registry.intern(SoftwareComponent("requests", "2.31.0", SoftwareType.LIBRARY, vendor="psf"))
+    again = registry.intern(SoftwareComponent("requests", "2.31.0", SoftwareType.LIBRARY))
+    other = registry.intern(SoftwareComponent("requests", "2.32.0", SoftwareType.LIBRARY))
+
+    assert again is first and first.vendor == "psf"
+    assert other is not first
+    assert len(registry) == 2 and "requests:2.31.0" in registry
+    assert registry.versions("requests") == ["2.31.0", "2.32.0"]
+
+
+@pytest.mark.parametrize("backend", ["networkx", "csr"])
+def test_repositories_share_library_nodes(backend):
+    org = OrgGraph(backend=backend)
+    org.add_repository("acme/api", _repo_graph(
+        "api", [(None, "requests", "2.31.0")],
+        transitive=[("requests:2.31.0", "certifi", "2024.2.2")]
+    ))
+    org.add_repository("acme/web", _repo_graph(
+        "web", [(None, "requests", "2.31.0"), (None, "flask", "3.0.0")],
+        transitive=[("requests:2.31.0", "certifi", "2024.2.2")]
+    ))
+
+    assert org.repositories == {"acme/api": "acme/api:main", "acme/web": "acme/web:main"}
+    assert org.get_stats() == {"repositories": 2, "shared_components": 3,
+                               "total_components": 5, "total_dependencies": 4}
+    # Both applications point at the same library node
+    structure = org.graph.as_networkx()
+    assert set(structure.successors("requests:2.31.0")) == {"acme/api:main", "acme/web:main"}
+    assert org.graph.components["requests:2.31.0"] is org.registry.get("requests", "2.31.0")
+
+    assert org.consumers("certifi:2024.2.2") == {"acme/api", "acme/web"}
+    assert org.repositories_using("flask") == ["acme/web"]
+    assert org.repositories_using("requests", "2.32.0") == []
+    assert org.shared_components() == [("certifi:2024.2.2", 2), ("requests:2.31.0", 2)]
+
+
+def test_applications_stay_per_repository():
+    org = OrgGraph()
+    org.add_repository("acme/one", _repo_graph("core", [("services/api:local", "gin", "1.9.1")],
+                                               subprojects=["services/api"]))
+    org.add_repository("other/two", _repo_graph("core", [("services/api:local", "gin", "1.9.1")],
+                                                subprojects=["services/api"]))
+
+    assert org.repositories == {"acme/one": "acme/one:main", "other/two": "other/two:main"}
+    assert org.graph.graph.has_edge("acme/one/services/api:local", "acme/one:main")
+    assert org.repositories_using("gin") == ["acme/one", "other/two"]
+    assert len(org.graph.components) == 5
+
+    with pytest.raises(ValueError):
+        org.add_repository("acme/one", _repo_graph("core", []))
+
+
+def _vulnerability(cve_id, severity=VulnerabilityLevel.CRITICAL):
+    return Vulnerability(cve_id, severity, "", ["2.31.0"], datetime(2024, 1, 1), patch_available=True)
+
+
+def test_vulnerabilities_are_merged_once_per_component():
+    api = _repo_graph("api", [(None, "requests", "2.31.0")])
+    api.add_vulnerability("requests:2.31.0", _vulnerability("CVE-2024-0001"))
+    api.add_vulnerability("api:main", _vulnerability("CVE-2024-0002", VulnerabilityLevel.LOW))
+    web = _repo_graph("web", [(None, "requests", "2.31.0"), (None, "flask", "3.0.0")])
+    web.add_vulnerability("requests:2.31.0", _vulnerability("CVE-2024-0001"))
+    web.add_vulnerability("flask:3.0.0", _vulnerability("CVE-2024-0003", VulnerabilityLevel.HIGH))
+
+    org = OrgGraph()
+    org.add_repository("acme/api", api)
+    org.add_repository("acme/web", web)
+
+    assert sorted(org.graph.vulnerabilities) == [
+        "acme/api:main:CVE-2024-0002", "flask:3.0.0:CVE-2024-0003", "requests:2.31.0:CVE-2024-0001"
+    ]
+    assert org.graph.get_max_severity("requests:2.31.0") == VulnerabilityLevel.CRITICAL
+    assert org.consumers("requests:2.31.0") == {"acme/api", "acme/web"}
+    risks = RiskAnalyzer(org.graph).calculate_supply_chain_risk_score()['component_risks']
+    assert risks["requests:2.31.0"]['vulnerability_risk'] == 10
@@ -0,0 +1,116 @@
+"""
+Tests for the SQLite output catalog behind OutputManager.
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+from supply_chain_analyzer.cli import SupplyChainCLI
+from supply_chain_analyzer.core.catalog import parse_output_name
+from supply_chain_analyzer.core.dependency_graph import create_sample_graph
+from supply_chain_analyzer.core.output_manager import OutputManager
+
+
+def _populate(output_manager):
+    graph = create_sample_graph()
+    graph.export_to_json(output_manager=output_manager, project_name="home_assistant")
+    output_manager.save_risk_metrics(pd.DataFrame({"a": [1]}), "home_assistant")
+    output_manager.save_analysis_report({"ok": True}, "requests", include_timestamp=False)
+    graph.save_snapshot(output_manager=output_manager, project_name="requests")
+
+
+def test_saves_are_recorded_with_full_project_names(tmp_path):
+    output_manager = OutputManager(str(tmp_path / "outputs"))
+    _populate(output_manager)
+
+    assert output_manager.list_all_projects() == ["home_assistant", "requests"]
+    files = output_manager.get_project_files("home_assistant")
+    assert len(files["graphs"]) == 1 and len(files["metrics"]) == 1
+    assert output_manager.get_project_files("home") == output_manager.get_project_files("missing")
+
+    summary = output_manager.get_output_summary()
+    assert summary["total_projects"] == 2
+    assert summary["output_directories"] == {
+        "graphs": 1, "reports": 1, "metrics": 1, "visualizations": 0, "snapshots": 1
+    }
+    assert set(summary["recent_projects"]) == {"home_assistant", "requests"}
+
+
+def test_reindex_rebuilds_catalog_from_disk(tmp_path):
+    output_manager = OutputManager(str(tmp_path / "outputs"))
+    _populate(output_manager)
+    expected = output_manager.catalog.project_files("home_assistant")
+
+    output_manager.catalog.db_path.unlink()
+    reopened = OutputManager(str(tmp_path / "outputs"))
+    assert reopened.list_all_projects() == ["home_assistant", "requests"]
+    assert reopened.get_project_files("home_assistant") == expected
+
+    graph_file = expected["graphs"][0]
+    (tmp_path / "outputs" / "graphs" / graph_file.split("/")[-1]).unlink()
+    assert reopened.reindex() == 3
+    assert reopened.get_project_files("home_assistant")["graphs"] == []
+
+
+def test_parse_output_name():
+    assert parse_output_name("graphs", "my_app_dependencies_20240101_120000.json.gz") == \
+        ("my_app", "dependency_graph")
+    assert parse_output_name("metrics", "my_app_depth_profile.csv") == ("my_app", "depth_profile")
+    assert parse_output_name("snapshots", "my_app_snapshot_20240101_120000") == ("my_app", "snapshot")
+    assert parse_output_name("visualizations", "my_app_risk_dashboard_20240101_120000.png") == \
+        ("my_app", "visualization")
+    assert parse_output_name("visualizations", "my_app_attack_path.png") == ("my_app", "visualization")
+    assert parse_output_name("reports", "notes.txt") is None
+
+
+def test_visualizations_are_recorded_after_saving(tmp_path):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    output_manager = OutputManager(str(tmp_path / "outputs"))
+    figure = plt.figure()
+    path = output_manager.save_visualization("home_assistant", "risk_dashboard", figure=figure)
+    plt.close(figure)
+
+    with output_manager.catalog._connect() as conn:
+        size, content_hash = conn.execute("SELECT size, content_hash FROM outputs WHERE path = ?",
+                                          (path,)).fetchone()
+    assert size > 0 and content_hash
+    assert Path(path).name.startswith("home_assistant_risk_dashboard_")
+    assert output_manager.reindex() == 1
+    assert output_manager.get_project_files("home_assistant")["visualizations"] == [path]
+
+
+def test_relative_output_directory_is_independent_of_the_working_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    output_manager = OutputManager("outputs")
+    _populate(output_manager)
+    expected = output_manager.get_project_files("home_assistant")
+    assert all(Path(path).is_absolute() for paths in expected.values() for path in paths)
+
+    monkeypatch.chdir(tmp_path / "outputs")
+    assert output_manager.catalog.remove_missing() == 0
+    assert output_manager.get_project_files("home_assistant") == expected
+
+    monkeypatch.chdir(tmp_path)
+    output_manager.cleanup_old_files(days_old=-1)
+    assert output_manager.catalog.db_path.exists()
+
+
+def test_cleanup_drops_catalog_rows(tmp_path):
+    output_manager = OutputManager(str(tmp_path / "outputs"))
+    _populate(output_manager)
+
+    output_manager.cleanup_old_files(days_old=-1)
+    assert output_manager.list_all_projects() == []
+    assert output_manager.catalog.db_path.exists()
+    assert not any((tmp_path / "outputs" / "snapshots").iterdir())
+
+
+def test_reindex_command(tmp_path, capsys, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _populate(OutputManager(str(tmp_path / "outputs")))
+    assert SupplyChainCLI().run(["--output-dir", str(tmp_path / "outputs"), "reindex"]) == 0
+    assert "Indexed 4 output files" in capsys.readouterr().out
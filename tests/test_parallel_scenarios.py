@@ -0,0 +1,44 @@
+"""
+Tests for process-pool execution of simulation scenario batches.
+
+Merged results must not depend on the number of worker processes.
+"""
+
+from supply_chain_analyzer.core.dependency_graph import create_sample_graph
+
+
+def without_dates(events):
+    return [{k: v for k, v in event.items() if k != 'date'} for event in events]
+
+
+SCENARIOS = [
+    {'name': name, 'initial_component': comp_id, 'simulation_days': 40}
+    for name, comp_id in [('lodash', 'lodash:4.17.21'), ('redis', 'redis:7.0.0'),
+                          ('log4j', 'log4j:2.17.0'), ('express', 'express:4.18.2')]
+]
+
+
+def test_scenario_results_identical_across_worker_counts():
+    graph = create_sample_graph()
+    serial = graph.simulate_multiple_scenarios(SCENARIOS, workers=1, seed=123)
+    parallel = graph.simulate_multiple_scenarios(SCENARIOS, workers=3, seed=123)
+
+    for name in serial['scenarios']:
+        for key in ['compromised_count', 'final_compromised_components']:
+            assert serial['scenarios'][name][key] == parallel['scenarios'][name][key]
+        for key in ['timeline', 'detection_events']:
+            assert (without_dates(serial['scenarios'][name][key]) ==
+                    without_dates(parallel['scenarios'][name][key]))
+    assert serial['summary'] == parallel['summary']
+
+
+def test_patching_race_identical_across_worker_counts():
+    graph = create_sample_graph()
+    scenario = {'initial_component': 'lodash:4.17.21', 'simulation_days': 40}
+    serial = graph.simulate_patching_race(scenario, workers=1, seed=5)
+    parallel = graph.simulate_patching_race(scenario, workers=4, seed=5)
+
+    assert list(serial) == list(parallel)
+    for org_type in serial:
+        assert serial[org_type]['patching_timeline'] == parallel[org_type]['patching_timeline']
+        assert serial[org_type]['patch_effectiveness'] == parallel[org_type]['patch_effectiveness']
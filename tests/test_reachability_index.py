@@ -0,0 +1,59 @@
+"""
+Tests for the precomputed reachability index of DependencyGraph.
+
+The index must answer unlimited-depth dependent/dependency queries exactly
+like a fresh networkx traversal, including after incremental updates.
+"""
+
+import random
+
+import networkx as nx
+
+from supply_chain_analyzer.core.dependency_graph import DependencyGraph, SoftwareComponent, SoftwareType
+
+
+def build_random_graph(seed: int, components: int = 40, edges: int = 80,
+                       use_index: bool = True) -> DependencyGraph:
+    rng = random.Random(seed)
+    graph = DependencyGraph("Random", use_reachability_index=use_index)
+    for i in range(components):
+        graph.add_component(SoftwareComponent(f"pkg{i}", "1.0", SoftwareType.LIBRARY))
+    ids = list(graph.components)
+    for _ in range(edges):
+        graph.add_dependency(rng.choice(ids), rng.choice(ids))
+    return graph
+
+
+def assert_matches_networkx(graph: DependencyGraph):
+    for comp_id in graph.components:
+        assert sorted(graph.get_dependents(comp_id)) == sorted(nx.descendants(graph.graph, comp_id))
+        assert sorted(graph.get_dependencies(comp_id)) == sorted(nx.ancestors(graph.graph, comp_id))
+        assert graph.count_dependents(comp_id) == len(nx.descendants(graph.graph, comp_id))
+        assert graph.count_dependencies(comp_id) == len(nx.ancestors(graph.graph, comp_id))
+
+
+def test_index_matches_traversal_with_cycles():
+    for seed in range(5):
+        assert_matches_networkx(build_random_graph(seed))
+
+
+def test_index_stays_valid_across_incremental_updates():
+    rng = random.Random(42)
+    graph = build_random_graph(7, components=10, edges=5)
+
+    for step in range(60):
+        if step % 4 == 0:
+            graph.add_component(SoftwareComponent(f"late{step}", "2.0", SoftwareType.SERVICE))
+        ids = list(graph.components)
+        graph.add_dependency(rng.choice(ids), rng.choice(ids))
+        assert_matches_networkx(graph)
+
+
+def test_enabling_index_later_gives_same_stats():
+    plain = build_random_graph(3, use_index=False)
+    indexed = build_random_graph(3, use_index=False)
+    indexed.enable_reachability_index()
+
+    assert indexed.has_reachability_index
+    assert plain.get_graph_stats() == indexed.get_graph_stats()
+    assert plain.find_critical_components(min_dependents=2) == indexed.find_critical_components(min_dependents=2)
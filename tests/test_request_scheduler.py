@@ -0,0 +1,99 @@
+"""
+Tests for the rate-limit-aware request scheduler, against a local stand-in server.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from supply_chain_analyzer.analyzers.github_analyzer import GitHubDependencyAnalyzer
+from supply_chain_analyzer.analyzers.request_scheduler import (
+    RequestFailedError, RequestScheduler, get_shared_scheduler, parse_retry_after
+)
+from supply_chain_analyzer.config.settings import GitHubSettings
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    later = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 < parse_retry_after(later) <= 30
+
+
+def test_throttled_requests_are_retried_after_retry_after(stand_in_github):
+    stand_in_github.add_file("/data", "payload")
+    stand_in_github.scripted["/data"] = [(429, {"Retry-After": "0"}),
+                                         (403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0"})]
+    scheduler = RequestScheduler(requests_per_second=None, backoff_seconds=0.01)
+
+    response = scheduler.get(stand_in_github.url + "/data")
+    assert response.status_code == 200 and response.text == "payload"
+    assert scheduler.stats == {"requests": 3, "throttled": 2, "retried": 2, "failed": 0}
+
+
+def test_retries_are_bounded_and_failures_raise(stand_in_github):
+    stand_in_github.scripted["/flaky"] = [(503, {})] * 5
+    scheduler = RequestScheduler(requests_per_second=None, max_retries=2, backoff_seconds=0.01)
+
+    with pytest.raises(RequestFailedError, match="HTTP 503"):
+        scheduler.get(stand_in_github.url + "/flaky")
+    assert scheduler.stats["requests"] == 3
+    assert scheduler.stats["failed"] == 1
+
+    # A missing file is an answer, not a failure
+    assert scheduler.get(stand_in_github.url + "/missing").status_code == 404
+
+
+def test_rate_and_concurrency_limits(stand_in_github):
+    stand_in_github.add_file("/data", "payload")
+    scheduler = RequestScheduler(requests_per_second=40, burst=1, max_concurrency=2)
+    stand_in_github.delay = 0.02
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: scheduler.get(stand_in_github.url + "/data"), range(9)))
+    elapsed = time.perf_counter() - start
+
+    assert elapsed >= 8 / 40 * 0.9
+    assert stand_in_github.max_in_flight <= 2
+
+
+def test_shared_scheduler_follows_the_settings(monkeypatch):
+    monkeypatch.setattr("supply_chain_analyzer.analyzers.request_scheduler._shared_schedulers", {})
+    default = get_shared_scheduler(GitHubSettings())
+
+    assert get_shared_scheduler(GitHubSettings()) is default
+    faster = get_shared_scheduler(GitHubSettings(requests_per_second=50.0, max_retries=0))
+    assert faster is not default
+    assert (faster.requests_per_second, faster.max_retries) == (50.0, 0)
+
+
+def test_analyzer_surfaces_fetch_failures(stand_in_github):
+    stand_in_github.add_file("/octo/widgets/main/README.md", "# widgets")
+    settings = GitHubSettings(raw_content_url=stand_in_github.url, http_cache=False)
+    scheduler = RequestScheduler(requests_per_second=None, max_retries=1, backoff_seconds=0.01)
+    analyzer = GitHubDependencyAnalyzer("https://github.com/octo/widgets", settings=settings,
+                                        scheduler=scheduler)
+
+    stand_in_github.scripted["/octo/widgets/main/requirements.txt"] = [(502, {})] * 2
+    with pytest.raises(RequestFailedError):
+        analyzer.detect_project_type()
+
+
+@pytest.mark.parametrize("status", [401, 403])
+def test_analyzer_raises_on_unsuccessful_statuses(stand_in_github, status):
+    stand_in_github.add_file("/octo/widgets/main/README.md", "# widgets")
+    settings = GitHubSettings(raw_content_url=stand_in_github.url, http_cache=False)
+    scheduler = RequestScheduler(requests_per_second=None, max_retries=0)
+    analyzer = GitHubDependencyAnalyzer("https://github.com/octo/widgets", settings=settings,
+                                        scheduler=scheduler)
+
+    # Neither is a rate limit, and neither means the manifest is missing
+    stand_in_github.scripted["/octo/widgets/main/requirements.txt"] = [(status, {})]
+    with pytest.raises(RequestFailedError, match=f"HTTP {status}"):
+        analyzer.fetch_file_content("requirements.txt")
+    assert analyzer.fetch_file_content("setup.py") is None
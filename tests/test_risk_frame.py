@@ -0,0 +1,46 @@
+"""
+Tests for the vectorized component risk DataFrame.
+"""
+
+import pandas as pd
+import pytest
+
+from supply_chain_analyzer.analyzers.risk_analyzer import RiskAnalyzer
+from supply_chain_analyzer.core.dependency_graph import create_sample_graph
+
+
+def test_frame_matches_legacy_dict():
+    analyzer = RiskAnalyzer(create_sample_graph())
+    frame = analyzer.calculate_component_risk_frame()
+    assessment = analyzer.calculate_supply_chain_risk_score()
+
+    assert list(frame.index) == list(assessment['component_risks'])
+    for comp_id, risk in assessment['component_risks'].items():
+        row = frame.loc[comp_id]
+        assert row['component_name'] == risk['component_name']
+        for column in ['base_risk', 'dependency_risk', 'vulnerability_risk']:
+            assert row[column] == risk[column]
+        assert row['compound_risk'] == pytest.approx(risk['compound_risk'])
+        assert row['risk_level'] == RiskAnalyzer._risk_level(risk['compound_risk'])
+
+    counts = frame['risk_level'].value_counts()
+    assert {level: int(counts[level]) for level in RiskAnalyzer.RISK_LEVELS} == assessment['risk_distribution']
+
+
+def test_frame_is_typed():
+    frame = RiskAnalyzer(create_sample_graph()).calculate_component_risk_frame()
+    assert frame.index.name == 'component_id'
+    assert isinstance(frame['risk_level'].dtype, pd.CategoricalDtype)
+    assert frame['risk_level'].cat.ordered
+    assert frame['base_risk'].dtype == 'int64'
+    assert frame['compound_risk'].dtype == 'float64'
+
+
+def test_export_uses_frame(tmp_path):
+    analyzer = RiskAnalyzer(create_sample_graph())
+    path = analyzer.export_metrics_to_csv(str(tmp_path / "metrics.csv"))
+    exported = pd.read_csv(path)
+    frame = analyzer.calculate_component_risk_frame()
+    assert list(exported['component_id']) == list(frame.index)
+    assert list(exported['compound_risk_score']) == pytest.approx(list(frame['compound_risk']))
+    assert list(exported['component_name']) == list(frame['component_name'])
@@ -0,0 +1,73 @@
+"""
+Tests for the graph version counter and RiskAnalyzer memoization.
+"""
+
+from datetime import datetime
+
+from supply_chain_analyzer.analyzers.risk_analyzer import RiskAnalyzer
+from supply_chain_analyzer.core.dependency_graph import (
+    SoftwareComponent, SoftwareType, Vulnerability, VulnerabilityLevel, create_sample_graph
+)
+
+
+def test_version_tracks_mutations_but_not_simulation_state():
+    graph = create_sample_graph()
+    version = graph.version
+
+    graph.simulate_attack_propagation("lodash:4.17.21", 10)
+    assert graph.version == version
+
+    graph.components["lodash:4.17.21"].criticality_score = 9.5
+    assert graph.version > version
+
+    version = graph.version
+    graph.add_component(SoftwareComponent("leftpad", "1.0", SoftwareType.LIBRARY))
+    graph.add_dependency("leftpad:1.0", "lodash:4.17.21")
+    assert graph.version > version
+
+
+def test_repeated_calls_hit_cache():
+    graph = create_sample_graph()
+    analyzer = RiskAnalyzer(graph)
+
+    first = analyzer.calculate_supply_chain_risk_score()
+    assert analyzer.calculate_supply_chain_risk_score() == first
+    analyzer.generate_risk_report()
+    info = analyzer.cache_info()
+    assert info['hits'] == 2
+    assert info['graph_version'] == graph.version
+
+    graph.add_vulnerability("redis:7.0.0", Vulnerability(
+        "CVE-2024-0001", VulnerabilityLevel.CRITICAL, "", ["7.0.0"], datetime(2024, 1, 1), True))
+    second = analyzer.calculate_supply_chain_risk_score()
+    assert second != first
+    assert second['component_risks']['redis:7.0.0']['vulnerability_risk'] == 10
+
+
+def test_edited_results_do_not_change_the_memo():
+    graph = create_sample_graph()
+    analyzer = RiskAnalyzer(graph)
+
+    first = analyzer.calculate_supply_chain_risk_score()
+    expected = analyzer.calculate_supply_chain_risk_score()
+    first['component_risks'].pop('redis:7.0.0')
+    first['report_notes'] = "edited"
+    analyzer.calculate_supply_chain_risk_score()['critical_paths'].clear()
+
+    assert analyzer.calculate_supply_chain_risk_score() == expected
+    assert analyzer.cache_hits == 3
+
+
+def test_attribute_edit_and_invalidate_recompute():
+    graph = create_sample_graph()
+    analyzer = RiskAnalyzer(graph)
+    analyzer.calculate_supply_chain_risk_score()
+
+    graph.components["redis:7.0.0"].criticality_score = 1.0
+    risks = analyzer.calculate_supply_chain_risk_score()['component_risks']
+    assert risks['redis:7.0.0']['criticality_risk'] == 1.0
+
+    misses = analyzer.cache_misses
+    analyzer.invalidate_cache()
+    analyzer.calculate_supply_chain_risk_score()
+    assert analyzer.cache_misses > misses
@@ -0,0 +1,100 @@
+"""
+Tests for binary graph snapshots.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from supply_chain_analyzer.core.dependency_graph import DependencyGraph, create_sample_graph
+from supply_chain_analyzer.core.output_manager import OutputManager
+from supply_chain_analyzer.core.snapshot import pack_strings, unpack_strings
+
+
+def _snapshot(graph):
+    return {
+        "name": graph.name,
+        "components": {comp_id: c._fields() for comp_id, c in graph.components.items()},
+        "edges": sorted((u, v, d["dependency_type"]) for u, v, d in graph.graph.edges(data=True)),
+        "vulnerabilities": {vuln_id: v for vuln_id, v in graph.vulnerabilities.items()}
+    }
+
+
+def test_pack_strings_round_trip():
+    values = ["", "lodash", "naïve", "名前", "a:b"]
+    assert unpack_strings(*pack_strings(values)) == values
+    assert unpack_strings(*pack_strings(["x", "yz"])) == ["x", "yz"]
+    assert unpack_strings(*pack_strings([])) == []
+
+
+@pytest.mark.parametrize("source_backend", ["networkx", "csr"])
+@pytest.mark.parametrize("backend", ["networkx", "csr"])
+def test_snapshot_round_trip(tmp_path, source_backend, backend):
+    graph = create_sample_graph()
+    if source_backend == "csr":
+        exported = str(tmp_path / "graph.json")
+        graph.export_to_json(filepath=exported)
+        graph = DependencyGraph.load_from_json(exported, backend="csr")
+
+    directory = graph.save_snapshot(str(tmp_path / "snapshot"))
+    loaded = DependencyGraph.load_snapshot(directory, backend=backend)
+
+    assert _snapshot(loaded) == _snapshot(graph)
+    component_id = next(iter(graph.components))
+    assert loaded.get_dependents(component_id) == graph.get_dependents(component_id)
+    assert loaded.get_max_severity(component_id) == graph.get_max_severity(component_id)
+
+
+def test_csr_snapshot_is_memory_mapped_and_still_editable(tmp_path):
+    graph = create_sample_graph()
+    loaded = DependencyGraph.load_snapshot(graph.save_snapshot(str(tmp_path / "snapshot")))
+
+    indptr, indices = loaded.graph.csr()
+    assert isinstance(indices, np.memmap)
+    assert not indices.flags.writeable
+
+    components = list(loaded.components)
+    edges = loaded.graph.number_of_edges()
+    loaded.add_dependency(components[0], components[-1], "transitive")
+    assert loaded.graph.number_of_edges() == edges + 1
+    assert loaded.graph.has_edge(components[-1], components[0])
+
+
+def test_load_rejects_incomplete_or_foreign_snapshots(tmp_path):
+    with pytest.raises(ValueError):
+        DependencyGraph.load_snapshot(str(tmp_path))
+
+    directory = create_sample_graph().save_snapshot(str(tmp_path / "snapshot"))
+    manifest_path = tmp_path / "snapshot" / "manifest.json"
+    manifest = json.loads(manifest_path.read_text())
+    manifest["version"] = 99
+    manifest_path.write_text(json.dumps(manifest))
+    with pytest.raises(ValueError, match="version"):
+        DependencyGraph.load_snapshot(directory)
+
+
+def test_interrupted_overwrite_is_not_loadable(tmp_path, monkeypatch):
+    directory = create_sample_graph().save_snapshot(str(tmp_path / "snapshot"))
+    writes = []
+
+    def failing_save(path, values):
+        writes.append(path)
+        if len(writes) > 2:
+            raise OSError("disk full")
+        with open(path, "wb") as f:
+            np.lib.format.write_array(f, values)
+
+    monkeypatch.setattr("supply_chain_analyzer.core.snapshot.np.save", failing_save)
+    with pytest.raises(OSError):
+        create_sample_graph().save_snapshot(directory)
+    with pytest.raises(ValueError, match="No graph snapshot"):
+        DependencyGraph.load_snapshot(directory)
+
+
+def test_output_manager_snapshot_location(tmp_path):
+    output_manager = OutputManager(str(tmp_path / "outputs"))
+    directory = create_sample_graph().save_snapshot(output_manager=output_manager, project_name="sample")
+
+    assert directory.startswith(str(tmp_path / "outputs" / "snapshots" / "sample_snapshot_"))
+    assert output_manager.get_output_summary()["output_directories"]["snapshots"] == 1
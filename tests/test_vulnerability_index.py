@@ -0,0 +1,76 @@
+"""
+Tests for the component-to-vulnerability index of DependencyGraph.
+"""
+
+from datetime import datetime
+
+from supply_chain_analyzer import RiskAnalyzer
+from supply_chain_analyzer.core.dependency_graph import (
+    DependencyGraph, SoftwareComponent, SoftwareType, Vulnerability, VulnerabilityLevel
+)
+
+
+def make_vulnerability(cve_id: str, severity: VulnerabilityLevel, exploit_probability: float) -> Vulnerability:
+    return Vulnerability(
+        cve_id=cve_id,
+        severity=severity,
+        description="test advisory",
+        affected_versions=[],
+        discovery_date=datetime(2024, 1, 1),
+        patch_available=True,
+        exploit_probability=exploit_probability
+    )
+
+
+def build_graph() -> DependencyGraph:
+    graph = DependencyGraph("Vulnerability Index")
+    graph.add_component(SoftwareComponent("six", "1.1", SoftwareType.LIBRARY))
+    graph.add_component(SoftwareComponent("six", "1.16", SoftwareType.LIBRARY))
+    graph.add_vulnerability("six:1.16", make_vulnerability("CVE-2024-0001", VulnerabilityLevel.HIGH, 0.4))
+    graph.add_vulnerability("six:1.16", make_vulnerability("CVE-2024-0002", VulnerabilityLevel.CRITICAL, 0.2))
+    return graph
+
+
+def test_index_does_not_false_match_prefix_versions():
+    graph = build_graph()
+
+    assert graph.get_component_vulnerabilities("six:1.1") == []
+    assert graph.get_max_severity("six:1.1") is None
+    assert len(graph.get_component_vulnerabilities("six:1.16")) == 2
+
+    risks = RiskAnalyzer(graph).calculate_supply_chain_risk_score()['component_risks']
+    assert risks["six:1.1"]['vulnerability_risk'] == 0
+    assert risks["six:1.16"]['vulnerability_risk'] == 10
+
+
+def test_severity_caches_track_maximum_and_replacement():
+    graph = build_graph()
+    assert graph.get_max_severity("six:1.16") == VulnerabilityLevel.CRITICAL
+    assert graph.get_max_exploit_probability("six:1.16") == 0.4
+
+    # Re-adding the same CVE replaces the advisory, as in graph.vulnerabilities
+    graph.add_vulnerability("six:1.16", make_vulnerability("CVE-2024-0002", VulnerabilityLevel.LOW, 0.1))
+    assert len(graph.get_component_vulnerabilities("six:1.16")) == 2
+    assert graph.get_max_severity("six:1.16") == VulnerabilityLevel.HIGH
+    assert graph.get_max_exploit_probability("six:1.16") == 0.4
+
+
+def test_assigning_vulnerabilities_rebuilds_the_index():
+    graph = build_graph()
+    analyzer = RiskAnalyzer(graph)
+    before = analyzer.calculate_supply_chain_risk_score()
+    version = graph.version
+
+    critical = make_vulnerability("CVE-2024-0009", VulnerabilityLevel.CRITICAL, 0.9)
+    graph.vulnerabilities = {"six:1.1:CVE-2024-0009": critical}
+
+    assert graph.get_component_vulnerabilities("six:1.1") == [critical]
+    assert graph.get_max_severity("six:1.1") == VulnerabilityLevel.CRITICAL
+    assert graph.get_max_exploit_probability("six:1.1") == 0.9
+    assert graph.get_component_vulnerabilities("six:1.16") == []
+    assert graph.get_max_severity("six:1.16") is None
+
+    assert graph.version != version
+    after = analyzer.calculate_supply_chain_risk_score()
+    assert after['component_risks'] == RiskAnalyzer(graph).calculate_supply_chain_risk_score()['component_risks']
+    assert after['component_risks'] != before['component_risks']